@@ -4,9 +4,12 @@ Apollo Client — Lightweight API wrapper for Apollo.io.
 Provides:
     - ApolloRateLimiter: Thread-safe fixed-window rate limiter (50 req/60s)
     - apollo_api_call(): Rate-limited wrapper for all Apollo API requests
+    - apollo_api_call_coalesced(): Single-flight variant for idempotent searches/lookups
+    - bulk_match_people(): Batched /people/bulk_match enrichment with per-person fallback
     - resolve_email_account(): Find the active sending email account
     - resolve_custom_field_ids(): Fetch custom field ID mapping
 """
+import json
 import logging
 import os
 import threading
@@ -55,6 +58,8 @@ class ApolloRateLimiter:
 
 rate_limiter = ApolloRateLimiter(max_requests=50, window_seconds=60.0)
 
+APOLLO_API_BASE = 'https://api.apollo.io'
+
 
 def apollo_api_call(method, url, **kwargs):
     """Rate-limited Apollo API call.
@@ -77,6 +82,11 @@ def apollo_api_call(method, url, **kwargs):
     if not apollo_key:
         raise RuntimeError('Apollo API key not configured (APOLLO_API_KEY)')
 
+    # Allow pointing at a staging/fake Apollo (tests, load runs)
+    base_override = os.environ.get('APOLLO_API_BASE_URL', '').rstrip('/')
+    if base_override and url.startswith(APOLLO_API_BASE):
+        url = base_override + url[len(APOLLO_API_BASE):]
+
     headers = kwargs.pop('headers', {})
     headers.setdefault('X-Api-Key', apollo_key)
     headers.setdefault('Content-Type', 'application/json')
@@ -111,6 +121,135 @@ def apollo_api_call(method, url, **kwargs):
     return resp
 
 
+class _InFlightCall:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesce identical concurrent calls: one caller runs, the rest share its result.
+
+    Only calls that overlap in time are merged — nothing is cached after the
+    leader finishes, so a later identical request always hits Apollo again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _InFlightCall()
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        return call.result
+
+
+_apollo_inflight = SingleFlight()
+
+
+def apollo_api_call_coalesced(method, url, **kwargs):
+    """apollo_api_call() with in-flight request coalescing.
+
+    Use for idempotent Apollo reads (people search, people/match). Concurrent
+    calls with the same method, URL, JSON body and params share one upstream
+    request and one rate-limit slot; every caller receives the same Response.
+    """
+    key = (
+        method.lower(),
+        url,
+        json.dumps(kwargs.get('json'), sort_keys=True, default=str),
+        json.dumps(kwargs.get('params'), sort_keys=True, default=str),
+    )
+    return _apollo_inflight.do(key, lambda: apollo_api_call(method, url, **kwargs))
+
+
+BULK_MATCH_MAX = 10  # Apollo /people/bulk_match accepts at most 10 details per call
+
+
+def _match_person(person_id, reveal_personal_emails=False):
+    """Single /people/match lookup. Returns the person dict, or None on a non-200."""
+    resp = apollo_api_call_coalesced('post', 'https://api.apollo.io/api/v1/people/match', json={
+        'id': person_id,
+        'reveal_personal_emails': reveal_personal_emails,
+    })
+    if resp.status_code != 200:
+        logger.warning(f"Apollo people/match returned {resp.status_code} for {person_id}")
+        return None
+    return resp.json().get('person') or None
+
+
+def bulk_match_people(person_ids, reveal_personal_emails=False):
+    """Enrich Apollo people by id, up to BULK_MATCH_MAX per request.
+
+    Returns {person_id: person dict or None}. If a bulk request fails (e.g.
+    the plan lacks bulk access), that chunk falls back to one /people/match
+    call per id. RuntimeError (rate-limit timeout, missing key) propagates.
+    """
+    ids = list(dict.fromkeys(pid for pid in person_ids if pid))
+    results = {}
+    for start in range(0, len(ids), BULK_MATCH_MAX):
+        chunk = ids[start:start + BULK_MATCH_MAX]
+        resp = None
+        try:
+            resp = apollo_api_call_coalesced('post', 'https://api.apollo.io/api/v1/people/bulk_match', json={
+                'details': [{'id': pid} for pid in chunk],
+                'reveal_personal_emails': reveal_personal_emails,
+            })
+        except RuntimeError:
+            raise
+        except Exception as e:
+            logger.warning(f"Apollo people/bulk_match error, falling back to per-person match: {e}")
+
+        if resp is not None and resp.status_code == 200:
+            matches = resp.json().get('matches') or []
+            by_id = {m.get('id'): m for m in matches if m}
+            for i, pid in enumerate(chunk):
+                person = by_id.get(pid)
+                if person is None and i < len(matches) and matches[i] and not matches[i].get('id'):
+                    person = matches[i]
+                results[pid] = person
+            continue
+
+        if resp is not None:
+            logger.warning(f"Apollo people/bulk_match returned {resp.status_code}; "
+                           f"falling back to per-person match for {len(chunk)} ids")
+        for pid in chunk:
+            try:
+                results[pid] = _match_person(pid, reveal_personal_emails)
+            except RuntimeError:
+                raise
+            except Exception as e:
+                logger.warning(f"Apollo people/match error for {pid}: {e}")
+                results[pid] = None
+    return results
+
+
 def resolve_email_account():
     """Resolve the Apollo sending email account ID.
 
@@ -11,7 +11,7 @@ import time
 import os
 import threading
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
 from datetime import datetime
 from flask import (
@@ -43,11 +43,11 @@ from database import (
     replace_campaign_personas,
     # Enrollment
     create_enrollment_batch, get_enrollment_batch, update_enrollment_batch,
+    get_enrollment_account_context,
+    EnrollmentProgressWriter,
     get_enrollment_contacts, get_enrollment_batch_summary,
     get_next_contacts_for_phase,
     bulk_create_enrollment_contacts, update_enrollment_contact,
-    # Scorecard (for enrollment enrichment)
-    get_scorecard_score,
     # Signals
     get_signals_by_company,
 )
@@ -1173,12 +1173,14 @@ def api_campaign_suggest_personas(campaign_id):
 
 import threading as _threading
 
-_enrollment_counter_lock = threading.Lock()
+# Batch progress (counters + current_phase) is written at most this often
+_ENROLLMENT_PROGRESS_FLUSH_MS = 500
 
 
 class _RateLimiter:
     """Simple token-bucket rate limiter for API calls."""
     def __init__(self, max_per_minute=50):
+        self.max_per_minute = max_per_minute
         self.interval = 60.0 / max_per_minute
         self.last_call = 0
         self._lock = _threading.Lock()
@@ -1196,6 +1198,11 @@ class _RateLimiter:
 _apollo_limiter = _RateLimiter(max_per_minute=50)
 _openai_limiter = _RateLimiter(max_per_minute=30)
 
+# Concurrent email generation: enough in-flight LLM calls to keep the limiter
+# saturated (~10s per completion), never more than the limiter can admit.
+_EMAIL_GEN_LATENCY_SECONDS = 10
+_EMAIL_GEN_WORKERS = max(1, min(8, _openai_limiter.max_per_minute * _EMAIL_GEN_LATENCY_SECONDS // 60))
+
 
 def _derive_domain(website: str, company_name: str = '') -> str:
     """Derive a domain from a website URL or company name."""
@@ -1258,92 +1265,93 @@ def _discovery_worker(batch_id: int):
         seen_emails = set()
         contacts_to_insert = []
         total_discovered = 0
-
-        for i, acct in enumerate(accounts):
-            domain = _derive_domain(acct.get('website', ''), acct.get('company_name', ''))
-            update_enrollment_batch(batch_id,
-                current_phase=f'Discovering at {acct["company_name"]} ({i+1}/{len(accounts)})...')
-            acct_contacts = 0
-
-            for persona in personas:
-                if acct_contacts >= contact_cap:
-                    break
-                titles = persona.get('titles', [])
-                seniorities = persona.get('seniorities', [])
-                if not titles and not seniorities:
-                    continue
-
-                _apollo_limiter.wait()
-                try:
-                    search_payload = {
-                        'q_organization_domains_list': [domain],
-                        'per_page': 25,
-                        'page': 1
-                    }
-                    if titles:
-                        search_payload['person_titles'] = titles
-                    if seniorities:
-                        search_payload['person_seniorities'] = seniorities
-                    if verified_only:
-                        search_payload['email_status'] = ['verified']
-
-                    resp = req.post(
-                        'https://api.apollo.io/api/v1/mixed_people/api_search',
-                        json=search_payload,
-                        headers=apollo_headers,
-                        timeout=15
-                    )
-                    if resp.status_code != 200:
-                        app.logger.warning(f'Apollo People Search failed for {domain}: {resp.status_code}')
+        progress = EnrollmentProgressWriter(batch_id, interval_ms=_ENROLLMENT_PROGRESS_FLUSH_MS)
+
+        with progress:
+            for i, acct in enumerate(accounts):
+                domain = _derive_domain(acct.get('website', ''), acct.get('company_name', ''))
+                progress.set_phase(f'Discovering at {acct["company_name"]} ({i+1}/{len(accounts)})...')
+                acct_contacts = 0
+
+                for persona in personas:
+                    if acct_contacts >= contact_cap:
+                        break
+                    titles = persona.get('titles', [])
+                    seniorities = persona.get('seniorities', [])
+                    if not titles and not seniorities:
                         continue
 
-                    data = resp.json()
-                    people = data.get('people', [])
-
-                    for person in people:
-                        if acct_contacts >= contact_cap:
-                            break
-                        email = (person.get('email') or '').lower().strip()
-                        if not email or email in seen_emails:
+                    _apollo_limiter.wait()
+                    try:
+                        search_payload = {
+                            'q_organization_domains_list': [domain],
+                            'per_page': 25,
+                            'page': 1
+                        }
+                        if titles:
+                            search_payload['person_titles'] = titles
+                        if seniorities:
+                            search_payload['person_seniorities'] = seniorities
+                        if verified_only:
+                            search_payload['email_status'] = ['verified']
+
+                        resp = req.post(
+                            'https://api.apollo.io/api/v1/mixed_people/api_search',
+                            json=search_payload,
+                            headers=apollo_headers,
+                            timeout=15
+                        )
+                        if resp.status_code != 200:
+                            app.logger.warning(f'Apollo People Search failed for {domain}: {resp.status_code}')
                             continue
-                        seen_emails.add(email)
-                        acct_contacts += 1
-
-                        contacts_to_insert.append({
-                            'batch_id': batch_id,
-                            'account_id': acct['id'],
-                            'company_name': acct['company_name'],
-                            'company_domain': domain,
-                            'persona_name': persona.get('persona_name', 'Default'),
-                            'sequence_id': persona.get('sequence_id', ''),
-                            'sequence_name': persona.get('sequence_name', ''),
-                            'apollo_person_id': person.get('id', ''),
-                            'first_name': person.get('first_name', ''),
-                            'last_name': person.get('last_name', ''),
-                            'email': email,
-                            'title': person.get('title', ''),
-                            'seniority': person.get('seniority', ''),
-                            'linkedin_url': person.get('linkedin_url', ''),
-                            'status': 'discovered'
-                        })
-                        total_discovered += 1
-
-                except Exception as e:
-                    app.logger.warning(f'Discovery error for {domain}/{persona.get("persona_name")}: {e}')
-
-            if len(contacts_to_insert) >= 50:
-                bulk_create_enrollment_contacts(contacts_to_insert)
-                contacts_to_insert.clear()
-                update_enrollment_batch(batch_id, discovered=total_discovered,
-                                         total_contacts=total_discovered)
-
-        if contacts_to_insert:
-            bulk_create_enrollment_contacts(contacts_to_insert)
+
+                        data = resp.json()
+                        people = data.get('people', [])
+
+                        for person in people:
+                            if acct_contacts >= contact_cap:
+                                break
+                            email = (person.get('email') or '').lower().strip()
+                            if not email or email in seen_emails:
+                                continue
+                            seen_emails.add(email)
+                            acct_contacts += 1
+
+                            contacts_to_insert.append({
+                                'batch_id': batch_id,
+                                'account_id': acct['id'],
+                                'company_name': acct['company_name'],
+                                'company_domain': domain,
+                                'persona_name': persona.get('persona_name', 'Default'),
+                                'sequence_id': persona.get('sequence_id', ''),
+                                'sequence_name': persona.get('sequence_name', ''),
+                                'apollo_person_id': person.get('id', ''),
+                                'first_name': person.get('first_name', ''),
+                                'last_name': person.get('last_name', ''),
+                                'email': email,
+                                'title': person.get('title', ''),
+                                'seniority': person.get('seniority', ''),
+                                'linkedin_url': person.get('linkedin_url', ''),
+                                'status': 'discovered'
+                            })
+
+                    except Exception as e:
+                        app.logger.warning(f'Discovery error for {domain}/{persona.get("persona_name")}: {e}')
+
+                if len(contacts_to_insert) >= 50:
+                    # Contacts already enrolled elsewhere are skipped by the unique index
+                    saved = bulk_create_enrollment_contacts(contacts_to_insert)
+                    total_discovered += saved
+                    progress.add(discovered=saved, total_contacts=saved)
+                    contacts_to_insert.clear()
+
+            if contacts_to_insert:
+                saved = bulk_create_enrollment_contacts(contacts_to_insert)
+                total_discovered += saved
+                progress.add(discovered=saved, total_contacts=saved)
 
         update_enrollment_batch(batch_id,
             status='discovered',
-            discovered=total_discovered,
-            total_contacts=total_discovered,
             current_phase=f'Discovery complete — {total_discovered} contacts found')
 
     except Exception as e:
@@ -1351,6 +1359,61 @@ def _discovery_worker(batch_id: int):
         update_enrollment_batch(batch_id, status='failed', error_message=str(e)[:500])
 
 
+def _generate_contact_emails(openai_client, campaign: dict, contact: dict, account_data: dict) -> dict:
+    """Generate the 4-email sequence for one enrollment contact (thread-safe)."""
+    systems_raw = account_data.get('systems_json', '{}')
+    try:
+        systems = json.loads(systems_raw) if systems_raw else {}
+    except (json.JSONDecodeError, TypeError):
+        systems = {}
+    active_systems = [k for k, v in systems.items() if v]
+
+    bdr_prompt = campaign.get('prompt', '').strip()
+    prompt = f"""You are a BDR at Phrase, a localization/internationalization platform. Write a personalized cold outreach sequence.
+
+Account info:
+- Company: {contact['company_name']}
+- Annual Revenue: {account_data.get('annual_revenue', 'unknown')}
+- Cohort: {account_data.get('cohort', 'B')} ({'Enterprise $1.5B+' if account_data.get('cohort') == 'A' else 'Mid-Market'})
+- Languages/Locales detected: {account_data.get('locale_count', 0)}
+- Systems in use: {', '.join(active_systems) if active_systems else 'unknown'}
+- Evidence: {(account_data.get('evidence_summary', '') or '')[:300]}
+
+Contact info:
+- Name: {contact.get('first_name', '')} {contact.get('last_name', '')}
+- Title: {contact.get('title', 'unknown')}
+- Seniority: {contact.get('seniority', 'unknown')}
+- Persona: {contact.get('persona_name', 'Default')}
+
+{('Campaign Instructions: ' + bdr_prompt) if bdr_prompt else ''}
+
+Write a 4-email cold outreach sequence targeting {contact.get('first_name', 'this person')} specifically. Reference their title/role and their company's signals.
+
+Structure: subject_1 (thread 1) + subject_2 (thread 2) + email_1 + email_2 + email_3 + email_4
+
+Rules:
+- Reference the company by name and real signals (revenue tier, locale count, systems)
+- Personalize to their specific role ({contact.get('title', 'their role')})
+- Each email body: concise, value-driven, 3-4 sentences max
+- End each email with a simple CTA
+- No fluff. Sound like a human.
+- Use \\n for line breaks in email bodies
+
+Return ONLY valid JSON: {{"subject_1": "...", "subject_2": "...", "email_1": "...", "email_2": "...", "email_3": "...", "email_4": "..."}}"""
+
+    _openai_limiter.wait()
+    response = openai_client.chat.completions.create(
+        model="gpt-5-mini",
+        messages=[
+            {"role": "system", "content": "You are a BDR at Phrase. Write diverse, natural emails. Return ONLY valid JSON."},
+            {"role": "user", "content": prompt}
+        ],
+        response_format={"type": "json_object"},
+        max_completion_tokens=4096
+    )
+    return json.loads(response.choices[0].message.content)
+
+
 def _enrollment_pipeline_worker(batch_id: int):
     """Background worker: generate emails then enroll contacts into Apollo sequences."""
     import requests as req
@@ -1384,97 +1447,48 @@ def _enrollment_pipeline_worker(batch_id: int):
                                 started_at=datetime.now().isoformat())
 
         generated_count = 0
-        while True:
-            contacts = get_next_contacts_for_phase(batch_id, 'discovered', limit=10)
-            if not contacts:
-                break
-            b = get_enrollment_batch(batch_id)
-            if b and b.get('status') == 'cancelled':
-                return
-
-            for contact in contacts:
-                try:
-                    account_data = {}
-                    if contact.get('account_id'):
-                        score = get_scorecard_score(contact['account_id'])
-                        if score:
-                            account_data = score
-                        acct_info = get_account_by_company(contact['company_name'])
-                        if acct_info:
-                            account_data['evidence_summary'] = acct_info.get('evidence_summary', '')
-
-                    systems_raw = account_data.get('systems_json', '{}')
+        account_context = {}
+        progress = EnrollmentProgressWriter(batch_id, interval_ms=_ENROLLMENT_PROGRESS_FLUSH_MS)
+        with ThreadPoolExecutor(max_workers=_EMAIL_GEN_WORKERS) as pool, progress:
+            while True:
+                contacts = get_next_contacts_for_phase(batch_id, 'discovered',
+                                                       limit=_EMAIL_GEN_WORKERS * 4)
+                if not contacts:
+                    break
+                b = get_enrollment_batch(batch_id)
+                if b and b.get('status') == 'cancelled':
+                    return
+                total = (b or {}).get('total_contacts', 0)
+
+                # Prefetch scorecard/evidence once per account instead of per contact
+                missing = {c['account_id'] for c in contacts
+                           if c.get('account_id') and c['account_id'] not in account_context}
+                if missing:
+                    fetched = get_enrollment_account_context(list(missing))
+                    for account_id in missing:
+                        account_context[account_id] = fetched.get(account_id, {})
+
+                futures = {
+                    pool.submit(_generate_contact_emails, openai_client, campaign, contact,
+                                dict(account_context.get(contact.get('account_id'), {}))): contact
+                    for contact in contacts
+                }
+                for future in as_completed(futures):
+                    contact = futures[future]
                     try:
-                        systems = json.loads(systems_raw) if systems_raw else {}
-                    except (json.JSONDecodeError, TypeError):
-                        systems = {}
-                    active_systems = [k for k, v in systems.items() if v]
-
-                    bdr_prompt = campaign.get('prompt', '').strip()
-                    prompt = f"""You are a BDR at Phrase, a localization/internationalization platform. Write a personalized cold outreach sequence.
-
-Account info:
-- Company: {contact['company_name']}
-- Annual Revenue: {account_data.get('annual_revenue', 'unknown')}
-- Cohort: {account_data.get('cohort', 'B')} ({'Enterprise $1.5B+' if account_data.get('cohort') == 'A' else 'Mid-Market'})
-- Languages/Locales detected: {account_data.get('locale_count', 0)}
-- Systems in use: {', '.join(active_systems) if active_systems else 'unknown'}
-- Evidence: {(account_data.get('evidence_summary', '') or '')[:300]}
-
-Contact info:
-- Name: {contact.get('first_name', '')} {contact.get('last_name', '')}
-- Title: {contact.get('title', 'unknown')}
-- Seniority: {contact.get('seniority', 'unknown')}
-- Persona: {contact.get('persona_name', 'Default')}
-
-{('Campaign Instructions: ' + bdr_prompt) if bdr_prompt else ''}
-
-Write a 4-email cold outreach sequence targeting {contact.get('first_name', 'this person')} specifically. Reference their title/role and their company's signals.
-
-Structure: subject_1 (thread 1) + subject_2 (thread 2) + email_1 + email_2 + email_3 + email_4
-
-Rules:
-- Reference the company by name and real signals (revenue tier, locale count, systems)
-- Personalize to their specific role ({contact.get('title', 'their role')})
-- Each email body: concise, value-driven, 3-4 sentences max
-- End each email with a simple CTA
-- No fluff. Sound like a human.
-- Use \\n for line breaks in email bodies
-
-Return ONLY valid JSON: {{"subject_1": "...", "subject_2": "...", "email_1": "...", "email_2": "...", "email_3": "...", "email_4": "..."}}"""
-
-                    _openai_limiter.wait()
-                    response = openai_client.chat.completions.create(
-                        model="gpt-5-mini",
-                        messages=[
-                            {"role": "system", "content": "You are a BDR at Phrase. Write diverse, natural emails. Return ONLY valid JSON."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        response_format={"type": "json_object"},
-                        max_completion_tokens=4096
-                    )
-                    email_data = json.loads(response.choices[0].message.content)
-                    update_enrollment_contact(contact['id'],
-                        generated_emails_json=json.dumps(email_data),
-                        status='email_generated')
-                    generated_count += 1
-
-                except Exception as e:
-                    app.logger.warning(f'Email gen error for contact {contact["id"]}: {e}')
-                    update_enrollment_contact(contact['id'],
-                        status='failed',
-                        error_message=f'Email generation failed: {str(e)[:300]}')
-                    # NOTE: Race condition — concurrent workers could read stale 'failed' count.
-                    # Using a lock to protect the read-modify-write sequence.
-                    with _enrollment_counter_lock:
-                        batch = get_enrollment_batch(batch_id)
-                        update_enrollment_batch(batch_id, failed=(batch or {}).get('failed', 0) + 1)
-
-                batch = get_enrollment_batch(batch_id)
-                total = (batch or {}).get('total_contacts', 0)
-                update_enrollment_batch(batch_id,
-                    generated=generated_count,
-                    current_phase=f'Generating emails ({generated_count}/{total})...')
+                        email_data = future.result()
+                        update_enrollment_contact(contact['id'],
+                            generated_emails_json=json.dumps(email_data),
+                            status='email_generated')
+                        generated_count += 1
+                        progress.add(generated=1)
+                    except Exception as e:
+                        app.logger.warning(f'Email gen error for contact {contact["id"]}: {e}')
+                        update_enrollment_contact(contact['id'],
+                            status='failed',
+                            error_message=f'Email generation failed: {str(e)[:300]}')
+                        progress.add(failed=1)
+                    progress.set_phase(f'Generating emails ({generated_count}/{total})...')
 
         # ===== PHASE 2: Apollo Enrollment =====
         update_enrollment_batch(batch_id, status='enrolling')
@@ -1532,120 +1546,115 @@ Return ONLY valid JSON: {{"subject_1": "...", "subject_2": "...", "email_1": "..
             return
 
         enrolled_count = 0
-        # NOTE: Race condition — protect initial read of 'failed' counter.
-        with _enrollment_counter_lock:
-            failed_count = (get_enrollment_batch(batch_id) or {}).get('failed', 0)
-
-        while True:
-            contacts = get_next_contacts_for_phase(batch_id, 'email_generated', limit=10)
-            if not contacts:
-                break
-            b = get_enrollment_batch(batch_id)
-            if b and b.get('status') == 'cancelled':
-                return
-
-            for contact in contacts:
-                try:
-                    email_data = json.loads(contact.get('generated_emails_json') or '{}')
-
-                    typed_fields = {}
-
-                    def _html(text):
-                        if not text:
-                            return text
-                        return text.replace('\n\n', '<br><br>').replace('\n', '<br>')
-
-                    for field_name, field_key in [
-                        ('subject_1', 'personalized_subject_1'),
-                        ('subject_2', 'personalized_subject_2'),
-                        ('email_1', 'personalized_email_1'),
-                        ('email_2', 'personalized_email_2'),
-                        ('email_3', 'personalized_email_3'),
-                        ('email_4', 'personalized_email_4'),
-                    ]:
-                        val = email_data.get(field_name, '')
-                        fid = custom_field_map.get(field_key, '')
-                        if val and fid:
-                            typed_fields[fid] = _html(val) if 'email' in field_name else val
+        progress = EnrollmentProgressWriter(batch_id, interval_ms=_ENROLLMENT_PROGRESS_FLUSH_MS)
 
-                    _apollo_limiter.wait()
-                    search_resp = req.post(
-                        'https://api.apollo.io/api/v1/contacts/search',
-                        json={'q_keywords': contact['email'], 'per_page': 1},
-                        headers=apollo_headers, timeout=15
-                    )
-                    existing_contact = None
-                    if search_resp.status_code == 200:
-                        contacts_found = search_resp.json().get('contacts', [])
-                        if contacts_found:
-                            existing_contact = contacts_found[0]
+        with progress:
+            while True:
+                contacts = get_next_contacts_for_phase(batch_id, 'email_generated', limit=10)
+                if not contacts:
+                    break
+                b = get_enrollment_batch(batch_id)
+                if b and b.get('status') == 'cancelled':
+                    return
+                total = (b or {}).get('total_contacts', 0)
 
-                    _apollo_limiter.wait()
-                    if existing_contact:
-                        apollo_contact_id = existing_contact['id']
-                        req.put(
-                            f'https://api.apollo.io/api/v1/contacts/{apollo_contact_id}',
-                            json={'typed_custom_fields': typed_fields},
+                for contact in contacts:
+                    try:
+                        email_data = json.loads(contact.get('generated_emails_json') or '{}')
+
+                        typed_fields = {}
+
+                        def _html(text):
+                            if not text:
+                                return text
+                            return text.replace('\n\n', '<br><br>').replace('\n', '<br>')
+
+                        for field_name, field_key in [
+                            ('subject_1', 'personalized_subject_1'),
+                            ('subject_2', 'personalized_subject_2'),
+                            ('email_1', 'personalized_email_1'),
+                            ('email_2', 'personalized_email_2'),
+                            ('email_3', 'personalized_email_3'),
+                            ('email_4', 'personalized_email_4'),
+                        ]:
+                            val = email_data.get(field_name, '')
+                            fid = custom_field_map.get(field_key, '')
+                            if val and fid:
+                                typed_fields[fid] = _html(val) if 'email' in field_name else val
+
+                        _apollo_limiter.wait()
+                        search_resp = req.post(
+                            'https://api.apollo.io/api/v1/contacts/search',
+                            json={'q_keywords': contact['email'], 'per_page': 1},
                             headers=apollo_headers, timeout=15
                         )
-                    else:
-                        create_payload = {
-                            'first_name': contact.get('first_name', ''),
-                            'last_name': contact.get('last_name', ''),
-                            'email': contact['email'],
-                            'organization_name': contact['company_name'],
-                            'typed_custom_fields': typed_fields,
-                            'run_dedupe': True
-                        }
-                        create_resp = req.post(
-                            'https://api.apollo.io/api/v1/contacts',
-                            json=create_payload,
+                        existing_contact = None
+                        if search_resp.status_code == 200:
+                            contacts_found = search_resp.json().get('contacts', [])
+                            if contacts_found:
+                                existing_contact = contacts_found[0]
+
+                        _apollo_limiter.wait()
+                        if existing_contact:
+                            apollo_contact_id = existing_contact['id']
+                            req.put(
+                                f'https://api.apollo.io/api/v1/contacts/{apollo_contact_id}',
+                                json={'typed_custom_fields': typed_fields},
+                                headers=apollo_headers, timeout=15
+                            )
+                        else:
+                            create_payload = {
+                                'first_name': contact.get('first_name', ''),
+                                'last_name': contact.get('last_name', ''),
+                                'email': contact['email'],
+                                'organization_name': contact['company_name'],
+                                'typed_custom_fields': typed_fields,
+                                'run_dedupe': True
+                            }
+                            create_resp = req.post(
+                                'https://api.apollo.io/api/v1/contacts',
+                                json=create_payload,
+                                headers=apollo_headers, timeout=15
+                            )
+                            if create_resp.status_code in (200, 201):
+                                apollo_contact_id = create_resp.json().get('contact', {}).get('id', '')
+                            else:
+                                raise Exception(f'Contact creation failed: {create_resp.status_code}')
+
+                        _apollo_limiter.wait()
+                        seq_id = contact.get('sequence_id', '')
+                        enroll_resp = req.post(
+                            f'https://api.apollo.io/api/v1/emailer_campaigns/{seq_id}/add_contact_ids',
+                            json={
+                                'emailer_campaign_id': seq_id,
+                                'contact_ids': [apollo_contact_id],
+                                'send_email_from_email_account_id': email_account_id
+                            },
                             headers=apollo_headers, timeout=15
                         )
-                        if create_resp.status_code in (200, 201):
-                            apollo_contact_id = create_resp.json().get('contact', {}).get('id', '')
-                        else:
-                            raise Exception(f'Contact creation failed: {create_resp.status_code}')
-
-                    _apollo_limiter.wait()
-                    seq_id = contact.get('sequence_id', '')
-                    enroll_resp = req.post(
-                        f'https://api.apollo.io/api/v1/emailer_campaigns/{seq_id}/add_contact_ids',
-                        json={
-                            'emailer_campaign_id': seq_id,
-                            'contact_ids': [apollo_contact_id],
-                            'send_email_from_email_account_id': email_account_id
-                        },
-                        headers=apollo_headers, timeout=15
-                    )
-                    if enroll_resp.status_code not in (200, 201):
-                        raise Exception(f'Enrollment failed: {enroll_resp.status_code} - {enroll_resp.text[:200]}')
-
-                    update_enrollment_contact(contact['id'],
-                        status='enrolled',
-                        apollo_contact_id=apollo_contact_id,
-                        enrolled_at=datetime.now().isoformat())
-                    enrolled_count += 1
-
-                except Exception as e:
-                    app.logger.warning(f'Enrollment error for contact {contact["id"]}: {e}')
-                    update_enrollment_contact(contact['id'],
-                        status='failed',
-                        error_message=str(e)[:500])
-                    failed_count += 1
-
-                batch = get_enrollment_batch(batch_id)
-                total = (batch or {}).get('total_contacts', 0)
-                update_enrollment_batch(batch_id,
-                    enrolled=enrolled_count,
-                    failed=failed_count,
-                    current_phase=f'Enrolling ({enrolled_count}/{total})...')
-
+                        if enroll_resp.status_code not in (200, 201):
+                            raise Exception(f'Enrollment failed: {enroll_resp.status_code} - {enroll_resp.text[:200]}')
+
+                        update_enrollment_contact(contact['id'],
+                            status='enrolled',
+                            apollo_contact_id=apollo_contact_id,
+                            enrolled_at=datetime.now().isoformat())
+                        enrolled_count += 1
+                        progress.add(enrolled=1)
+
+                    except Exception as e:
+                        app.logger.warning(f'Enrollment error for contact {contact["id"]}: {e}')
+                        update_enrollment_contact(contact['id'],
+                            status='failed',
+                            error_message=str(e)[:500])
+                        progress.add(failed=1)
+
+                    progress.set_phase(f'Enrolling ({enrolled_count}/{total})...')
+
+        batch = get_enrollment_batch(batch_id) or {}
         update_enrollment_batch(batch_id,
             status='completed',
-            enrolled=enrolled_count,
-            failed=failed_count,
-            current_phase=f'Complete — {enrolled_count} enrolled, {failed_count} failed',
+            current_phase=f'Complete — {batch.get("enrolled", 0)} enrolled, {batch.get("failed", 0)} failed',
             completed_at=datetime.now().isoformat())
 
     except Exception as e:
@@ -2344,6 +2353,7 @@ def api_accounts_datatable():
     length = request.args.get('length', 50, type=int) or 50
     length = min(max(length, 1), 500)
     search_value = (request.args.get('search[value]', '') or '').strip()
+    rank_query = (request.args.get('q', '') or '').strip() or None
     order_column = max(request.args.get('order[0][column]', 0, type=int) or 0, 0)
     order_dir = request.args.get('order[0][dir]', 'asc') or 'asc'
     valid_sort, normalized_sort_dir = validate_sort_direction(order_dir)
@@ -2368,6 +2378,7 @@ def api_accounts_datatable():
         last_scanned_filter=last_scanned_filter,
         revenue_min=revenue_min,
         revenue_max=revenue_max,
+        q=rank_query,
     )
     for account in payload.get('data', []):
         account['scan_status'] = account.get('scan_status') or SCAN_STATUS_IDLE
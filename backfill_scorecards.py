@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+One-time backfill: project scoring_v2 fields into the reports scorecard columns.
+
+Reports saved before the org_maturity_level / org_intent_score / ... columns
+existed only carry the scorecard inside the scan_data blob. This script
+parses each such report once and writes the columns, so the workspace and
+re-tiering paths can read them without loading scan_data.
+
+Safe to re-run: only reports with scorecard_extracted = 0 are touched.
+
+Usage:
+    python backfill_scorecards.py                  # Default batch size (200)
+    python backfill_scorecards.py --batch-size 50  # Smaller transactions
+"""
+import sys
+from database import backfill_report_scorecards, init_db
+
+
+if __name__ == '__main__':
+    batch_size = 200
+    if '--batch-size' in sys.argv:
+        batch_size = int(sys.argv[sys.argv.index('--batch-size') + 1])
+    init_db()
+    count = backfill_report_scorecards(batch_size=batch_size)
+    print(f"Done — backfilled scorecard columns for {count} reports.")
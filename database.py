@@ -3,12 +3,17 @@ import re
 Database module for storing Lead Machine reports.
 Supports SQLite (default/local) and PostgreSQL (when DATABASE_URL is set).
 """
+import atexit
 import json
 import logging
+import multiprocessing
 import os
+import queue
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from config import Config
 # signal_verifier removed — signals are now generated externally
@@ -139,6 +144,132 @@ def _adapt_date(interval: str) -> str:
     return f"(CURRENT_DATE - INTERVAL '{pg_interval}')::date"
 
 
+def _json_path_sql(column: str, *path: str) -> str:
+    """Build an expression selecting the JSON value at ``path`` inside ``column``.
+
+    Malformed JSON yields NULL on SQLite instead of failing the query.
+    """
+    if _USE_POSTGRES:
+        return f"({column} #> '{{{','.join(path)}}}')"
+    return (f"(CASE WHEN json_valid({column}) "
+            f"THEN json_extract({column}, '$.{'.'.join(path)}') END)")
+
+
+# Full-text search. SQLite keeps an FTS5 table per index (rowid = entity id)
+# in sync with triggers; Postgres keeps a weighted search_vector tsvector
+# column with a GIN index on the entity table itself.
+_SEARCH_INDEXES = {
+    # index: (FTS5 table, entity table, FTS5 rank expression — lower is better)
+    'accounts': ('account_fts', 'monitored_accounts', 'bm25(account_fts, 4.0, 2.0)'),
+    'signals': ('signal_fts', 'intent_signals', 'bm25(signal_fts, 4.0, 2.0, 1.0, 1.0)'),
+}
+_SEARCH_MAX_TERMS = 16
+
+
+def _search_match_query(text: Optional[str]) -> Optional[str]:
+    """Turn free text into a prefix-match query for the active dialect.
+
+    Every word must match (as a prefix). Punctuation is dropped, so user
+    input can never produce a syntax error. Returns None if no words remain.
+    """
+    terms = re.findall(r'[^\W_]+', (text or '').lower())[:_SEARCH_MAX_TERMS]
+    if not terms:
+        return None
+    if _USE_POSTGRES:
+        return ' & '.join(f"{t}:*" for t in terms)
+    return ' '.join(f'"{t}"*' for t in terms)
+
+
+def _search_join_sql(index: str, alias: str, key_column: str) -> str:
+    """JOIN restricting rows to search hits, exposing ``{alias}.search_rank``.
+
+    Bind the _search_match_query() string to the single placeholder. Order
+    by ``{alias}.search_rank ASC`` for best matches first.
+    """
+    fts_table, table, rank = _SEARCH_INDEXES[index]
+    if _USE_POSTGRES:
+        hits = (f"SELECT id AS doc_id, -ts_rank(search_vector, q) AS search_rank "
+                f"FROM {table}, to_tsquery('simple', ?) q WHERE search_vector @@ q")
+    else:
+        hits = f"SELECT rowid AS doc_id, {rank} AS search_rank FROM {fts_table} WHERE {fts_table} MATCH ?"
+    return f"JOIN ({hits}) {alias} ON {alias}.doc_id = {key_column}"
+
+
+def _search_filter_sql(index: str, key_column: str) -> str:
+    """WHERE predicate keeping only search hits, without changing the sort.
+
+    Bind the _search_match_query() string to the single placeholder.
+    """
+    fts_table, table, _ = _SEARCH_INDEXES[index]
+    if _USE_POSTGRES:
+        return f"{key_column} IN (SELECT id FROM {table} WHERE search_vector @@ to_tsquery('simple', ?))"
+    return f"{key_column} IN (SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH ?)"
+
+
+_SQLITE_ACCOUNT_SEARCH_DDL = (
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS account_fts USING fts5(
+        company_name, github_org,
+        tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+    )
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_account_fts_insert
+    AFTER INSERT ON monitored_accounts
+    BEGIN
+        INSERT INTO account_fts (rowid, company_name, github_org)
+        VALUES (NEW.id, NEW.company_name, NEW.github_org);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_account_fts_update
+    AFTER UPDATE OF company_name, github_org ON monitored_accounts
+    BEGIN
+        UPDATE account_fts SET company_name = NEW.company_name, github_org = NEW.github_org
+        WHERE rowid = NEW.id;
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_account_fts_delete
+    AFTER DELETE ON monitored_accounts
+    BEGIN
+        DELETE FROM account_fts WHERE rowid = OLD.id;
+    END
+    ''',
+)
+
+_POSTGRES_ACCOUNT_SEARCH_DDL = (
+    '''
+    ALTER TABLE monitored_accounts ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', COALESCE(company_name, '')), 'A') ||
+        setweight(to_tsvector('simple', COALESCE(github_org, '')), 'B')
+    ) STORED
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_monitored_accounts_search
+    ON monitored_accounts USING GIN (search_vector)
+    ''',
+)
+
+
+def _init_account_search(cursor):
+    """Create the account search index and seed it from existing rows."""
+    if _USE_POSTGRES:
+        for ddl in _POSTGRES_ACCOUNT_SEARCH_DDL:
+            cursor.execute(ddl)
+        return
+
+    for ddl in _SQLITE_ACCOUNT_SEARCH_DDL:
+        cursor.execute(ddl)
+    cursor.execute("SELECT COUNT(*) FROM account_fts")
+    if cursor.fetchone()[0] == 0:
+        cursor.execute('''
+            INSERT INTO account_fts (rowid, company_name, github_org)
+            SELECT id, company_name, github_org FROM monitored_accounts
+        ''')
+
+
 def _column_exists(cursor, table_name: str, column_name: str) -> bool:
     """Check whether a column already exists (works for both dialects)."""
     if _USE_POSTGRES:
@@ -171,6 +302,21 @@ def _safe_add_column(cursor, table: str, col_def: str):
                 raise
 
 
+def _stream_cursor(conn, name: str, fetch_size: int):
+    """Cursor for reading a large result set with fetchmany().
+
+    On PostgreSQL this is a server-side (named) cursor, so rows are pulled
+    from the server ``fetch_size`` at a time instead of all at execute().
+    It lives inside the connection's transaction: do not commit on ``conn``
+    while reading from it.
+    """
+    if _USE_POSTGRES:
+        cursor = conn.cursor(name=name)
+        cursor._cursor.itersize = fetch_size
+        return cursor
+    return conn.cursor()
+
+
 def _insert_returning_id(cursor, sql: str, params: tuple):
     """Execute an INSERT and return the new row's id."""
     if _USE_POSTGRES:
@@ -186,6 +332,79 @@ def _insert_returning_id(cursor, sql: str, params: tuple):
         return cursor.lastrowid
 
 
+# Rows per statement/commit for _bulk_write.
+_BULK_WRITE_CHUNK_SIZE = 500
+
+
+def _split_values_clause(sql: str) -> tuple:
+    """Split a single-row INSERT into (sql with ``VALUES %s``, row template) for execute_values."""
+    start = sql.upper().index('VALUES') + len('VALUES')
+    open_at = sql.index('(', start)
+    depth = 0
+    for pos in range(open_at, len(sql)):
+        if sql[pos] == '(':
+            depth += 1
+        elif sql[pos] == ')':
+            depth -= 1
+            if depth == 0:
+                break
+    template = sql[open_at:pos + 1].replace('?', '%s')
+    return (sql[:open_at] + '%s' + sql[pos + 1:]).replace('?', '%s'), template
+
+
+def _bulk_write(conn, sql: str, rows: list, chunk_size: int = _BULK_WRITE_CHUNK_SIZE,
+                label: str = 'BULK') -> int:
+    """
+    Run a single-row INSERT/upsert ``sql`` (``?`` placeholders) for every
+    tuple in ``rows``, committing after each chunk.
+
+    A chunk is one executemany on SQLite and one multi-row execute_values
+    statement on PostgreSQL. If a chunk fails it is rolled back to a
+    savepoint and replayed row by row, each row in its own savepoint, so a
+    bad row is logged and skipped without losing the rest of the chunk.
+
+    Returns:
+        Number of rows written.
+    """
+    if not rows:
+        return 0
+    cursor = conn.cursor()
+    if _USE_POSTGRES:
+        values_sql, template = _split_values_clause(sql)
+
+        def _write_chunk(chunk):
+            psycopg2.extras.execute_values(cursor._cursor, values_sql, chunk,
+                                           template=template, page_size=len(chunk))
+    else:
+        def _write_chunk(chunk):
+            cursor.executemany(sql, chunk)
+
+    written = 0
+    for i in range(0, len(rows), chunk_size):
+        chunk = rows[i:i + chunk_size]
+        cursor.execute('SAVEPOINT bulk_chunk')
+        try:
+            _write_chunk(chunk)
+            written += len(chunk)
+        except Exception as chunk_error:
+            cursor.execute('ROLLBACK TO SAVEPOINT bulk_chunk')
+            logging.warning("[%s] Chunk write failed (%s); retrying %d rows one by one",
+                            label, chunk_error, len(chunk))
+            for row in chunk:
+                cursor.execute('SAVEPOINT bulk_row')
+                try:
+                    cursor.execute(sql, row)
+                    cursor.execute('RELEASE SAVEPOINT bulk_row')
+                    written += 1
+                except Exception as e:
+                    cursor.execute('ROLLBACK TO SAVEPOINT bulk_row')
+                    cursor.execute('RELEASE SAVEPOINT bulk_row')
+                    logging.error("[%s] Skipping row: %s", label, e)
+        cursor.execute('RELEASE SAVEPOINT bulk_chunk')
+        conn.commit()
+    return written
+
+
 class _CursorProxy:
     """Thin wrapper that auto-converts ? → %s for PostgreSQL."""
 
@@ -224,6 +443,11 @@ class _CursorProxy:
     def fetchall(self):
         return self._cursor.fetchall()
 
+    def fetchmany(self, size=None):
+        if size is None:
+            return self._cursor.fetchmany()
+        return self._cursor.fetchmany(size)
+
     @property
     def lastrowid(self):
         return getattr(self._cursor, 'lastrowid', None)
@@ -237,6 +461,72 @@ class _CursorProxy:
         return self._cursor.description
 
 
+# ---------------------------------------------------------------------------
+# Campaign cache generation
+# ---------------------------------------------------------------------------
+# Bumped on every campaign write in this process. In-process caches built
+# from the campaigns table (v2 campaign_service's recommendation catalog)
+# compare it to decide when to reload.
+_campaigns_generation = 0
+
+
+def _touch_campaigns() -> None:
+    global _campaigns_generation
+    _campaigns_generation += 1
+
+
+def get_campaigns_generation() -> int:
+    """Return the in-process campaigns write counter."""
+    return _campaigns_generation
+
+
+# ---------------------------------------------------------------------------
+# DataTables count cache
+# ---------------------------------------------------------------------------
+# DataTables fires a draw per keystroke, and each draw used to run two
+# COUNT(*) queries besides the page query. Counts are cached per exact
+# (query, params) pair -- i.e. per normalized filter set -- for a few
+# seconds, and dropped as soon as this process makes an account or
+# scorecard write that can change a count (inserts, deletes, archiving,
+# tier, scan date, name, org, website, revenue). Writes from other
+# processes are picked up by the TTL. Scan-progress bookkeeping, notes and
+# metadata do not invalidate: no datatable filter looks at them, and
+# scanners write scan_status constantly.
+_COUNT_CACHE_TTL_SECONDS = 10
+_COUNT_CACHE_MAX_ENTRIES = 512
+_count_cache = {}
+_count_cache_lock = threading.Lock()
+_accounts_generation = 0
+
+
+def _touch_accounts() -> None:
+    global _accounts_generation
+    with _count_cache_lock:
+        _accounts_generation += 1
+        _count_cache.clear()
+
+
+def _cached_count(cursor, sql: str, params) -> int:
+    """Run a ``SELECT COUNT(*) AS total ...`` query through the count cache."""
+    key = (sql, tuple(params))
+    now = time.monotonic()
+    with _count_cache_lock:
+        generation = _accounts_generation
+        hit = _count_cache.get(key)
+    if hit is not None and hit[0] == generation and now - hit[1] < _COUNT_CACHE_TTL_SECONDS:
+        return hit[2]
+
+    cursor.execute(sql, params)
+    total = cursor.fetchone()['total']
+    with _count_cache_lock:
+        # A write that landed while we were counting makes this result stale
+        if generation == _accounts_generation:
+            if len(_count_cache) >= _COUNT_CACHE_MAX_ENTRIES:
+                _count_cache.clear()
+            _count_cache[key] = (generation, now, total)
+    return total
+
+
 # ---------------------------------------------------------------------------
 # Connection pool / factory
 # ---------------------------------------------------------------------------
@@ -364,7 +654,15 @@ def init_db() -> None:
         _safe_add_column(cursor, 'monitored_accounts', 'employee_count TEXT')
         _safe_add_column(cursor, 'monitored_accounts', 'hq_location TEXT')
         _safe_add_column(cursor, 'monitored_accounts', 'funding_stage TEXT')
+        # Numeric revenue parsed from annual_revenue (see parse_revenue_usd)
+        _safe_add_column(cursor, 'monitored_accounts', 'annual_revenue_usd BIGINT')
         _safe_add_column(cursor, 'reports', 'is_favorite INTEGER DEFAULT 0')
+        # Denormalized scoring_v2 scorecard (see _extract_report_scorecard)
+        for col, col_type in _REPORT_SCORECARD_COLUMNS:
+            _safe_add_column(cursor, 'reports', f'{col} {col_type}')
+        _safe_add_column(cursor, 'reports', 'scorecard_extracted INTEGER DEFAULT 0')
+        # 1 on the newest report per company (see _mark_latest_report)
+        _safe_add_column(cursor, 'reports', 'is_latest INTEGER DEFAULT 0')
 
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_accounts_tier
@@ -376,6 +674,12 @@ def init_db() -> None:
             ON monitored_accounts(company_name)
         ''')
 
+        # Revenue range filters on the accounts datatable
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_accounts_revenue_usd
+            ON monitored_accounts(annual_revenue_usd)
+        ''')
+
         # Index for archived accounts (efficient filtering by archive status)
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_accounts_archived
@@ -395,6 +699,30 @@ def init_db() -> None:
             CREATE INDEX IF NOT EXISTS idx_reports_company_lower
             ON reports(LOWER(company_name))
         ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_reports_maturity
+            ON reports(org_maturity_level)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_reports_intent_score
+            ON reports(org_intent_score)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_reports_scorecard_extracted
+            ON reports(scorecard_extracted)
+        ''')
+
+        # Report history listing: latest-per-company rows by sortable column
+        for col in ('created_at', 'signals_found', 'company_name'):
+            cursor.execute(f'''
+                CREATE INDEX IF NOT EXISTS idx_reports_latest_{col}
+                ON reports(is_latest, {col})
+            ''')
+
+        # Seed is_latest for databases that predate it
+        cursor.execute('SELECT 1 FROM reports WHERE is_latest = 1 LIMIT 1')
+        if not cursor.fetchone():
+            rebuild_latest_reports(cursor)
 
         # Index for fast latest_report_id lookups
         cursor.execute('''
@@ -628,10 +956,7 @@ def init_db() -> None:
             ON webscraper_accounts(company_name)
         ''')
 
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_webscraper_monitored_account
-            ON webscraper_accounts(monitored_account_id)
-        ''')
+        _init_webscraper_account_link(cursor)
 
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_webscraper_archived
@@ -929,6 +1254,17 @@ def init_db() -> None:
             ON audit_log(action)
         ''')
 
+        # Daily per-event counts for log rows rotated out of their hot table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS log_daily_rollups (
+                log_table TEXT NOT NULL,
+                day TEXT NOT NULL,
+                event_key TEXT NOT NULL,
+                event_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (log_table, day, event_key)
+            )
+        ''')
+
         # -----------------------------------------------------------------
         # Additional indexes for scale (500+ orgs, concurrent operations)
         # -----------------------------------------------------------------
@@ -1045,6 +1381,12 @@ def init_db() -> None:
             ON pipeline_step_results(run_id)
         ''')
 
+        # Account search index (company name / GitHub org)
+        _init_account_search(cursor)
+
+        # Stored duplicate-detection keys (normalized name / website domain)
+        _init_account_dedup_keys(cursor)
+
         # V2 schema — intent-signal-first domain tables
         try:
             from v2.schema import init_v2_schema
@@ -1052,102 +1394,263 @@ def init_db() -> None:
         except ImportError:
             logging.warning("[DB] v2 schema module not found — skipping v2 tables")
 
+        _init_log_archives(cursor)
+
         conn.commit()
 
+    # A (re)initialized database invalidates anything cached from the old one
+    _touch_campaigns()
+    _touch_accounts()
+
     # Run cleanup tasks on initialization
+    backfill_account_revenue_usd()
     cleanup_duplicate_accounts()
     cleanup_quote_characters()
+    rotate_event_logs()
+
+
+# Duplicate-account keys. 'name' and 'org' are expression-indexed; the
+# normalized-name and domain keys need Python (_normalize_company_name,
+# _extract_domain), so they are stored in dedup_name_key/dedup_domain_key,
+# filled lazily: NULL means "not computed yet", '' means "no key". A trigger
+# resets both to NULL whenever company_name or website changes.
+_ACCOUNT_DEDUP_KEYS = {
+    'name': "LOWER(company_name)",
+    'org': "LOWER(github_org)",
+    'normalized_name': "dedup_name_key",
+    'domain': "dedup_domain_key",
+}
+_ACCOUNT_DEDUP_BATCH = 1000
+
+# Every account sharing ``{key}`` with at least one other account.
+_ACCOUNT_DUPLICATE_ROWS = '''
+    SELECT * FROM (
+        SELECT id, company_name, github_org, current_tier, last_scanned_at,
+               {key} AS dup_key,
+               COUNT(*) OVER (PARTITION BY {key}) AS group_size
+        FROM monitored_accounts
+        WHERE {key} IS NOT NULL AND {key} != ''
+    ) grouped
+    WHERE group_size > 1
+'''
+
+# Child rows that follow a merged account to the account that is kept.
+# scorecard_scores (one row per account) is rebuilt by the scorer and
+# cascades away with the duplicate.
+_ACCOUNT_MERGE_CHILDREN = (
+    ('intent_signals', 'account_id'),
+    ('prospects', 'account_id'),
+    ('website_analyses', 'account_id'),
+    ('webscraper_accounts', 'monitored_account_id'),
+)
+
+_SQLITE_ACCOUNT_DEDUP_KEY_TRIGGER = '''
+    CREATE TRIGGER IF NOT EXISTS trg_account_dedup_keys_reset
+    AFTER UPDATE OF company_name, website ON monitored_accounts
+    WHEN OLD.company_name IS NOT NEW.company_name OR OLD.website IS NOT NEW.website
+    BEGIN
+        UPDATE monitored_accounts SET dedup_name_key = NULL, dedup_domain_key = NULL
+        WHERE id = NEW.id;
+    END
+'''
+
+_POSTGRES_ACCOUNT_DEDUP_KEY_TRIGGER = (
+    '''
+    CREATE OR REPLACE FUNCTION trg_account_dedup_keys_reset() RETURNS trigger AS $$
+    BEGIN
+        IF OLD.company_name IS DISTINCT FROM NEW.company_name
+           OR OLD.website IS DISTINCT FROM NEW.website THEN
+            NEW.dedup_name_key := NULL;
+            NEW.dedup_domain_key := NULL;
+        END IF;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    ''',
+    'DROP TRIGGER IF EXISTS trg_account_dedup_keys_reset ON monitored_accounts',
+    '''
+    CREATE TRIGGER trg_account_dedup_keys_reset
+    BEFORE UPDATE OF company_name, website ON monitored_accounts
+    FOR EACH ROW EXECUTE PROCEDURE trg_account_dedup_keys_reset()
+    ''',
+)
+
+
+def _init_account_dedup_keys(cursor):
+    """Add the stored dedup key columns, their indexes and the reset trigger."""
+    _safe_add_column(cursor, 'monitored_accounts', 'dedup_name_key TEXT')
+    _safe_add_column(cursor, 'monitored_accounts', 'dedup_domain_key TEXT')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_accounts_dedup_name_key
+        ON monitored_accounts(dedup_name_key)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_accounts_dedup_domain_key
+        ON monitored_accounts(dedup_domain_key)
+    ''')
+    if _USE_POSTGRES:
+        for ddl in _POSTGRES_ACCOUNT_DEDUP_KEY_TRIGGER:
+            cursor.execute(ddl)
+    else:
+        cursor.execute(_SQLITE_ACCOUNT_DEDUP_KEY_TRIGGER)
+
+
+def _backfill_account_dedup_keys(cursor) -> int:
+    """Compute dedup_name_key/dedup_domain_key where NULL (caller commits)."""
+    filled = 0
+    last_id = 0
+    while True:
+        cursor.execute('''
+            SELECT id, company_name, website FROM monitored_accounts
+            WHERE (dedup_name_key IS NULL OR dedup_domain_key IS NULL) AND id > ?
+            ORDER BY id
+            LIMIT ?
+        ''', (last_id, _ACCOUNT_DEDUP_BATCH))
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        cursor.executemany(
+            'UPDATE monitored_accounts SET dedup_name_key = ?, dedup_domain_key = ? WHERE id = ?',
+            [(_normalize_company_name(row['company_name']), _extract_domain(row['website']), row['id'])
+             for row in rows],
+        )
+        filled += len(rows)
+        last_id = rows[-1]['id']
+    return filled
+
+
+def _account_keep_rank(account: dict) -> tuple:
+    """Sort key for the account to keep: highest tier, most recent scan, newest id."""
+    scanned = account.get('last_scanned_at')
+    return (account.get('current_tier') or 0, scanned is not None, str(scanned or ''), account['id'])
 
 
-def cleanup_duplicate_accounts() -> dict:
+def find_duplicate_account_groups(keys=('name', 'org')) -> list:
     """
-    Remove duplicate accounts based on both Company Name and GitHub Organization.
-    Keeps the 'best' account: Highest Tier > Most Recent Scan > Newest ID.
-    
+    Group accounts that share any of ``keys`` (transitively).
+
+    Keys: 'name' (case-insensitive company name), 'org' (GitHub org),
+    'normalized_name' (name without Inc/LLC/... suffixes) and 'domain'
+    (website domain). One window query per key finds the accounts in
+    groups of two or more; groups linked through different keys are merged.
+
     Returns:
-        Dictionary with cleanup results: {deleted: int, kept: int, groups: list}
+        List of {'type', 'name', 'org', 'kept_id', 'removed_ids', 'removed_count'},
+        where type joins the keys that linked the group (e.g. 'name+org').
     """
+    unknown = set(keys) - set(_ACCOUNT_DEDUP_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown duplicate keys: {sorted(unknown)}")
+
+    accounts = {}
+    parent = {}
+    linked_by = {}
+
+    def _find(account_id):
+        while parent[account_id] != account_id:
+            parent[account_id] = parent[parent[account_id]]
+            account_id = parent[account_id]
+        return account_id
+
     with db_connection() as conn:
         cursor = conn.cursor()
-        deleted_count = 0
-        kept_count = 0
-        groups_cleaned = []
+        if {'normalized_name', 'domain'} & set(keys):
+            if _backfill_account_dedup_keys(cursor):
+                conn.commit()
+
+        for key in keys:
+            cursor.execute(_ACCOUNT_DUPLICATE_ROWS.format(key=_ACCOUNT_DEDUP_KEYS[key]))
+            first_in_group = {}
+            for row in cursor.fetchall():
+                account = dict(row)
+                account_id = account['id']
+                accounts.setdefault(account_id, account)
+                parent.setdefault(account_id, account_id)
+                linked_by.setdefault(account_id, set()).add(key)
+                anchor = first_in_group.setdefault(account['dup_key'], account_id)
+                parent[_find(account_id)] = _find(anchor)
+
+    components = {}
+    for account_id in accounts:
+        components.setdefault(_find(account_id), []).append(accounts[account_id])
+
+    groups = []
+    for members in components.values():
+        members.sort(key=_account_keep_rank, reverse=True)
+        keeper = members[0]
+        removed_ids = sorted(m['id'] for m in members[1:])
+        linked = set().union(*(linked_by[m['id']] for m in members))
+        groups.append({
+            'type': '+'.join(k for k in keys if k in linked),
+            'name': (keeper['company_name'] or '').lower(),
+            'org': (keeper['github_org'] or '').lower() or None,
+            'kept_id': keeper['id'],
+            'removed_ids': removed_ids,
+            'removed_count': len(removed_ids),
+        })
+    groups.sort(key=lambda g: g['kept_id'])
+    return groups
+
+
+def cleanup_duplicate_accounts(dry_run: bool = False, keys=('name', 'org')) -> dict:
+    """
+    Remove duplicate accounts based on Company Name and GitHub Organization.
+    Keeps the 'best' account: Highest Tier > Most Recent Scan > Newest ID.
+
+    Signals, prospects and website analyses of the removed accounts are moved
+    to the kept account before the duplicates are deleted. See
+    find_duplicate_account_groups for ``keys``; with ``dry_run`` nothing is
+    written and the result previews the groups.
 
+    Returns:
+        Dictionary with cleanup results: {deleted: int, kept: int, groups: list, dry_run: bool}
+    """
+    try:
+        groups = find_duplicate_account_groups(keys)
+    except Exception as e:
+        logging.error("[CLEANUP] Error finding duplicates: %s", e)
+        groups = []
+
+    removed_count = sum(g['removed_count'] for g in groups)
+    result = {'deleted': 0, 'kept': 0, 'groups': groups, 'dry_run': dry_run}
+    if dry_run:
+        result.update(deleted=removed_count, kept=len(groups))
+        return result
+    if not groups:
+        return result
+
+    moves = [(g['kept_id'], removed_id) for g in groups for removed_id in g['removed_ids']]
+    removed_ids = [removed_id for _, removed_id in moves]
+
+    with db_connection() as conn:
+        cursor = conn.cursor()
         try:
-            # Step 1: Find duplicates by Company Name (case-insensitive)
-            cursor.execute('''
-                SELECT LOWER(company_name) as normalized_name, COUNT(*) as cnt
-                FROM monitored_accounts
-                GROUP BY LOWER(company_name)
-                HAVING COUNT(*) > 1
-            ''')
-            name_duplicates = cursor.fetchall()
-        
-            for row in name_duplicates:
-                name = row['normalized_name']
-            
-                cursor.execute('''
-                    SELECT * FROM monitored_accounts 
-                    WHERE LOWER(company_name) = ?
-                    ORDER BY current_tier DESC, last_scanned_at DESC, id DESC
-                ''', (name,))
-            
-                accounts = cursor.fetchall()
-                if len(accounts) > 1:
-                    keep_id = accounts[0]['id']
-                    remove_ids = [acc['id'] for acc in accounts[1:]]
-                
-                    placeholders = ','.join('?' * len(remove_ids))
-                    cursor.execute('DELETE FROM monitored_accounts WHERE id IN (' + placeholders + ')', remove_ids)
-                
-                    deleted_count += len(remove_ids)
-                    kept_count += 1
-                    groups_cleaned.append({'name': name, 'type': 'name', 'kept_id': keep_id, 'removed_count': len(remove_ids)})
-
-            # Step 2: Find duplicates by GitHub Org (case-insensitive)
-            cursor.execute('''
-                SELECT LOWER(github_org) as normalized_org, COUNT(*) as cnt
-                FROM monitored_accounts
-                WHERE github_org IS NOT NULL AND github_org != ''
-                GROUP BY LOWER(github_org)
-                HAVING COUNT(*) > 1
-            ''')
-            org_duplicates = cursor.fetchall()
-        
-            for row in org_duplicates:
-                org = row['normalized_org']
-            
-                cursor.execute('''
-                    SELECT * FROM monitored_accounts 
-                    WHERE LOWER(github_org) = LOWER(?)
-                    ORDER BY current_tier DESC, last_scanned_at DESC, id DESC
-                ''', (org,))
-            
-                accounts = cursor.fetchall()
-                if len(accounts) > 1:
-                    keep_id = accounts[0]['id']
-                    # Filter out accounts that might have already been deleted in Step 1
-                    # (though usually they would have been deleted already if they shared a name)
-                    remove_ids = [acc['id'] for acc in accounts[1:]]
-                
-                    placeholders = ','.join('?' * len(remove_ids))
-                    cursor.execute('DELETE FROM monitored_accounts WHERE id IN (' + placeholders + ')', remove_ids)
-                
-                    deleted_count += len(remove_ids)
-                    kept_count += 1
-                    groups_cleaned.append({'org': org, 'type': 'org', 'kept_id': keep_id, 'removed_count': len(remove_ids)})
-                
+            for table, column in _ACCOUNT_MERGE_CHILDREN:
+                # Near-duplicate LSH bands are per account: moved signals are re-indexed
+                extra = ', minhash_signature = NULL' if table == 'intent_signals' else ''
+                if table == 'webscraper_accounts':
+                    # One row per account (unique index): move only if the kept account has none
+                    cursor.executemany('''
+                        UPDATE webscraper_accounts SET monitored_account_id = ?
+                        WHERE monitored_account_id = ?
+                          AND NOT EXISTS (SELECT 1 FROM webscraper_accounts WHERE monitored_account_id = ?)
+                    ''', [(keep_id, dup_id, keep_id) for keep_id, dup_id in moves])
+                    continue
+                cursor.executemany(f'UPDATE {table} SET {column} = ?{extra} WHERE {column} = ?', moves)
+
+            for i in range(0, len(removed_ids), 500):
+                chunk = removed_ids[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute('DELETE FROM monitored_accounts WHERE id IN (' + placeholders + ')', chunk)
+
             conn.commit()
+            _touch_accounts()
+            result.update(deleted=len(removed_ids), kept=len(groups))
         except Exception as e:
             logging.error("[CLEANUP] Error removing duplicates: %s", e)
             conn.rollback()
-        
-    return {
-        'deleted': deleted_count,
-        'kept': kept_count,
-        'groups': groups_cleaned
-    }
 
+    return result
 
 def cleanup_quote_characters() -> int:
     """
@@ -1181,6 +1684,7 @@ def cleanup_quote_characters() -> int:
                     logging.warning("[CLEANUP] Fixed company name: '%s' -> '%s'", old_name, new_name)
 
             conn.commit()
+            _touch_accounts()
         except Exception as e:
             logging.error("[CLEANUP] Error cleaning quote characters: %s", e)
             conn.rollback()
@@ -1188,6 +1692,39 @@ def cleanup_quote_characters() -> int:
     return updated_count
 
 
+# scoring_v2 fields projected out of reports.scan_data into same-named
+# report columns, so readers never have to load the blob.
+_REPORT_SCORECARD_COLUMNS = (
+    ('org_maturity_level', 'TEXT'),
+    ('org_maturity_label', 'TEXT'),
+    ('org_intent_score', 'REAL'),
+    ('readiness_index', 'REAL'),
+    ('confidence_percent', 'REAL'),
+    ('outreach_angle_label', 'TEXT'),
+    ('risk_level', 'TEXT'),
+)
+
+
+def _extract_report_scorecard(scan_data) -> tuple:
+    """Return the scorecard column values for a scan, in _REPORT_SCORECARD_COLUMNS order."""
+    scoring = scan_data.get('scoring_v2') if isinstance(scan_data, dict) else None
+    if not isinstance(scoring, dict):
+        return (None,) * len(_REPORT_SCORECARD_COLUMNS)
+
+    values = []
+    for col, col_type in _REPORT_SCORECARD_COLUMNS:
+        value = scoring.get(col)
+        if value is not None and col_type == 'REAL':
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                value = None
+        elif value is not None:
+            value = str(value)
+        values.append(value)
+    return tuple(values)
+
+
 def save_report(
     company_name: str,
     github_org: str,
@@ -1210,12 +1747,14 @@ def save_report(
         commits_analyzed = scan_data.get('total_commits_analyzed', 0)
         prs_analyzed = scan_data.get('total_prs_analyzed', 0)
 
-        report_id = _insert_returning_id(cursor, '''
+        scorecard_cols = ', '.join(col for col, _ in _REPORT_SCORECARD_COLUMNS)
+        scorecard_marks = ', '.join('?' for _ in _REPORT_SCORECARD_COLUMNS)
+        report_id = _insert_returning_id(cursor, f'''
             INSERT INTO reports (
                 company_name, github_org, scan_data, ai_analysis,
                 signals_found, repos_scanned, commits_analyzed, prs_analyzed,
-                scan_duration_seconds
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                scan_duration_seconds, {scorecard_cols}, scorecard_extracted
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, {scorecard_marks}, 1)
         ''', (
             company_name,
             github_org,
@@ -1225,8 +1764,10 @@ def save_report(
             repos_scanned,
             commits_analyzed,
             prs_analyzed,
-            scan_duration
-        ))
+            scan_duration,
+        ) + _extract_report_scorecard(scan_data))
+
+        _mark_latest_report(cursor, report_id, company_name)
 
         # Update latest_report_id in monitored_accounts for fast lookups
         cursor.execute('''
@@ -1240,6 +1781,85 @@ def save_report(
     return report_id
 
 
+def _mark_latest_report(cursor, report_id: int, company_name: str) -> None:
+    """Flag report_id as the company's latest report and clear the old flag."""
+    cursor.execute('''
+        UPDATE reports
+        SET is_latest = CASE WHEN id = ? THEN 1 ELSE 0 END
+        WHERE LOWER(company_name) = LOWER(?) AND (is_latest = 1 OR id = ?)
+    ''', (report_id, company_name, report_id))
+
+
+def rebuild_latest_reports(cursor) -> None:
+    """
+    Recompute reports.is_latest from scratch (caller commits).
+
+    The latest report per company (case-insensitive) is the newest by
+    created_at, then id.
+    """
+    cursor.execute('''
+        UPDATE reports
+        SET is_latest = CASE WHEN id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY LOWER(company_name) ORDER BY created_at DESC, id DESC
+                ) AS rn
+                FROM reports
+            ) ranked
+            WHERE rn = 1
+        ) THEN 1 ELSE 0 END
+    ''')
+
+
+def backfill_report_scorecards(batch_size: int = 200) -> int:
+    """
+    Populate the scorecard columns for reports saved before they existed.
+
+    Processes reports with scorecard_extracted = 0 in id order, one batch
+    per transaction, so it can be interrupted and re-run safely.
+
+    Returns:
+        Number of reports backfilled.
+    """
+    set_sql = ', '.join(f'{col} = ?' for col, _ in _REPORT_SCORECARD_COLUMNS)
+    total = 0
+    last_id = 0
+    while True:
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT id, scan_data FROM reports
+                WHERE scorecard_extracted = 0 AND id > ?
+                ORDER BY id
+                LIMIT ?
+            ''', (last_id, batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+
+            updates = []
+            for row in rows:
+                scan_data = row['scan_data']
+                if isinstance(scan_data, str):
+                    try:
+                        scan_data = json.loads(scan_data)
+                    except (TypeError, json.JSONDecodeError):
+                        scan_data = None
+                updates.append(_extract_report_scorecard(scan_data) + (row['id'],))
+
+            cursor.executemany(
+                f'UPDATE reports SET {set_sql}, scorecard_extracted = 1 WHERE id = ?',
+                updates,
+            )
+            conn.commit()
+            total += len(updates)
+            last_id = rows[-1]['id']
+
+    if total:
+        logging.info("[DB] Backfilled scorecard columns for %d reports", total)
+    return total
+
+
 def get_report(report_id: int) -> Optional[dict]:
     """Retrieve a report by ID, including associated signals and firmographics."""
     with db_connection() as conn:
@@ -1288,42 +1908,32 @@ def save_signals(report_id: int, company_name: str, signals: list) -> int:
     if not signals:
         return 0
 
-    with db_connection() as conn:
-        cursor = conn.cursor()
-
-        saved_count = 0
-
-        for signal in signals:
-            try:
-                # Extract relevant fields from signal dict
-                signal_type = signal.get('type', signal.get('Signal', 'unknown'))
-                # Use 'Evidence' field as description, falling back to 'Signal' field
-                description = signal.get('Evidence', signal.get('Signal', ''))
-                # Use 'Link' or 'file' as file_path
-                file_path = signal.get('Link', signal.get('file', signal.get('repo', '')))
-
-                # Scoring V2 enrichment fields (optional)
-                raw_strength = signal.get('raw_strength')
-                age_in_days = signal.get('age_in_days')
-                source_context = signal.get('source_context')
-                woe_value = signal.get('woe_value')
-                freshness_score = signal.get('freshness_score')
-
-                cursor.execute('''
-                    INSERT INTO scan_signals (
-                        report_id, company_name, signal_type, description, file_path,
-                        raw_strength, age_in_days, source_context, woe_value, freshness_score
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (report_id, company_name, signal_type, description, file_path,
-                      raw_strength, age_in_days, source_context, woe_value, freshness_score))
-
-                saved_count += 1
-            except Exception as e:
-                # Log error but continue processing other signals
-                logging.error("Error saving signal: %s", e)
-                continue
+    rows = []
+    for signal in signals:
+        try:
+            # Extract relevant fields from signal dict
+            signal_type = signal.get('type', signal.get('Signal', 'unknown'))
+            # Use 'Evidence' field as description, falling back to 'Signal' field
+            description = signal.get('Evidence', signal.get('Signal', ''))
+            # Use 'Link' or 'file' as file_path
+            file_path = signal.get('Link', signal.get('file', signal.get('repo', '')))
+
+            # Scoring V2 enrichment fields (optional)
+            rows.append((report_id, company_name, signal_type, description, file_path,
+                         signal.get('raw_strength'), signal.get('age_in_days'),
+                         signal.get('source_context'), signal.get('woe_value'),
+                         signal.get('freshness_score')))
+        except Exception as e:
+            # Log error but continue processing other signals
+            logging.error("Error saving signal: %s", e)
 
-        conn.commit()
+    with db_connection() as conn:
+        saved_count = _bulk_write(conn, '''
+            INSERT INTO scan_signals (
+                report_id, company_name, signal_type, description, file_path,
+                raw_strength, age_in_days, source_context, woe_value, freshness_score
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows, label='SIGNALS')
 
     return saved_count
 
@@ -1371,17 +1981,12 @@ def get_recent_reports(limit: int = 20) -> list:
     with db_connection() as conn:
         cursor = conn.cursor()
 
-        # Use ROW_NUMBER() to get only the most recent report per company
+        # is_latest marks the most recent report per company (idx_reports_latest_created_at)
         cursor.execute('''
             SELECT id, company_name, github_org, signals_found, repos_scanned,
                    commits_analyzed, prs_analyzed, created_at, scan_duration_seconds
-            FROM (
-                SELECT id, company_name, github_org, signals_found, repos_scanned,
-                       commits_analyzed, prs_analyzed, created_at, scan_duration_seconds,
-                       ROW_NUMBER() OVER (PARTITION BY LOWER(company_name) ORDER BY created_at DESC) as rn
-                FROM reports
-            )
-            WHERE rn = 1
+            FROM reports
+            WHERE is_latest = 1
             ORDER BY created_at DESC
             LIMIT ?
         ''', (limit,))
@@ -1991,6 +2596,7 @@ def update_account_status(scan_data: dict, report_id: Optional[int] = None) -> d
                 unarchived = True
 
         conn.commit()
+        _touch_accounts()
 
     tier_config = TIER_CONFIG.get(new_tier, TIER_CONFIG[TIER_TRACKING])
 
@@ -2015,6 +2621,88 @@ def update_account_status(scan_data: dict, report_id: Optional[int] = None) -> d
     }
 
 
+_REVENUE_MULTIPLIERS = {
+    'k': 1e3, 'thousand': 1e3,
+    'm': 1e6, 'mm': 1e6, 'mn': 1e6, 'mil': 1e6, 'million': 1e6,
+    'b': 1e9, 'bn': 1e9, 'billion': 1e9,
+    't': 1e12, 'tn': 1e12, 'trillion': 1e12,
+}
+_REVENUE_UNIT = '(?:({})(?![a-z]))?'.format('|'.join(sorted(_REVENUE_MULTIPLIERS, key=len, reverse=True)))
+# An amount, optionally a range ("$10M-$50M", "$10-50M", "1 to 10 million")
+_REVENUE_AMOUNT_RE = re.compile(
+    r'(\$?)\s*(\d+(?:\.\d+)?)\s*' + _REVENUE_UNIT +
+    r'(?:\s*(?:-|\u2013|\u2014|to\b)\s*\$?\s*(\d+(?:\.\d+)?)\s*' + _REVENUE_UNIT + ')?'
+)
+
+
+def parse_revenue_usd(annual_revenue) -> Optional[int]:
+    """
+    Parse a free-text annual revenue into whole US dollars.
+
+    Handles the formats seen in CSV imports and Apollo ("$50M", "$4.6B",
+    "1,500,000", "250K", "1.2 billion"). For ranges ("$10M-$50M", "$10-50M")
+    the lower bound is used, taking the upper bound's unit if it has none.
+    An amount with a "$" or a unit wins over bare numbers such as years.
+    Returns None when no amount can be found.
+    """
+    if annual_revenue is None or isinstance(annual_revenue, bool):
+        return None
+    if isinstance(annual_revenue, (int, float)):
+        return int(annual_revenue) if annual_revenue >= 0 else None
+
+    text = str(annual_revenue).replace(',', '').lower()
+    matches = list(_REVENUE_AMOUNT_RE.finditer(text))
+    if not matches:
+        return None
+    match = next((m for m in matches if m.group(1) or m.group(3) or m.group(5)), matches[0])
+    _, amount, unit, _, upper_unit = match.groups()
+    return int(round(float(amount) * _REVENUE_MULTIPLIERS.get(unit or upper_unit, 1)))
+
+
+def backfill_account_revenue_usd(batch_size: int = 500) -> int:
+    """
+    Populate annual_revenue_usd for accounts saved before the column existed.
+
+    Revenue strings that cannot be parsed stay NULL. Processes accounts in
+    id order, one batch per transaction, so it can be re-run safely.
+
+    Returns:
+        Number of accounts whose revenue was parsed.
+    """
+    total = 0
+    last_id = 0
+    while True:
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT id, annual_revenue FROM monitored_accounts
+                WHERE annual_revenue_usd IS NULL AND annual_revenue IS NOT NULL
+                  AND annual_revenue != '' AND id > ?
+                ORDER BY id
+                LIMIT ?
+            ''', (last_id, batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+
+            updates = []
+            for row in rows:
+                usd = parse_revenue_usd(row['annual_revenue'])
+                if usd is not None:
+                    updates.append((usd, row['id']))
+            if updates:
+                cursor.executemany(
+                    'UPDATE monitored_accounts SET annual_revenue_usd = ? WHERE id = ?', updates)
+                conn.commit()
+                _touch_accounts()
+            total += len(updates)
+            last_id = rows[-1]['id']
+
+    if total:
+        logging.info("[DB] Backfilled annual_revenue_usd for %d accounts", total)
+    return total
+
+
 def add_account_to_tier_0(company_name: str, github_org: str, annual_revenue: Optional[str] = None, website: Optional[str] = None, metadata: Optional[dict] = None) -> dict:
     """
     Add or update a company account to Tier 0 (Tracking) status.
@@ -2071,8 +2759,8 @@ def add_account_to_tier_0(company_name: str, github_org: str, annual_revenue: Op
                 update_fields = ['github_org = ?', 'next_scan_due = ?']
                 update_params = [github_org, next_scan_iso]
                 if annual_revenue:
-                    update_fields.append('annual_revenue = ?')
-                    update_params.append(annual_revenue)
+                    update_fields.append('annual_revenue = ?, annual_revenue_usd = ?')
+                    update_params.extend([annual_revenue, parse_revenue_usd(annual_revenue)])
                 if website:
                     update_fields.append('website = ?')
                     update_params.append(website)
@@ -2109,15 +2797,17 @@ def add_account_to_tier_0(company_name: str, github_org: str, annual_revenue: Op
             metadata_json = json.dumps(metadata) if metadata else None
             account_id = _insert_returning_id(cursor, '''
                 INSERT INTO monitored_accounts (
-                    company_name, github_org, annual_revenue, website, current_tier, last_scanned_at,
-                    status_changed_at, evidence_summary, next_scan_due, metadata,
+                    company_name, github_org, annual_revenue, annual_revenue_usd, website, current_tier,
+                    last_scanned_at, status_changed_at, evidence_summary, next_scan_due, metadata,
                     imported_at, import_source
-                ) VALUES (?, ?, ?, ?, ?, NULL, ?, ?, ?, ?, ?, ?)
-            ''', (company_name.strip(), github_org, annual_revenue, website, TIER_TRACKING, now,
+                ) VALUES (?, ?, ?, ?, ?, ?, NULL, ?, ?, ?, ?, ?, ?)
+            ''', (company_name.strip(), github_org, annual_revenue, parse_revenue_usd(annual_revenue),
+                  website, TIER_TRACKING, now,
                   "Added via Grow pipeline", next_scan_iso, metadata_json,
                   now, 'csv_import'))
 
         conn.commit()
+        _touch_accounts()
 
     tier_config = TIER_CONFIG[TIER_TRACKING]
 
@@ -2149,12 +2839,13 @@ def update_account_annual_revenue(company_name: str, annual_revenue: str) -> boo
 
         cursor.execute('''
             UPDATE monitored_accounts
-            SET annual_revenue = ?
+            SET annual_revenue = ?, annual_revenue_usd = ?
             WHERE LOWER(company_name) = LOWER(?)
-        ''', (annual_revenue, company_name.strip()))
+        ''', (annual_revenue, parse_revenue_usd(annual_revenue), company_name.strip()))
 
         updated = cursor.rowcount > 0
         conn.commit()
+        _touch_accounts()
 
     return updated
 
@@ -2183,6 +2874,7 @@ def update_account_website(company_name: str, website: str) -> bool:
 
         updated = cursor.rowcount > 0
         conn.commit()
+        _touch_accounts()
 
     return updated
 
@@ -2305,7 +2997,8 @@ def enrich_existing_account(company_name: str, annual_revenue=None, website=None
 
             if annual_revenue is not None:
                 set_clauses.append('annual_revenue = ?')
-                params.append(annual_revenue)
+                set_clauses.append('annual_revenue_usd = ?')
+                params.extend([annual_revenue, parse_revenue_usd(annual_revenue)])
 
             if website is not None:
                 set_clauses.append('website = ?')
@@ -2331,6 +3024,7 @@ def enrich_existing_account(company_name: str, annual_revenue=None, website=None
                 )
 
             conn.commit()
+            _touch_accounts()
             return True
         except Exception as e:
             logging.error("[DB] Error enriching account %s: %s", company_name, e)
@@ -2348,7 +3042,8 @@ def get_all_accounts(page: int = 1, limit: int = 50, tier_filter: Optional[list]
         page: Page number (1-indexed, default 1)
         limit: Number of accounts per page (default 50)
         tier_filter: List of tier integers to include (optional)
-        search_query: Search string for company name (optional)
+        search_query: Search string for company name, matched as word
+            prefixes via the account search index (optional)
 
     Returns:
         Dictionary with:
@@ -2370,9 +3065,10 @@ def get_all_accounts(page: int = 1, limit: int = 50, tier_filter: Optional[list]
             where_clauses.append(f'ma.current_tier IN ({placeholders})')
             params.extend(tier_filter)
 
-        if search_query:
-            where_clauses.append('ma.company_name LIKE ?')
-            params.append(f'%{search_query}%')
+        search_match = _search_match_query(search_query)
+        if search_match:
+            where_clauses.append(_search_filter_sql('accounts', 'ma.id'))
+            params.append(search_match)
 
         where_sql = ' WHERE ' + ' AND '.join(where_clauses)
 
@@ -2452,13 +3148,15 @@ def get_tier_counts() -> dict:
 def get_all_accounts_datatable(draw: int, start: int, length: int, search_value: str = '',
                                tier_filter: Optional[list] = None, order_column: int = 0,
                                order_dir: str = 'asc', last_scanned_filter: str = None,
-                               revenue_min: int = None, revenue_max: int = None) -> dict:
+                               revenue_min: int = None, revenue_max: int = None,
+                               q: str = None) -> dict:
     """
     Get accounts data in DataTables format for server-side processing.
 
     This function supports DataTables server-side processing with:
     - Pagination (start, length)
     - Global search (search_value)
+    - Ranked full-text search (q)
     - Tier filtering
     - Last scanned filtering (never, 7d, 30d, 90d, older)
     - Revenue range filtering (in millions)
@@ -2468,7 +3166,10 @@ def get_all_accounts_datatable(draw: int, start: int, length: int, search_value:
         draw: DataTables draw counter (for pagination)
         start: Start row index
         length: Number of rows to return
-        search_value: Global search string (searches company_name and github_org)
+        search_value: Global search string; filters on company_name and github_org
+            word prefixes and keeps the requested sort
+        q: Ranked search string; like search_value, but best matches sort first
+            (the requested column becomes the tie-breaker)
         tier_filter: List of tier integers to include (optional)
         order_column: Column index for sorting (0=company, 1=org, 2=tier, etc.)
         order_dir: Sort direction ('asc' or 'desc')
@@ -2489,7 +3190,7 @@ def get_all_accounts_datatable(draw: int, start: int, length: int, search_value:
         # Column mapping for sorting (must match table column order)
         column_map = {
             0: 'company_name',
-            1: 'annual_revenue',
+            1: 'annual_revenue_usd',
             2: 'github_org',
             3: 'current_tier',
             4: 'last_scanned_at',
@@ -2497,24 +3198,32 @@ def get_all_accounts_datatable(draw: int, start: int, length: int, search_value:
         }
 
         # Get total count without filters (excluding archived)
-        cursor.execute('SELECT COUNT(*) as total FROM monitored_accounts WHERE archived_at IS NULL')
-        total_records = cursor.fetchone()['total']
+        total_records = _cached_count(
+            cursor, 'SELECT COUNT(*) as total FROM monitored_accounts WHERE archived_at IS NULL', ())
 
         # Build WHERE clause for filtering - always exclude archived accounts
         where_clauses = ['archived_at IS NULL']
         params = []
 
-        # Tier filter
+        # Tier filter (sorted so equivalent filter sets share a cached count)
         if tier_filter:
+            tier_filter = sorted(set(tier_filter))
             placeholders = ','.join(['?'] * len(tier_filter))
             where_clauses.append(f'current_tier IN ({placeholders})')
             params.extend(tier_filter)
 
-        # Global search - searches both company_name and github_org
-        if search_value:
-            where_clauses.append('(LOWER(company_name) LIKE ? OR LOWER(github_org) LIKE ?)')
-            search_param = f'%{search_value.lower()}%'
-            params.extend([search_param, search_param])
+        # Global search - company_name and github_org via the search index
+        search_match = _search_match_query(search_value)
+        if search_match:
+            where_clauses.append(_search_filter_sql('accounts', 'id'))
+            params.append(search_match)
+
+        # Ranked search joins the index so hits can be ordered by relevance
+        from_sql = ' FROM monitored_accounts ma'
+        rank_match = _search_match_query(q)
+        if rank_match:
+            from_sql += ' ' + _search_join_sql('accounts', 'fts', 'ma.id')
+            params.insert(0, rank_match)
 
         # Last scanned filter
         if last_scanned_filter:
@@ -2529,41 +3238,22 @@ def get_all_accounts_datatable(draw: int, start: int, length: int, search_value:
             elif last_scanned_filter == 'older':
                 where_clauses.append(f"last_scanned_at < {_adapt_datetime('-90 days')}")
 
-        # Revenue range filter (in millions)
-        # Revenue is stored as text, so we need to parse it for comparison
-        # Common formats: "$100M", "100000000", "$1.5B", "1500000000", etc.
-        if revenue_min is not None or revenue_max is not None:
-            # Use a subquery to parse the revenue and filter
-            # This handles formats like "$100M", "$1.5B", "100000000", etc.
-            revenue_clause = """
-                CASE
-                    WHEN annual_revenue IS NULL OR annual_revenue = '' THEN NULL
-                    WHEN annual_revenue LIKE '%B%' OR annual_revenue LIKE '%b%' THEN
-                        CAST(REPLACE(REPLACE(REPLACE(REPLACE(annual_revenue, '$', ''), 'B', ''), 'b', ''), ',', '') AS REAL) * 1000
-                    WHEN annual_revenue LIKE '%M%' OR annual_revenue LIKE '%m%' THEN
-                        CAST(REPLACE(REPLACE(REPLACE(REPLACE(annual_revenue, '$', ''), 'M', ''), 'm', ''), ',', '') AS REAL)
-                    WHEN annual_revenue LIKE '%K%' OR annual_revenue LIKE '%k%' THEN
-                        CAST(REPLACE(REPLACE(REPLACE(REPLACE(annual_revenue, '$', ''), 'K', ''), 'k', ''), ',', '') AS REAL) / 1000
-                    ELSE
-                        CAST(REPLACE(REPLACE(annual_revenue, '$', ''), ',', '') AS REAL) / 1000000
-                END
-            """
-            if revenue_min is not None and revenue_max is not None:
-                where_clauses.append(f'({revenue_clause}) >= ? AND ({revenue_clause}) <= ?')
-                params.extend([revenue_min, revenue_max])
-            elif revenue_min is not None:
-                where_clauses.append(f'({revenue_clause}) >= ?')
-                params.append(revenue_min)
-            elif revenue_max is not None:
-                where_clauses.append(f'({revenue_clause}) <= ?')
-                params.append(revenue_max)
+        # Revenue range filter (in millions) on the indexed numeric column
+        if revenue_min is not None:
+            where_clauses.append('annual_revenue_usd >= ?')
+            params.append(revenue_min * 1_000_000)
+        if revenue_max is not None:
+            where_clauses.append('annual_revenue_usd <= ?')
+            params.append(revenue_max * 1_000_000)
 
         where_sql = ' WHERE ' + ' AND '.join(where_clauses)
 
         # Get filtered count (where_sql uses ? placeholders, params passed separately)
-        count_query = 'SELECT COUNT(*) as total FROM monitored_accounts' + where_sql
-        cursor.execute(count_query, params)
-        filtered_records = cursor.fetchone()['total']
+        if len(where_clauses) > 1 or rank_match:
+            count_query = 'SELECT COUNT(*) as total' + from_sql + where_sql
+            filtered_records = _cached_count(cursor, count_query, params)
+        else:
+            filtered_records = total_records
 
         # Whitelist-validated sort column (column_map values are all hardcoded above)
         sort_column = column_map.get(order_column, 'company_name')
@@ -2571,8 +3261,10 @@ def get_all_accounts_datatable(draw: int, start: int, length: int, search_value:
         sort_order = 'DESC' if order_dir.lower() == 'desc' else 'ASC'
 
         # Get paginated and sorted data
-        select_query = 'SELECT ma.* FROM monitored_accounts ma' + where_sql + \
-                       ' ORDER BY ma.' + sort_column + ' ' + sort_order + ' LIMIT ? OFFSET ?'
+        order_sql = 'ma.' + sort_column + ' ' + sort_order
+        if rank_match:
+            order_sql = 'fts.search_rank ASC, ' + order_sql
+        select_query = 'SELECT ma.*' + from_sql + where_sql + ' ORDER BY ' + order_sql + ' LIMIT ? OFFSET ?'
 
         select_params = list(params) + [length, start]
         cursor.execute(select_query, select_params)
@@ -2662,87 +3354,62 @@ def find_potential_duplicates(company_name: str, github_org: str = None, website
     Returns:
         List of potential duplicate accounts with match_reason
     """
+    company_normalized = _normalize_company_name(company_name)
+    website_domain = _extract_domain(website) if website else ''
+
+    # One indexed lookup gathers every candidate; the reasons are assigned below
+    clauses = ['LOWER(company_name) = LOWER(?)']
+    params = [company_name.strip()]
+    if company_normalized:
+        clauses.append('dedup_name_key = ?')
+        params.append(company_normalized)
+        # Partial names: accounts whose name contains every word of the input
+        name_query = _search_match_query(company_normalized)
+        if name_query:
+            clauses.append(_search_filter_sql('accounts', 'id'))
+            params.append(name_query)
+    if github_org:
+        clauses.append('LOWER(github_org) = LOWER(?)')
+        params.append(github_org.strip())
+    if website_domain:
+        clauses.append('dedup_domain_key = ?')
+        params.append(website_domain)
+
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        if _backfill_account_dedup_keys(cursor):
+            conn.commit()
+        cursor.execute(
+            'SELECT * FROM monitored_accounts WHERE ' + ' OR '.join(clauses),
+            params
+        )
+        candidates = [dict(row) for row in cursor.fetchall()]
+
     duplicates = []
-    seen_ids = set()
-    with db_connection() as conn:
-        cursor = conn.cursor()
+    for account in candidates:
+        existing_normalized = account.get('dedup_name_key')
+        if (account.get('company_name') or '').lower() == company_name.strip().lower():
+            reason, confidence = 'exact_name', 100
+        elif company_normalized and existing_normalized == company_normalized:
+            reason, confidence = 'normalized_name', 80
+        elif company_normalized and existing_normalized and (
+                existing_normalized in company_normalized or company_normalized in existing_normalized):
+            reason, confidence = 'partial_name', 50
+        elif github_org and (account.get('github_org') or '').lower() == github_org.strip().lower():
+            reason, confidence = 'github_org', 100
+        elif website_domain and account.get('dedup_domain_key') == website_domain:
+            reason, confidence = 'website_domain', 100
+        else:
+            # Search hit on a word of the GitHub org rather than the name
+            continue
+        account['match_reason'] = reason
+        account['match_confidence'] = confidence
+        duplicates.append(account)
 
-        # Normalize the input company name
-        company_normalized = _normalize_company_name(company_name)
+    # Sort by confidence (highest first)
+    duplicates.sort(key=lambda x: x.get('match_confidence', 0), reverse=True)
 
-        # 1. Exact company name match (case-insensitive)
-        cursor.execute(
-            'SELECT * FROM monitored_accounts WHERE LOWER(company_name) = LOWER(?)',
-            (company_name.strip(),)
-        )
-        for row in cursor.fetchall():
-            account = dict(row)
-            account['match_reason'] = 'exact_name'
-            account['match_confidence'] = 100
-            duplicates.append(account)
-            seen_ids.add(account['id'])
-
-        # 2. Fuzzy company name match — use LIKE to narrow candidates instead of full scan
-        if company_normalized:
-            cursor.execute(
-                'SELECT * FROM monitored_accounts WHERE LOWER(company_name) LIKE ?',
-                (f'%{company_normalized}%',)
-            )
-            for row in cursor.fetchall():
-                account = dict(row)
-                if account['id'] in seen_ids:
-                    continue
-                existing_normalized = _normalize_company_name(account.get('company_name', ''))
-                if existing_normalized and existing_normalized == company_normalized:
-                    account['match_reason'] = 'normalized_name'
-                    account['match_confidence'] = 80
-                    duplicates.append(account)
-                    seen_ids.add(account['id'])
-                elif existing_normalized and (existing_normalized in company_normalized or company_normalized in existing_normalized):
-                    account['match_reason'] = 'partial_name'
-                    account['match_confidence'] = 50
-                    duplicates.append(account)
-                    seen_ids.add(account['id'])
-
-        # 3. GitHub org match (if provided)
-        if github_org:
-            cursor.execute(
-                'SELECT * FROM monitored_accounts WHERE LOWER(github_org) = LOWER(?)',
-                (github_org.strip(),)
-            )
-            for row in cursor.fetchall():
-                account = dict(row)
-                if account['id'] in seen_ids:
-                    continue
-                account['match_reason'] = 'github_org'
-                account['match_confidence'] = 100
-                duplicates.append(account)
-                seen_ids.add(account['id'])
-
-        # 4. Website domain match — use LIKE to narrow candidates instead of full scan
-        if website:
-            website_domain = _extract_domain(website)
-            if website_domain:
-                cursor.execute(
-                    'SELECT * FROM monitored_accounts WHERE website IS NOT NULL AND LOWER(website) LIKE ?',
-                    (f'%{website_domain}%',)
-                )
-                for row in cursor.fetchall():
-                    account = dict(row)
-                    if account['id'] in seen_ids:
-                        continue
-                    existing_domain = _extract_domain(account.get('website', ''))
-                    if existing_domain and existing_domain == website_domain:
-                        account['match_reason'] = 'website_domain'
-                        account['match_confidence'] = 100
-                        duplicates.append(account)
-                        seen_ids.add(account['id'])
-
-
-    # Sort by confidence (highest first)
-    duplicates.sort(key=lambda x: x.get('match_confidence', 0), reverse=True)
-
-    return duplicates
+    return duplicates
 
 
 def find_potential_duplicates_bulk(companies: list) -> dict:
@@ -3055,6 +3722,7 @@ def delete_account(account_id: int) -> bool:
         deleted = cursor.rowcount > 0
 
         conn.commit()
+        _touch_accounts()
 
     return deleted
 
@@ -3114,6 +3782,7 @@ def mark_account_as_invalid(company_name: str, reason: str) -> dict:
             ''', (company_name_normalized, '', TIER_INVALID, now, now, reason))
 
         conn.commit()
+        _touch_accounts()
 
     tier_config = TIER_CONFIG[TIER_INVALID]
 
@@ -3151,6 +3820,7 @@ def archive_account(account_id: int) -> bool:
 
         updated = cursor.rowcount > 0
         conn.commit()
+        _touch_accounts()
 
     return updated
 
@@ -3175,6 +3845,7 @@ def unarchive_account(account_id: int) -> bool:
 
         updated = cursor.rowcount > 0
         conn.commit()
+        _touch_accounts()
 
     return updated
 
@@ -3472,8 +4143,62 @@ def set_setting(key: str, value: str) -> None:
         conn.commit()
 
 
+# Re-tiering streams accounts in chunks of _RETIER_CHUNK_SIZE. Scan blobs are
+# parsed and tiered in a process pool once there are enough of them to pay
+# for the workers; the pool needs fork() so workers don't re-import (and
+# re-initialize) this module.
+_RETIER_CHUNK_SIZE = 500
+_RETIER_WORKERS = min(4, os.cpu_count() or 1)
+_RETIER_PARALLEL_MIN_ACCOUNTS = 1000
+
+
+def _retier_scan_blob(scan_raw) -> Optional[tuple]:
+    """Tier one report from its scan_data blob (runs in worker processes).
+
+    Returns (tier, evidence), or None if the blob has no V2 scoring.
+    """
+    if not scan_raw:
+        return None
+    try:
+        scan_data = json.loads(scan_raw) if isinstance(scan_raw, str) else scan_raw
+    except (TypeError, json.JSONDecodeError):
+        return None
+    if not isinstance(scan_data, dict) or not isinstance(scan_data.get('scoring_v2'), dict):
+        return None
+    return calculate_tier_from_scan(scan_data, skip_verification=True)
+
+
+def _retier_pool(total_accounts: int):
+    """Process pool for _retier_scan_blob, or None to tier in this process."""
+    if (total_accounts < _RETIER_PARALLEL_MIN_ACCOUNTS or _RETIER_WORKERS < 2
+            or 'fork' not in multiprocessing.get_all_start_methods()):
+        return None
+    try:
+        return ProcessPoolExecutor(max_workers=_RETIER_WORKERS,
+                                   mp_context=multiprocessing.get_context('fork'))
+    except (OSError, NotImplementedError) as e:
+        logging.warning("[RETIER] Process pool unavailable, tiering in-process: %s", e)
+        return None
+
+
+def _tier_counts(cursor) -> dict:
+    cursor.execute('SELECT current_tier, COUNT(*) AS cnt FROM monitored_accounts GROUP BY current_tier')
+    return {str(row['current_tier'] if row['current_tier'] is not None else 0): row['cnt']
+            for row in cursor.fetchall()}
+
+
 def auto_retier_if_version_changed() -> int:
-    """Retier accounts when the scoring fingerprint changes."""
+    """
+    Retier accounts when the scoring fingerprint changes.
+
+    Accounts are streamed in chunks: each chunk's scorecards are tiered
+    directly, the scan blobs still needed are loaded in one query and tiered
+    (in a process pool for large runs), and the changed tiers are written
+    with executemany. Progress is recorded in tier_audit_log as chunks commit.
+
+    Returns:
+        Number of accounts whose tier changed.
+    """
     from scoring import get_scoring_fingerprint
 
     new_fingerprint = get_scoring_fingerprint()
@@ -3482,44 +4207,102 @@ def auto_retier_if_version_changed() -> int:
         return 0
 
     updated = 0
+    scanned = 0
+    transitions = {}
     now = datetime.now().isoformat()
-
-    with db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT ma.id, ma.current_tier, r.scan_data
-            FROM monitored_accounts ma
-            LEFT JOIN reports r ON r.id = ma.latest_report_id
-            WHERE ma.latest_report_id IS NOT NULL
-        ''')
-
-        for row in cursor.fetchall():
-            scan_raw = row['scan_data'] if isinstance(row, dict) else row[2]
-            if not scan_raw:
-                continue
-            try:
-                scan_data = json.loads(scan_raw) if isinstance(scan_raw, str) else scan_raw
-            except (TypeError, json.JSONDecodeError):
-                continue
-            if not isinstance(scan_data, dict) or not isinstance(scan_data.get('scoring_v2'), dict):
-                continue
-
-            new_tier, evidence = calculate_tier_from_scan(scan_data, skip_verification=True)
-            current_tier = row['current_tier'] if isinstance(row, dict) else row[1]
-            current_tier = current_tier if current_tier is not None else 0
-
-            if new_tier != current_tier:
-                cursor.execute('''
-                    UPDATE monitored_accounts
-                    SET current_tier = ?,
-                        status_changed_at = ?,
-                        evidence_summary = ?
-                    WHERE id = ?
-                ''', (new_tier, now, evidence, row['id'] if isinstance(row, dict) else row[0]))
-                updated += 1
-
-        conn.commit()
-
+    scorecard_cols = ', '.join(f'r.{col}' for col, _ in _REPORT_SCORECARD_COLUMNS)
+
+    with db_connection() as read_conn, db_connection() as write_conn:
+        write_cursor = write_conn.cursor()
+        write_cursor.execute(
+            'SELECT COUNT(*) AS cnt FROM monitored_accounts ma JOIN reports r ON r.id = ma.latest_report_id')
+        total_accounts = write_cursor.fetchone()['cnt']
+        audit_id = _insert_returning_id(write_cursor, '''
+            INSERT INTO tier_audit_log
+                (old_fingerprint, new_fingerprint, total_accounts, accounts_changed, tier_counts_before)
+            VALUES (?, ?, ?, 0, ?)
+        ''', (old_fingerprint, new_fingerprint, total_accounts, json.dumps(_tier_counts(write_cursor))))
+        write_conn.commit()
+
+        pool = _retier_pool(total_accounts)
+        try:
+            stream = _stream_cursor(read_conn, 'retier_accounts', _RETIER_CHUNK_SIZE)
+            stream.execute(f'''
+                SELECT ma.id, ma.current_tier, r.id AS report_id, r.scorecard_extracted,
+                       {scorecard_cols}
+                FROM monitored_accounts ma
+                JOIN reports r ON r.id = ma.latest_report_id
+                ORDER BY ma.id
+            ''')
+            blob_cursor = read_conn.cursor()
+
+            while True:
+                rows = stream.fetchmany(_RETIER_CHUNK_SIZE)
+                if not rows:
+                    break
+                scanned += len(rows)
+
+                results = {}
+                needs_scan = []
+                for row in rows:
+                    row = dict(row)
+                    if row['scorecard_extracted']:
+                        scoring = {col: row[col] for col, _ in _REPORT_SCORECARD_COLUMNS if row[col] is not None}
+                        # A non-zero V2 tier is decided by the scorecard alone; PRE_I18N
+                        # and empty scorecards fall through to legacy tiering on the full scan.
+                        if scoring:
+                            result = calculate_tier_from_scan({'scoring_v2': scoring}, skip_verification=True)
+                            if result[0] != 0:
+                                results[row['id']] = (row, result)
+                                continue
+                    needs_scan.append(row)
+
+                if needs_scan:
+                    placeholders = ','.join('?' * len(needs_scan))
+                    blob_cursor.execute(
+                        'SELECT id, scan_data FROM reports WHERE id IN (' + placeholders + ')',
+                        [row['report_id'] for row in needs_scan])
+                    blobs = {blob['id']: blob['scan_data'] for blob in blob_cursor.fetchall()}
+                    scan_blobs = [blobs.get(row['report_id']) for row in needs_scan]
+                    del blobs
+                    tiered = (pool.map(_retier_scan_blob, scan_blobs, chunksize=25)
+                              if pool else map(_retier_scan_blob, scan_blobs))
+                    for row, result in zip(needs_scan, tiered):
+                        if result is not None:
+                            results[row['id']] = (row, result)
+
+                changes = []
+                for account_id, (row, (new_tier, evidence)) in results.items():
+                    current_tier = row['current_tier'] if row['current_tier'] is not None else 0
+                    if new_tier != current_tier:
+                        changes.append((new_tier, now, evidence, account_id))
+                        key = f'{current_tier}->{new_tier}'
+                        transitions[key] = transitions.get(key, 0) + 1
+
+                if changes:
+                    write_cursor.executemany('''
+                        UPDATE monitored_accounts
+                        SET current_tier = ?,
+                            status_changed_at = ?,
+                            evidence_summary = ?
+                        WHERE id = ?
+                    ''', changes)
+                    updated += len(changes)
+                write_cursor.execute(
+                    'UPDATE tier_audit_log SET accounts_changed = ?, changes_detail = ? WHERE id = ?',
+                    (updated, json.dumps({'processed': scanned, 'transitions': transitions}), audit_id))
+                write_conn.commit()
+        finally:
+            if pool:
+                pool.shutdown()
+
+        write_cursor.execute(
+            'UPDATE tier_audit_log SET tier_counts_after = ? WHERE id = ?',
+            (json.dumps(_tier_counts(write_cursor)), audit_id))
+        write_conn.commit()
+        _touch_accounts()
+
+    logging.info("[RETIER] Scoring fingerprint changed: %d of %d accounts re-tiered", updated, scanned)
     set_setting('scoring_fingerprint', new_fingerprint)
     return updated
 
@@ -3541,69 +4324,172 @@ def force_retier_all() -> dict:
     return {'total': 0, 'updated': 0, 'by_tier': {}}
 
 
+# Write-behind usage counters. increment_daily_stat / increment_hourly_api_calls
+# only add to in-process totals; a daemon thread upserts them every
+# _STATS_FLUSH_INTERVAL_SECONDS (and at interpreter exit), so at most one
+# interval of increments is lost if the process dies. Readers merge the
+# unflushed totals of this process.
+_STATS_FLUSH_INTERVAL_SECONDS = 5.0
+_SYSTEM_STAT_COLUMNS = ('scans_run', 'api_calls_estimated', 'webhooks_fired')
+
+
+class _StatsCounterBuffer:
+    """In-process totals for system_stats and hourly_api_stats, flushed in one upsert."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._daily = {}    # date -> {column: delta}
+        self._hourly = {}   # hour_key -> delta
+        self._lock = threading.Lock()
+        # Held for a whole flush; readers take it so a batch is never
+        # counted both in the database and in memory (or in neither)
+        self._flush_lock = threading.Lock()
+        self._flusher = None
+
+    def add_daily(self, date: str, column: str, amount: int) -> None:
+        with self._lock:
+            day = self._daily.setdefault(date, {})
+            day[column] = day.get(column, 0) + amount
+        self._ensure_flusher()
+
+    def add_hourly(self, hour_key: str, amount: int) -> None:
+        with self._lock:
+            self._hourly[hour_key] = self._hourly.get(hour_key, 0) + amount
+        self._ensure_flusher()
+
+    def pending_daily(self) -> dict:
+        with self._lock:
+            return {date: dict(cols) for date, cols in self._daily.items()}
+
+    def pending_hourly(self, hour_key: str) -> int:
+        with self._lock:
+            return self._hourly.get(hour_key, 0)
+
+    def _ensure_flusher(self) -> None:
+        # Also restarts the thread in a forked worker, where it does not survive
+        if self._flusher is None or not self._flusher.is_alive():
+            with self._lock:
+                if self._flusher is None or not self._flusher.is_alive():
+                    self._flusher = threading.Thread(target=self._run, name='stats-flusher', daemon=True)
+                    self._flusher.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.flush()
+            except Exception as e:
+                logging.error("[STATS] Counter flush failed, will retry: %s", e)
+
+    def flush(self) -> bool:
+        """Write pending totals; returns False if there was nothing to write."""
+        with self._flush_lock:
+            with self._lock:
+                daily, hourly = self._daily, self._hourly
+                self._daily, self._hourly = {}, {}
+            if not daily and not hourly:
+                return False
+            try:
+                with db_connection() as conn:
+                    cursor = conn.cursor()
+                    if daily:
+                        cursor.executemany('''
+                            INSERT INTO system_stats (date, scans_run, api_calls_estimated, webhooks_fired)
+                            VALUES (?, ?, ?, ?)
+                            ON CONFLICT(date) DO UPDATE SET
+                                scans_run = system_stats.scans_run + excluded.scans_run,
+                                api_calls_estimated = system_stats.api_calls_estimated + excluded.api_calls_estimated,
+                                webhooks_fired = system_stats.webhooks_fired + excluded.webhooks_fired
+                        ''', [(date,) + tuple(cols.get(c, 0) for c in _SYSTEM_STAT_COLUMNS)
+                              for date, cols in daily.items()])
+                    if hourly:
+                        cursor.executemany('''
+                            INSERT INTO hourly_api_stats (hour_key, api_calls)
+                            VALUES (?, ?)
+                            ON CONFLICT(hour_key) DO UPDATE SET
+                                api_calls = hourly_api_stats.api_calls + excluded.api_calls
+                        ''', list(hourly.items()))
+                    conn.commit()
+            except Exception:
+                # Put the pending increments back so the next flush retries them
+                with self._lock:
+                    for date, cols in daily.items():
+                        day = self._daily.setdefault(date, {})
+                        for col, delta in cols.items():
+                            day[col] = day.get(col, 0) + delta
+                    for hour_key, delta in hourly.items():
+                        self._hourly[hour_key] = self._hourly.get(hour_key, 0) + delta
+                raise
+        return True
+
+
+_stats_buffer = _StatsCounterBuffer(_STATS_FLUSH_INTERVAL_SECONDS)
+
+
+def flush_stats_counters() -> bool:
+    """Write buffered usage counters now (also runs periodically and at exit)."""
+    return _stats_buffer.flush()
+
+
+def _flush_stats_counters_at_exit() -> None:
+    try:
+        _stats_buffer.flush()
+    except Exception as e:
+        logging.error("[STATS] Final counter flush failed: %s", e)
+
+
+atexit.register(_flush_stats_counters_at_exit)
+
+
 def increment_daily_stat(stat_name: str, amount: int = 1) -> None:
     """
-    Increment a daily statistic counter.
-    
+    Increment a daily statistic counter (buffered; see _StatsCounterBuffer).
+
     Args:
         stat_name: One of 'scans_run', 'api_calls_estimated', 'webhooks_fired'
         amount: Amount to increment by (default 1)
     """
-    ALLOWED_STAT_COLUMNS = {'scans_run', 'api_calls_estimated', 'webhooks_fired'}
-    if stat_name not in ALLOWED_STAT_COLUMNS:
+    if stat_name not in _SYSTEM_STAT_COLUMNS:
         raise ValueError('Invalid stat_name: ' + stat_name)
-    assert stat_name in ALLOWED_STAT_COLUMNS  # Whitelist-validated column name
-
-    with db_connection() as conn:
-        cursor = conn.cursor()
 
-        today = datetime.now().strftime('%Y-%m-%d')
-
-        # Column name is whitelist-validated above; SQLite does not support parameterized column names
-        _UPDATE_TEMPLATES = {
-            'scans_run': 'UPDATE system_stats SET scans_run = scans_run + ? WHERE date = ?',
-            'api_calls_estimated': 'UPDATE system_stats SET api_calls_estimated = api_calls_estimated + ? WHERE date = ?',
-            'webhooks_fired': 'UPDATE system_stats SET webhooks_fired = webhooks_fired + ? WHERE date = ?',
-        }
-        query = _UPDATE_TEMPLATES[stat_name]
-        cursor.execute(query, (amount, today))
-    
-        if cursor.rowcount == 0:
-            cursor.execute('''
-                INSERT INTO system_stats (date, scans_run, api_calls_estimated, webhooks_fired)
-                VALUES (?, 0, 0, 0)
-            ''', (today,))
-            cursor.execute(query, (amount, today))
-    
-        conn.commit()
+    _stats_buffer.add_daily(datetime.now().strftime('%Y-%m-%d'), stat_name, amount)
 
 
 def get_stats_last_n_days(days: int = 30) -> list:
     """
-    Get system stats for the last N days.
+    Get system stats for the last N days, including unflushed increments.
     
     Returns:
         List of dicts with date, scans_run, api_calls_estimated, webhooks_fired
     """
-    with db_connection() as conn:
-        cursor = conn.cursor()
-    
-        date_threshold = _adapt_date(f'-{days} days')
-        cursor.execute(f'''
-            SELECT date, scans_run, api_calls_estimated, webhooks_fired
-            FROM system_stats
-            WHERE date >= {date_threshold}
-            ORDER BY date ASC
-        ''')
-    
-        rows = cursor.fetchall()
-    
-    return [dict(row) for row in rows]
+    with _stats_buffer._flush_lock:
+        with db_connection() as conn:
+            cursor = conn.cursor()
+
+            date_threshold = _adapt_date(f'-{days} days')
+            cursor.execute(f'''
+                SELECT date, scans_run, api_calls_estimated, webhooks_fired
+                FROM system_stats
+                WHERE date >= {date_threshold}
+                ORDER BY date ASC
+            ''')
+
+            rows = cursor.fetchall()
+        pending = _stats_buffer.pending_daily()
+
+    # Pending totals are at most one flush interval old, so always in range
+    stats = {row['date']: dict(row) for row in rows}
+    for date, cols in pending.items():
+        day = stats.setdefault(date, {'date': date, **{c: 0 for c in _SYSTEM_STAT_COLUMNS}})
+        for col, delta in cols.items():
+            day[col] = (day[col] or 0) + delta
+    return [stats[date] for date in sorted(stats)]
 
 
 def increment_hourly_api_calls(amount: int = 1) -> None:
     """
-    Increment the API calls counter for the current hour.
+    Increment the API calls counter for the current hour (buffered; see
+    _StatsCounterBuffer).
 
     The counter resets automatically at the top of each hour by using
     a unique hour_key (YYYY-MM-DD-HH format).
@@ -3611,50 +4497,32 @@ def increment_hourly_api_calls(amount: int = 1) -> None:
     Args:
         amount: Number of API calls to add (default 1)
     """
-    with db_connection() as conn:
-        cursor = conn.cursor()
-
-        # Generate hour key in format: YYYY-MM-DD-HH
-        hour_key = datetime.now().strftime('%Y-%m-%d-%H')
-
-        # Try to update existing row for this hour
-        cursor.execute('''
-            UPDATE hourly_api_stats
-            SET api_calls = api_calls + ?
-            WHERE hour_key = ?
-        ''', (amount, hour_key))
-
-        if cursor.rowcount == 0:
-            # No row for this hour yet, create one
-            cursor.execute('''
-                INSERT INTO hourly_api_stats (hour_key, api_calls)
-                VALUES (?, ?)
-            ''', (hour_key, amount))
-
-        conn.commit()
+    _stats_buffer.add_hourly(datetime.now().strftime('%Y-%m-%d-%H'), amount)
 
 
 def get_current_hour_api_calls() -> int:
     """
-    Get the number of API calls made in the current hour.
+    Get the number of API calls made in the current hour, including
+    unflushed increments.
 
     Returns:
         Number of API calls this hour (0 if no calls yet)
     """
-    with db_connection() as conn:
-        cursor = conn.cursor()
-
-        # Generate hour key for current hour
-        hour_key = datetime.now().strftime('%Y-%m-%d-%H')
+    # Generate hour key for current hour
+    hour_key = datetime.now().strftime('%Y-%m-%d-%H')
 
-        cursor.execute('''
-            SELECT api_calls FROM hourly_api_stats
-            WHERE hour_key = ?
-        ''', (hour_key,))
+    with _stats_buffer._flush_lock:
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT api_calls FROM hourly_api_stats
+                WHERE hour_key = ?
+            ''', (hour_key,))
 
-        row = cursor.fetchone()
+            row = cursor.fetchone()
+        pending = _stats_buffer.pending_hourly(hour_key)
 
-    return row['api_calls'] if row else 0
+    return (row['api_calls'] if row else 0) + pending
 
 
 def cleanup_old_hourly_stats(hours_to_keep: int = 24) -> int:
@@ -4219,8 +5087,6 @@ def get_import_batch(batch_id: int) -> Optional[dict]:
     return None
 
 
-# Initialize database on module import
-init_db()
 
 
 def get_stale_queued_accounts(timeout_minutes: int = 30) -> list:
@@ -4389,7 +5255,7 @@ def get_paginated_reports(
         cursor = conn.cursor()
 
         # Build WHERE clause
-        where_clauses = ["rn = 1"]  # Always filter to latest per company
+        where_clauses = ["is_latest = 1"]  # Always filter to latest per company
         params = []
 
         if search_query:
@@ -4427,16 +5293,8 @@ def get_paginated_reports(
         assert sort_by in valid_sort_columns
         sort_order = 'DESC' if sort_order.lower() == 'desc' else 'ASC'
 
-        _REPORTS_SUBQUERY = '''(
-                SELECT id, company_name, github_org, signals_found, repos_scanned,
-                       commits_analyzed, prs_analyzed, created_at, scan_duration_seconds,
-                       COALESCE(is_favorite, 0) as is_favorite,
-                       ROW_NUMBER() OVER (PARTITION BY LOWER(company_name) ORDER BY created_at DESC) as rn
-                FROM reports
-            )'''
-
         # Get total count with filters (where_sql uses ? placeholders)
-        count_query = 'SELECT COUNT(*) as total FROM ' + _REPORTS_SUBQUERY + where_sql
+        count_query = 'SELECT COUNT(*) as total FROM reports' + where_sql
         cursor.execute(count_query, params)
         total_items = cursor.fetchone()['total']
 
@@ -4449,7 +5307,7 @@ def get_paginated_reports(
         select_query = '''SELECT id, company_name, github_org, signals_found, repos_scanned,
                    commits_analyzed, prs_analyzed, created_at, scan_duration_seconds,
                    COALESCE(is_favorite, 0) as is_favorite
-            FROM ''' + _REPORTS_SUBQUERY + where_sql + \
+            FROM reports''' + where_sql + \
             ' ORDER BY ' + sort_by + ' ' + sort_order + ' LIMIT ? OFFSET ?'
 
         cursor.execute(select_query, params + [limit, offset])
@@ -4507,8 +5365,9 @@ def delete_report_by_id(report_id: int) -> dict:
         cursor = conn.cursor()
 
         # Check if report exists
-        cursor.execute('SELECT id FROM reports WHERE id = ?', (report_id,))
-        if not cursor.fetchone():
+        cursor.execute('SELECT id, company_name, is_latest FROM reports WHERE id = ?', (report_id,))
+        report = cursor.fetchone()
+        if not report:
             return {'success': False, 'error': 'Report not found'}
 
         # Delete associated signals first
@@ -4517,6 +5376,22 @@ def delete_report_by_id(report_id: int) -> dict:
         # Delete the report
         cursor.execute('DELETE FROM reports WHERE id = ?', (report_id,))
 
+        # Promote the company's previous report, if any, to latest
+        if report['is_latest']:
+            cursor.execute('''
+                SELECT id FROM reports
+                WHERE LOWER(company_name) = LOWER(?)
+                ORDER BY created_at DESC, id DESC
+                LIMIT 1
+            ''', (report['company_name'],))
+            previous = cursor.fetchone()
+            if previous:
+                _mark_latest_report(cursor, previous['id'], report['company_name'])
+            cursor.execute('''
+                UPDATE monitored_accounts SET latest_report_id = ?
+                WHERE latest_report_id = ?
+            ''', (previous['id'] if previous else None, report_id))
+
         conn.commit()
 
     return {'success': True}
@@ -4825,82 +5700,165 @@ WEBSCRAPER_TIER_CONFIG = {
 }
 
 
-def populate_webscraper_from_reporadar() -> dict:
+# Incremental population reads accounts whose website or archive state changed
+# since the last run: website_changed_at is stamped by trigger on insert and on
+# those updates, and the run's start time is kept in system_settings.
+_WEBSCRAPER_POPULATED_SETTING = 'webscraper_populated_at'
+
+_SQLITE_ACCOUNT_WEBSITE_CHANGED_TRIGGERS = (
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_account_website_changed_insert
+    AFTER INSERT ON monitored_accounts
+    BEGIN
+        UPDATE monitored_accounts SET website_changed_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_account_website_changed
+    AFTER UPDATE OF website, archived_at ON monitored_accounts
+    WHEN OLD.website IS NOT NEW.website OR OLD.archived_at IS NOT NEW.archived_at
+    BEGIN
+        UPDATE monitored_accounts SET website_changed_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+    END
+    ''',
+)
+
+_POSTGRES_ACCOUNT_WEBSITE_CHANGED_TRIGGER = (
+    '''
+    CREATE OR REPLACE FUNCTION trg_account_website_changed() RETURNS trigger AS $$
+    BEGIN
+        IF OLD.website IS DISTINCT FROM NEW.website
+           OR OLD.archived_at IS DISTINCT FROM NEW.archived_at THEN
+            NEW.website_changed_at := CURRENT_TIMESTAMP;
+        END IF;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    ''',
+    'DROP TRIGGER IF EXISTS trg_account_website_changed ON monitored_accounts',
+    '''
+    CREATE TRIGGER trg_account_website_changed
+    BEFORE UPDATE OF website, archived_at ON monitored_accounts
+    FOR EACH ROW EXECUTE PROCEDURE trg_account_website_changed()
+    ''',
+)
+
+
+def _init_webscraper_account_link(cursor):
+    """One webscraper row per RepoRadar account, plus change stamps for incremental population."""
+    # Older trees could hold several rows per account: keep the first linked
+    # one and unlink (not delete) the rest so their scan data survives
+    cursor.execute('''
+        UPDATE webscraper_accounts SET monitored_account_id = NULL
+        WHERE monitored_account_id IS NOT NULL
+          AND id NOT IN (
+              SELECT MIN(id) FROM webscraper_accounts
+              WHERE monitored_account_id IS NOT NULL
+              GROUP BY monitored_account_id
+          )
+    ''')
+    cursor.execute('DROP INDEX IF EXISTS idx_webscraper_monitored_account')
+    cursor.execute('''
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_webscraper_monitored_account_unique
+        ON webscraper_accounts(monitored_account_id)
+    ''')
+
+    if _USE_POSTGRES:
+        _safe_add_column(cursor, 'monitored_accounts', 'website_changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP')
+        for ddl in _POSTGRES_ACCOUNT_WEBSITE_CHANGED_TRIGGER:
+            cursor.execute(ddl)
+    else:
+        # SQLite cannot ADD COLUMN with a CURRENT_TIMESTAMP default; the insert trigger stamps new rows
+        _safe_add_column(cursor, 'monitored_accounts', 'website_changed_at TIMESTAMP')
+        for ddl in _SQLITE_ACCOUNT_WEBSITE_CHANGED_TRIGGERS:
+            cursor.execute(ddl)
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_accounts_website_changed
+        ON monitored_accounts(website_changed_at)
+    ''')
+
+
+def populate_webscraper_from_reporadar(incremental: bool = False) -> dict:
     """
     Populate webscraper_accounts from monitored_accounts (RepoRadar).
 
-    For each RepoRadar account:
-    - Creates a corresponding webscraper_accounts row if it doesn't exist
+    For each active RepoRadar account with a website and no linked
+    webscraper_accounts row, one INSERT ... SELECT creates a row that:
     - Copies company_name
-    - Links via monitored_account_id
+    - Links via monitored_account_id (unique)
     - Extracts website_url from the monitored_accounts website field
     - Sets current_tier = 4, tier_label = 'Not Scanned', scan_status = 'not_scanned'
 
     Does NOT trigger any scans.
 
+    Args:
+        incremental: Only consider accounts added, or whose website or
+            archive state changed, since the last successful run. The first
+            run is always a full one.
+
     Returns:
         Dictionary with migration results: {created: int, skipped: int, errors: int}
     """
+    last_run = get_setting(_WEBSCRAPER_POPULATED_SETTING) if incremental else None
+    scope_sql = ' AND ma.website_changed_at >= ?' if last_run else ''
+    params = (last_run,) if last_run else ()
+
+    candidates = 0
+    created_count = 0
+    error_count = 0
+
     with db_connection() as conn:
         cursor = conn.cursor()
 
-        created_count = 0
-        skipped_count = 0
-        error_count = 0
-
         try:
-            # Get all monitored accounts that have a website
-            cursor.execute('''
-                SELECT id, company_name, website
-                FROM monitored_accounts
-                WHERE archived_at IS NULL
-                AND website IS NOT NULL
-                AND TRIM(website) != ''
-            ''')
-            accounts = cursor.fetchall()
-
-            for account in accounts:
-                try:
-                    # Check if already exists in webscraper_accounts
-                    cursor.execute('''
-                        SELECT id FROM webscraper_accounts
-                        WHERE monitored_account_id = ?
-                    ''', (account['id'],))
-
-                    if cursor.fetchone():
-                        skipped_count += 1
-                        continue
+            # Accounts stamped during this run are picked up again next time
+            cursor.execute('SELECT CURRENT_TIMESTAMP AS now')
+            run_started = str(cursor.fetchone()['now'])[:19]
 
-                    # Create new webscraper account
-                    cursor.execute('''
-                        INSERT INTO webscraper_accounts (
-                            company_name,
-                            website_url,
-                            current_tier,
-                            tier_label,
-                            scan_status,
-                            monitored_account_id,
-                            created_at,
-                            updated_at
-                        ) VALUES (?, ?, 4, 'Not Scanned', 'not_scanned', ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                    ''', (account['company_name'], account['website'], account['id']))
-
-                    created_count += 1
+            cursor.execute('''
+                SELECT COUNT(*) AS cnt FROM monitored_accounts ma
+                WHERE ma.archived_at IS NULL
+                  AND ma.website IS NOT NULL
+                  AND TRIM(ma.website) != ''
+            ''' + scope_sql, params)
+            candidates = cursor.fetchone()['cnt']
 
-                except Exception as e:
-                    logging.error("[WEBSCRAPER] Error creating account for %s: %s", account['company_name'], e)
-                    error_count += 1
-                    continue
+            cursor.execute('''
+                INSERT INTO webscraper_accounts (
+                    company_name,
+                    website_url,
+                    current_tier,
+                    tier_label,
+                    scan_status,
+                    monitored_account_id,
+                    created_at,
+                    updated_at
+                )
+                SELECT ma.company_name, ma.website, 4, 'Not Scanned', 'not_scanned', ma.id,
+                       CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+                FROM monitored_accounts ma
+                WHERE ma.archived_at IS NULL
+                  AND ma.website IS NOT NULL
+                  AND TRIM(ma.website) != ''
+                  AND NOT EXISTS (
+                      SELECT 1 FROM webscraper_accounts wa
+                      WHERE wa.monitored_account_id = ma.id
+                  )
+            ''' + scope_sql, params)
+            created_count = cursor.rowcount
 
             conn.commit()
+            set_setting(_WEBSCRAPER_POPULATED_SETTING, run_started)
 
         except Exception as e:
             logging.error("[WEBSCRAPER] Migration error: %s", e)
             conn.rollback()
+            error_count = candidates
+            created_count = 0
 
     return {
         'created': created_count,
-        'skipped': skipped_count,
+        'skipped': candidates - created_count - error_count,
         'errors': error_count
     }
 
@@ -5137,23 +6095,29 @@ def get_webscraper_archived_count() -> int:
     return count
 
 
-def webscraper_bulk_archive(account_ids: list) -> int:
-    """Archive multiple webscraper accounts."""
-    if not account_ids:
-        return 0
-
+def _webscraper_bulk_update(sql: str, account_ids: list, params: tuple = ()) -> int:
+    """Run ``sql`` (with an ``{ids}`` placeholder list) over account_ids in chunks, in one transaction."""
+    account_ids = list(dict.fromkeys(account_ids))
+    changed = 0
     with db_connection() as conn:
         cursor = conn.cursor()
+        for i in range(0, len(account_ids), _BULK_WRITE_CHUNK_SIZE):
+            chunk = account_ids[i:i + _BULK_WRITE_CHUNK_SIZE]
+            cursor.execute(sql.format(ids=','.join('?' * len(chunk))), list(params) + chunk)
+            changed += cursor.rowcount
+        conn.commit()
+    return changed
 
-        placeholders = ','.join(['?'] * len(account_ids))
-        cursor.execute(
-            'UPDATE webscraper_accounts SET archived_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP WHERE id IN (' + placeholders + ') AND archived_at IS NULL',
-            account_ids)
 
-        updated = cursor.rowcount
-        conn.commit()
+def webscraper_bulk_archive(account_ids: list) -> int:
+    """Archive multiple webscraper accounts."""
+    if not account_ids:
+        return 0
 
-    return updated
+    return _webscraper_bulk_update(
+        'UPDATE webscraper_accounts SET archived_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP '
+        'WHERE id IN ({ids}) AND archived_at IS NULL',
+        account_ids)
 
 
 def webscraper_bulk_delete(account_ids: list) -> int:
@@ -5161,16 +6125,7 @@ def webscraper_bulk_delete(account_ids: list) -> int:
     if not account_ids:
         return 0
 
-    with db_connection() as conn:
-        cursor = conn.cursor()
-
-        placeholders = ','.join(['?'] * len(account_ids))
-        cursor.execute('DELETE FROM webscraper_accounts WHERE id IN (' + placeholders + ')', account_ids)
-
-        deleted = cursor.rowcount
-        conn.commit()
-
-    return deleted
+    return _webscraper_bulk_update('DELETE FROM webscraper_accounts WHERE id IN ({ids})', account_ids)
 
 
 def webscraper_bulk_change_tier(account_ids: list, new_tier: int) -> int:
@@ -5178,20 +6133,11 @@ def webscraper_bulk_change_tier(account_ids: list, new_tier: int) -> int:
     if not account_ids or new_tier not in WEBSCRAPER_TIER_CONFIG:
         return 0
 
-    with db_connection() as conn:
-        cursor = conn.cursor()
-
-        tier_label = WEBSCRAPER_TIER_CONFIG[new_tier]['name']
-        placeholders = ','.join(['?'] * len(account_ids))
-
-        cursor.execute(
-            'UPDATE webscraper_accounts SET current_tier = ?, tier_label = ?, updated_at = CURRENT_TIMESTAMP WHERE id IN (' + placeholders + ')',
-            [new_tier, tier_label] + account_ids)
-
-        updated = cursor.rowcount
-        conn.commit()
-
-    return updated
+    tier_label = WEBSCRAPER_TIER_CONFIG[new_tier]['name']
+    return _webscraper_bulk_update(
+        'UPDATE webscraper_accounts SET current_tier = ?, tier_label = ?, updated_at = CURRENT_TIMESTAMP '
+        'WHERE id IN ({ids})',
+        account_ids, (new_tier, tier_label))
 
 
 def get_webscraper_account(account_id: int) -> Optional[dict]:
@@ -5359,64 +6305,61 @@ def save_contributor(contributor_data: dict) -> Optional[int]:
 
 
 def save_contributors_batch(contributors: list) -> int:
-    """Save multiple contributors in a single transaction. Returns count saved."""
-    with db_connection() as conn:
-        cursor = conn.cursor()
-        saved = 0
-
-        # Bot patterns to filter out
-        BOT_PATTERNS = ('[bot]', '-bot', 'github-actions', 'dependabot', 'renovate', 'greenkeeper', 'snyk-bot')
+    """Save multiple contributors with chunked bulk upserts. Returns count saved."""
+    # Bot patterns to filter out
+    BOT_PATTERNS = ('[bot]', '-bot', 'github-actions', 'dependabot', 'renovate', 'greenkeeper', 'snyk-bot')
+
+    rows = []
+    for c in contributors:
+        login = c.get('github_login', '').lower()
+        if any(p in login for p in BOT_PATTERNS):
+            continue
+        rows.append((
+            c.get('github_login', ''),
+            c.get('github_url', ''),
+            c.get('name', ''),
+            c.get('email', ''),
+            c.get('blog', ''),
+            c.get('company', ''),
+            c.get('company_size', ''),
+            c.get('annual_revenue', ''),
+            c.get('repo_source', ''),
+            c.get('github_org', ''),
+            c.get('contributions', 0),
+            c.get('insight', ''),
+            c.get('is_org_member'),
+            c.get('github_profile_company', ''),
+            c.get('last_activity_at')
+        ))
 
+    with db_connection() as conn:
         try:
-            for c in contributors:
-                login = c.get('github_login', '').lower()
-                if any(p in login for p in BOT_PATTERNS):
-                    continue
-
-                cursor.execute('''
-                    INSERT INTO contributors (
-                        github_login, github_url, name, email, blog,
-                        company, company_size, annual_revenue, repo_source,
-                        github_org, contributions, insight,
-                        is_org_member, github_profile_company, last_activity_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(github_login, github_org) DO UPDATE SET
-                        name = COALESCE(NULLIF(excluded.name, ''), contributors.name),
-                        email = COALESCE(NULLIF(excluded.email, ''), contributors.email),
-                        blog = COALESCE(NULLIF(excluded.blog, ''), contributors.blog),
-                        company = COALESCE(NULLIF(excluded.company, ''), contributors.company),
-                        company_size = COALESCE(NULLIF(excluded.company_size, ''), contributors.company_size),
-                        annual_revenue = COALESCE(NULLIF(excluded.annual_revenue, ''), contributors.annual_revenue),
-                        repo_source = COALESCE(NULLIF(excluded.repo_source, ''), contributors.repo_source),
-                        contributions = CASE WHEN excluded.contributions > 0 THEN excluded.contributions ELSE contributors.contributions END,
-                        insight = COALESCE(NULLIF(excluded.insight, ''), contributors.insight),
-                        is_org_member = excluded.is_org_member,
-                        github_profile_company = COALESCE(NULLIF(excluded.github_profile_company, ''), contributors.github_profile_company),
-                        last_activity_at = COALESCE(excluded.last_activity_at, contributors.last_activity_at),
-                        updated_at = CURRENT_TIMESTAMP
-                ''', (
-                    c.get('github_login', ''),
-                    c.get('github_url', ''),
-                    c.get('name', ''),
-                    c.get('email', ''),
-                    c.get('blog', ''),
-                    c.get('company', ''),
-                    c.get('company_size', ''),
-                    c.get('annual_revenue', ''),
-                    c.get('repo_source', ''),
-                    c.get('github_org', ''),
-                    c.get('contributions', 0),
-                    c.get('insight', ''),
-                    c.get('is_org_member'),
-                    c.get('github_profile_company', ''),
-                    c.get('last_activity_at')
-                ))
-                saved += 1
-
-            conn.commit()
+            saved = _bulk_write(conn, '''
+                INSERT INTO contributors (
+                    github_login, github_url, name, email, blog,
+                    company, company_size, annual_revenue, repo_source,
+                    github_org, contributions, insight,
+                    is_org_member, github_profile_company, last_activity_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(github_login, github_org) DO UPDATE SET
+                    name = COALESCE(NULLIF(excluded.name, ''), contributors.name),
+                    email = COALESCE(NULLIF(excluded.email, ''), contributors.email),
+                    blog = COALESCE(NULLIF(excluded.blog, ''), contributors.blog),
+                    company = COALESCE(NULLIF(excluded.company, ''), contributors.company),
+                    company_size = COALESCE(NULLIF(excluded.company_size, ''), contributors.company_size),
+                    annual_revenue = COALESCE(NULLIF(excluded.annual_revenue, ''), contributors.annual_revenue),
+                    repo_source = COALESCE(NULLIF(excluded.repo_source, ''), contributors.repo_source),
+                    contributions = CASE WHEN excluded.contributions > 0 THEN excluded.contributions ELSE contributors.contributions END,
+                    insight = COALESCE(NULLIF(excluded.insight, ''), contributors.insight),
+                    is_org_member = excluded.is_org_member,
+                    github_profile_company = COALESCE(NULLIF(excluded.github_profile_company, ''), contributors.github_profile_company),
+                    last_activity_at = COALESCE(excluded.last_activity_at, contributors.last_activity_at),
+                    updated_at = CURRENT_TIMESTAMP
+            ''', rows, label='CONTRIBUTORS')
         except Exception as e:
             logging.error("[CONTRIBUTORS] Batch save error: %s", e)
             conn.rollback()
+            saved = 0
 
     return saved
 
@@ -5663,11 +6606,17 @@ def get_scorecard_datatable(
     search_value: str = '',
     cohort_filter: str = '',
     order_column: int = 1,
-    order_dir: str = 'desc'
+    order_dir: str = 'desc',
+    q: str = None
 ) -> dict:
     """
     Get scorecard scores in DataTables format for server-side processing.
 
+    search_value keeps the requested sort and matches word prefixes of the
+    account's company_name/github_org (via the account search index) or its
+    website domain. q matches the same words but sorts best matches first,
+    with the requested column as the tie-breaker.
+
     Column map: 0=company_name, 1=total_score, 2=cohort, 3=locale_count,
                 4=systems_score, 5=revenue_raw, 6=apollo_status.
     """
@@ -5685,8 +6634,7 @@ def get_scorecard_datatable(
         }
 
         # Total count (all scored accounts)
-        cursor.execute('SELECT COUNT(*) as total FROM scorecard_scores')
-        total_records = cursor.fetchone()['total']
+        total_records = _cached_count(cursor, 'SELECT COUNT(*) as total FROM scorecard_scores', ())
 
         # Build WHERE clause
         where_clauses = []
@@ -5696,17 +6644,35 @@ def get_scorecard_datatable(
             where_clauses.append('ss.cohort = ?')
             params.append(cohort_filter)
 
-        if search_value:
-            where_clauses.append('(LOWER(ss.company_name) LIKE ? OR LOWER(ma.website) LIKE ?)')
-            search_param = f'%{search_value.lower()}%'
-            params.extend([search_param, search_param])
+        search_match = _search_match_query(search_value)
+        search_domain = _extract_domain(search_value)
+        if search_match or '.' in search_domain:
+            search_clauses = []
+            if search_match:
+                search_clauses.append(_search_filter_sql('accounts', 'ss.account_id'))
+                params.append(search_match)
+            if '.' in search_domain:
+                if _backfill_account_dedup_keys(cursor):
+                    conn.commit()
+                search_clauses.append('ma.dedup_domain_key = ?')
+                params.append(search_domain)
+            where_clauses.append('(' + ' OR '.join(search_clauses) + ')')
+
+        # Ranked search joins the index so hits can be ordered by relevance
+        from_sql = ' FROM scorecard_scores ss LEFT JOIN monitored_accounts ma ON ma.id = ss.account_id'
+        rank_match = _search_match_query(q)
+        if rank_match:
+            from_sql += ' ' + _search_join_sql('accounts', 'fts', 'ss.account_id')
+            params.insert(0, rank_match)
 
         where_sql = (' WHERE ' + ' AND '.join(where_clauses)) if where_clauses else ''
 
         # Filtered count
-        count_query = 'SELECT COUNT(*) as total FROM scorecard_scores ss LEFT JOIN monitored_accounts ma ON ma.id = ss.account_id' + where_sql
-        cursor.execute(count_query, params)
-        filtered_records = cursor.fetchone()['total']
+        if where_clauses or rank_match:
+            count_query = 'SELECT COUNT(*) as total' + from_sql + where_sql
+            filtered_records = _cached_count(cursor, count_query, params)
+        else:
+            filtered_records = total_records
 
         # Whitelist-validated sort column
         sort_column = column_map.get(order_column, 'ss.total_score')
@@ -5714,11 +6680,11 @@ def get_scorecard_datatable(
         sort_order = 'DESC' if order_dir.lower() == 'desc' else 'ASC'
 
         # Paginated query with JOIN for website/github_org
-        select_query = '''
-            SELECT ss.*, ma.website, ma.github_org
-            FROM scorecard_scores ss
-            LEFT JOIN monitored_accounts ma ON ma.id = ss.account_id
-        ''' + where_sql + f' ORDER BY {sort_column} {sort_order} LIMIT ? OFFSET ?'
+        order_sql = f'{sort_column} {sort_order}'
+        if rank_match:
+            order_sql = 'fts.search_rank ASC, ' + order_sql
+        select_query = ('SELECT ss.*, ma.website, ma.github_org' + from_sql + where_sql +
+                        ' ORDER BY ' + order_sql + ' LIMIT ? OFFSET ?')
 
         select_params = list(params) + [length, start]
         cursor.execute(select_query, select_params)
@@ -5745,40 +6711,36 @@ def upsert_scorecard_scores(scores: list) -> int:
     Returns:
         Number of rows upserted.
     """
-    with db_connection() as conn:
-        cursor = conn.cursor()
-        count = 0
-
-        for s in scores:
-            cursor.execute('''
-                INSERT INTO scorecard_scores (
-                    account_id, company_name, annual_revenue, revenue_raw,
-                    locale_count, total_score, lang_score, revenue_score,
-                    cohort, has_loc_titles, has_app_loc, scored_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                ON CONFLICT(account_id) DO UPDATE SET
-                    company_name = excluded.company_name,
-                    annual_revenue = excluded.annual_revenue,
-                    revenue_raw = excluded.revenue_raw,
-                    locale_count = excluded.locale_count,
-                    lang_score = excluded.lang_score,
-                    revenue_score = excluded.revenue_score,
-                    total_score = excluded.lang_score + scorecard_scores.systems_score + excluded.revenue_score,
-                    cohort = excluded.cohort,
-                    has_loc_titles = excluded.has_loc_titles,
-                    has_app_loc = excluded.has_app_loc,
-                    scored_at = CURRENT_TIMESTAMP,
-                    updated_at = CURRENT_TIMESTAMP
-            ''', (
-                s['account_id'], s['company_name'], s.get('annual_revenue', ''),
-                s.get('revenue_raw', 0), s.get('locale_count', 0),
-                s.get('total_score', 0), s.get('lang_score', 0),
-                s.get('revenue_score', 0), s.get('cohort', 'B'),
-                s.get('has_loc_titles', 0), s.get('has_app_loc', 0)
-            ))
-            count += 1
-
-        conn.commit()
+    rows = [(
+        s['account_id'], s['company_name'], s.get('annual_revenue', ''),
+        s.get('revenue_raw', 0), s.get('locale_count', 0),
+        s.get('total_score', 0), s.get('lang_score', 0),
+        s.get('revenue_score', 0), s.get('cohort', 'B'),
+        s.get('has_loc_titles', 0), s.get('has_app_loc', 0)
+    ) for s in scores]
+
+    with db_connection() as conn:
+        count = _bulk_write(conn, '''
+            INSERT INTO scorecard_scores (
+                account_id, company_name, annual_revenue, revenue_raw,
+                locale_count, total_score, lang_score, revenue_score,
+                cohort, has_loc_titles, has_app_loc, scored_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+            ON CONFLICT(account_id) DO UPDATE SET
+                company_name = excluded.company_name,
+                annual_revenue = excluded.annual_revenue,
+                revenue_raw = excluded.revenue_raw,
+                locale_count = excluded.locale_count,
+                lang_score = excluded.lang_score,
+                revenue_score = excluded.revenue_score,
+                total_score = excluded.lang_score + scorecard_scores.systems_score + excluded.revenue_score,
+                cohort = excluded.cohort,
+                has_loc_titles = excluded.has_loc_titles,
+                has_app_loc = excluded.has_app_loc,
+                scored_at = CURRENT_TIMESTAMP,
+                updated_at = CURRENT_TIMESTAMP
+        ''', rows, label='SCORECARD')
+        _touch_accounts()
     return count
 
 
@@ -5867,6 +6829,7 @@ def create_campaign(name: str, prompt: str, assets: list, sequence_id: str = Non
         ''', (name, prompt, json.dumps(assets), sequence_id, sequence_name, sequence_config,
               contact_cap, verified_emails_only, review_in_tool, tone))
         conn.commit()
+    _touch_campaigns()
     return {'id': campaign_id, 'name': name}
 
 
@@ -5890,6 +6853,7 @@ def update_campaign(campaign_id: int, **kwargs) -> bool:
         ''', values)
         updated = cursor.rowcount > 0
         conn.commit()
+    _touch_campaigns()
     return updated
 
 
@@ -5900,6 +6864,7 @@ def delete_campaign(campaign_id: int) -> bool:
         cursor.execute('DELETE FROM campaigns WHERE id = ?', (campaign_id,))
         deleted = cursor.rowcount > 0
         conn.commit()
+    _touch_campaigns()
     return deleted
 
 
@@ -6277,6 +7242,118 @@ def update_enrollment_batch(batch_id: int, **kwargs) -> bool:
     return changed
 
 
+_ENROLLMENT_COUNTER_FIELDS = {'total_contacts', 'discovered', 'generated', 'enrolled', 'failed', 'skipped'}
+
+
+def _apply_enrollment_batch_progress(batch_id: int, deltas: dict, fields: dict) -> bool:
+    """Apply counter deltas (``col = col + ?``) and plain field sets in one UPDATE."""
+    deltas = {k: int(v) for k, v in deltas.items() if k in _ENROLLMENT_COUNTER_FIELDS and v}
+    fields = {k: v for k, v in fields.items() if k in ('current_phase', 'status', 'error_message')}
+    if not deltas and not fields:
+        return False
+    set_parts = [f'{k} = COALESCE({k}, 0) + ?' for k in deltas] + [f'{k} = ?' for k in fields]
+    values = list(deltas.values()) + list(fields.values()) + [batch_id]
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f'UPDATE enrollment_batches SET {", ".join(set_parts)} WHERE id = ?', values)
+        changed = cursor.rowcount > 0
+        conn.commit()
+    return changed
+
+
+def increment_enrollment_batch(batch_id: int, **deltas) -> bool:
+    """Atomically add deltas to an enrollment batch's counter columns.
+
+    Uses ``col = col + ?`` in a single UPDATE so concurrent workers (threads or
+    gunicorn processes) never lose increments the way read-modify-write does.
+    """
+    return _apply_enrollment_batch_progress(batch_id, deltas, {})
+
+
+class EnrollmentProgressWriter:
+    """Coalesce enrollment batch progress into at most one write per interval.
+
+    Workers call add() / set_phase() per contact; deltas accumulate in memory
+    and are flushed as a single atomic increment UPDATE once ``interval_ms``
+    has elapsed since the last write. flush() (or leaving the ``with`` block)
+    forces out whatever is pending.
+    """
+
+    def __init__(self, batch_id: int, interval_ms: int = 500):
+        self.batch_id = batch_id
+        self.interval = interval_ms / 1000.0
+        self._deltas = {}
+        self._fields = {}
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, **deltas) -> None:
+        with self._lock:
+            for k, v in deltas.items():
+                self._deltas[k] = self._deltas.get(k, 0) + v
+        self._maybe_flush()
+
+    def set_phase(self, current_phase: str) -> None:
+        with self._lock:
+            self._fields['current_phase'] = current_phase
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush >= self.interval:
+            self.flush()
+
+    def flush(self) -> bool:
+        with self._lock:
+            deltas, fields = self._deltas, self._fields
+            self._deltas, self._fields = {}, {}
+            self._last_flush = time.monotonic()
+        if not deltas and not fields:
+            return False
+        try:
+            return _apply_enrollment_batch_progress(self.batch_id, deltas, fields)
+        except Exception:
+            # Put the pending increments back so the next flush retries them
+            with self._lock:
+                for k, v in deltas.items():
+                    self._deltas[k] = self._deltas.get(k, 0) + v
+                for k, v in fields.items():
+                    self._fields.setdefault(k, v)
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.flush()
+
+
+def get_enrollment_account_context(account_ids: list) -> dict:
+    """Prefetch scorecard + evidence context for a set of accounts in one connection.
+
+    Returns {account_id: dict} where each dict holds the scorecard_scores row
+    (if any) plus the account's evidence_summary. Used by the enrollment
+    pipeline so email generation doesn't reload the same account per contact.
+    """
+    ids = sorted({int(a) for a in account_ids if a})
+    if not ids:
+        return {}
+    context = {}
+    placeholders = ','.join('?' * len(ids))
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            f'SELECT * FROM scorecard_scores WHERE account_id IN ({placeholders})', ids
+        )
+        for row in cursor.fetchall():
+            context[row['account_id']] = dict(row)
+        cursor.execute(
+            f'SELECT id, evidence_summary FROM monitored_accounts WHERE id IN ({placeholders})', ids
+        )
+        for row in cursor.fetchall():
+            context.setdefault(row['id'], {})['evidence_summary'] = row['evidence_summary'] or ''
+    return context
+
+
 def get_enrollment_batches_for_campaign(campaign_id: int) -> list:
     """Get all enrollment batches for a campaign, newest first."""
     with db_connection() as conn:
@@ -6314,27 +7391,29 @@ def create_enrollment_contact(batch_id: int, company_name: str, **kwargs) -> int
 
 
 def bulk_create_enrollment_contacts(contacts: list) -> int:
-    """Batch-insert enrollment contacts. Each dict must have batch_id and company_name."""
+    """Batch-insert enrollment contacts. Each dict must have batch_id and company_name.
+
+    Contacts are grouped by the optional columns they set (the rest keep
+    their column defaults) and each group is written with _bulk_write; a
+    contact rejected by the unique domain/person index is skipped.
+    """
     if not contacts:
         return 0
+    optional = ('account_id', 'company_domain', 'persona_name', 'sequence_id',
+                'sequence_name', 'apollo_person_id', 'first_name', 'last_name',
+                'email', 'title', 'seniority', 'linkedin_url', 'status')
+    groups = {}
+    for c in contacts:
+        cols = ('batch_id', 'company_name') + tuple(k for k in optional if c.get(k) is not None)
+        groups.setdefault(cols, []).append(tuple(c[k] for k in cols))
+
+    count = 0
     with db_connection() as conn:
-        cursor = conn.cursor()
-        count = 0
-        for c in contacts:
-            cols = ['batch_id', 'company_name']
-            vals = [c['batch_id'], c['company_name']]
-            optional = {'account_id', 'company_domain', 'persona_name', 'sequence_id',
-                         'sequence_name', 'apollo_person_id', 'first_name', 'last_name',
-                         'email', 'title', 'seniority', 'linkedin_url', 'status'}
-            for k in optional:
-                if k in c and c[k] is not None:
-                    cols.append(k)
-                    vals.append(c[k])
+        for cols, rows in groups.items():
             placeholders = ', '.join('?' * len(cols))
             col_names = ', '.join(cols)
-            cursor.execute(f'INSERT INTO enrollment_contacts ({col_names}) VALUES ({placeholders})', vals)
-            count += 1
-        conn.commit()
+            count += _bulk_write(conn, f'INSERT INTO enrollment_contacts ({col_names}) VALUES ({placeholders})',
+                                 rows, label='ENROLLMENT')
     return count
 
 
@@ -6399,12 +7478,150 @@ def get_next_contacts_for_phase(batch_id: int, current_status: str, limit: int =
     return contacts
 
 
+# ---------------------------------------------------------------------------
+# Batched Event Logging
+# ---------------------------------------------------------------------------
+
+# Event rows (audit_log here, activity_log in v2 activity_service) go onto a
+# bounded in-process queue and a daemon thread writes them in multi-row
+# batches, so logging does not add a write transaction to every request.
+# When a queue is full the logging caller writes a batch itself
+# (backpressure) instead of dropping events. Events are timestamped when
+# logged, not when written. flush_event_logs() writes everything now.
+_EVENT_LOG_QUEUE_SIZE = 10000
+_EVENT_LOG_BATCH_SIZE = 500
+_EVENT_LOG_FLUSH_INTERVAL_SECONDS = 1.0
+
+_event_log_sinks = []
+
+
+class EventLogSink:
+    """Bounded queue of rows for one log table, written in batches by a background thread."""
+
+    def __init__(self, name: str, insert_sql: str, max_queue: int = _EVENT_LOG_QUEUE_SIZE,
+                 batch_size: int = _EVENT_LOG_BATCH_SIZE,
+                 interval: float = _EVENT_LOG_FLUSH_INTERVAL_SECONDS):
+        self.name = name
+        self.insert_sql = insert_sql
+        self.batch_size = batch_size
+        self.interval = interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._wake = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._flusher = None
+        _event_log_sinks.append(self)
+
+    def log(self, row: tuple) -> None:
+        """Queue one row (a tuple matching insert_sql's placeholders)."""
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            # Backpressure: write a batch in the caller's thread, then retry
+            try:
+                self.flush()
+                self._queue.put_nowait(row)
+            except Exception as e:
+                logging.error("[%s] Event log full and flush failed, dropping event: %s", self.name, e)
+                return
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+        self._ensure_flusher()
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def _ensure_flusher(self) -> None:
+        # Also restarts the thread in a forked worker, where it does not survive
+        if self._flusher is None or not self._flusher.is_alive():
+            with self._start_lock:
+                if self._flusher is None or not self._flusher.is_alive():
+                    self._flusher = threading.Thread(target=self._run, name=f'{self.name}-flusher',
+                                                     daemon=True)
+                    self._flusher.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logging.error("[%s] Event log flush failed, will retry: %s", self.name, e)
+
+    def flush(self) -> int:
+        """Write every queued row now; returns the number written."""
+        with self._flush_lock:
+            rows = []
+            while True:
+                try:
+                    rows.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not rows:
+                return 0
+            # One _bulk_write per batch, so a failure knows which rows are committed
+            written = 0
+            committed = 0
+            try:
+                with db_connection() as conn:
+                    while committed < len(rows):
+                        batch = rows[committed:committed + self.batch_size]
+                        written += _bulk_write(conn, self.insert_sql, batch,
+                                               chunk_size=len(batch), label=self.name)
+                        committed += len(batch)
+                return written
+            except Exception:
+                # Requeue what fits of the uncommitted rows so the next flush retries them
+                dropped = 0
+                for row in rows[committed:]:
+                    try:
+                        self._queue.put_nowait(row)
+                    except queue.Full:
+                        dropped += 1
+                if dropped:
+                    logging.error("[%s] Dropped %d events after a failed flush", self.name, dropped)
+                raise
+
+    def flush_before_read(self) -> None:
+        """Read-your-writes flush for readers; a failed write is logged, never raised."""
+        try:
+            self.flush()
+        except Exception as e:
+            logging.error("[%s] Flush before read failed: %s", self.name, e)
+
+
+def _event_timestamp() -> str:
+    """Current UTC time in the format CURRENT_TIMESTAMP column defaults use."""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def flush_event_logs() -> int:
+    """Write all queued audit/activity events now; returns the number written."""
+    written = 0
+    for sink in list(_event_log_sinks):
+        try:
+            written += sink.flush()
+        except Exception as e:
+            logging.error("[%s] Event log flush failed: %s", sink.name, e)
+    return written
+
+
+atexit.register(flush_event_logs)
+
+
 # ---------------------------------------------------------------------------
 # Audit Logging
 # ---------------------------------------------------------------------------
 
+_audit_log_sink = EventLogSink('AUDIT', '''
+    INSERT INTO audit_log (timestamp, action, user_or_key, details, ip_address)
+    VALUES (?, ?, ?, ?, ?)
+''')
+
+
 def log_audit_event(action: str, details: str = None, user_or_key: str = None, ip_address: str = None):
-    """Write a row to the audit_log table.
+    """Queue a row for the audit_log table (written in batches; see EventLogSink).
 
     Args:
         action: Short action name, e.g. 'apollo_enrollment', 'email_send', 'auth_failure'.
@@ -6414,18 +7631,7 @@ def log_audit_event(action: str, details: str = None, user_or_key: str = None, i
     """
     if details and len(details) > 2000:
         details = details[:2000]
-    try:
-        with db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO audit_log (action, user_or_key, details, ip_address)
-                VALUES (?, ?, ?, ?)
-            ''', (action, user_or_key, details, ip_address))
-            conn.commit()
-    except Exception as e:
-        # Never let audit logging break the main request
-        import logging
-        logging.error(f"[AUDIT] Failed to log event: {e}")
+    _audit_log_sink.log((_event_timestamp(), action, user_or_key, details, ip_address))
 
 
 def get_recent_audit_logs(limit: int = 100, action_filter: str = None) -> list:
@@ -6438,6 +7644,7 @@ def get_recent_audit_logs(limit: int = 100, action_filter: str = None) -> list:
     Returns:
         List of audit log dicts.
     """
+    _audit_log_sink.flush_before_read()
     with db_connection() as conn:
         cursor = conn.cursor()
         if action_filter:
@@ -6455,6 +7662,241 @@ def get_recent_audit_logs(limit: int = 100, action_filter: str = None) -> list:
     return rows
 
 
+# ---------------------------------------------------------------------------
+# Log Retention
+# ---------------------------------------------------------------------------
+
+# Append-only logs keep their live table "hot": only the last N days stay in
+# it, so recent-activity reads never scan history. rotate_event_logs() rolls
+# older rows up into log_daily_rollups (row count per table, day and event
+# key), moves them to {table}_archive and then compacts archived rows past
+# the table's retention. On PostgreSQL the archive is range-partitioned by
+# month and compaction drops whole partitions; on SQLite it is a plain table
+# and compaction deletes by time range.
+_LOG_TABLES = {
+    # table: (time column, rollup key expression)
+    'activity_log': ('created_at', 'event_type'),
+    'audit_log': ('timestamp', 'action'),
+    'webhook_logs': ('timestamp', 'event_type'),
+    'feedback_log': ('created_at', "COALESCE(created_by, '')"),
+}
+
+# Archive indexes beyond the time column, for readers that page into history
+_LOG_ARCHIVE_INDEXES = {
+    'activity_log': ('entity_type, entity_id',),
+}
+
+# (hot days, archive retention days); override per table with
+# e.g. ACTIVITY_LOG_HOT_DAYS / ACTIVITY_LOG_RETENTION_DAYS
+_LOG_RETENTION_DEFAULTS = {
+    'activity_log': (30, 365),
+    'audit_log': (30, 365),
+    'webhook_logs': (14, 90),
+    'feedback_log': (180, 730),
+}
+
+
+def get_log_retention_policy(table: str) -> tuple:
+    """(hot_days, retention_days) for a rotated log table."""
+    if table not in _LOG_TABLES:
+        raise ValueError(f"Not a rotated log table: {table}")
+    hot_days, retention_days = _LOG_RETENTION_DEFAULTS[table]
+    prefix = table.upper()
+    hot_days = int(os.environ.get(f'{prefix}_HOT_DAYS', hot_days))
+    retention_days = int(os.environ.get(f'{prefix}_RETENTION_DAYS', retention_days))
+    return hot_days, max(retention_days, hot_days)
+
+
+def _log_cutoff(days: int) -> datetime:
+    """UTC midnight ``days`` days ago; rotation always moves whole days."""
+    today = datetime.now(timezone.utc).replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=days)
+
+
+def _table_columns(cursor, table: str) -> list:
+    """Column names in table order ([] if the table does not exist)."""
+    if _USE_POSTGRES:
+        cursor.execute('''
+            SELECT column_name AS name FROM information_schema.columns
+            WHERE table_name = ? ORDER BY ordinal_position
+        ''', (table,))
+    else:
+        cursor.execute(f"PRAGMA table_info({table})")
+    return [row['name'] for row in cursor.fetchall()]
+
+
+def _ensure_log_archive(cursor, table: str, time_col: str, columns: list):
+    """Create {table}_archive shaped like ``table`` and add any newer columns."""
+    archive = f'{table}_archive'
+    if _USE_POSTGRES:
+        # LIKE copies column types and NOT NULLs but not the id sequence default
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS {archive} (LIKE {table})
+            PARTITION BY RANGE ({time_col})
+        ''')
+    else:
+        cursor.execute(f'CREATE TABLE IF NOT EXISTS {archive} AS SELECT * FROM {table} WHERE 0')
+    cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_{archive}_time ON {archive}({time_col})')
+    for i, index_cols in enumerate(_LOG_ARCHIVE_INDEXES.get(table, ())):
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_{archive}_{i} ON {archive}({index_cols})')
+
+    archived = set(_table_columns(cursor, archive))
+    if _USE_POSTGRES:
+        cursor.execute('''
+            SELECT column_name, data_type FROM information_schema.columns WHERE table_name = ?
+        ''', (table,))
+        types = {row['column_name']: row['data_type'] for row in cursor.fetchall()}
+    for col in columns:
+        if col not in archived:
+            col_type = types[col] if _USE_POSTGRES else ''
+            cursor.execute(f'ALTER TABLE {archive} ADD COLUMN {col} {col_type}'.rstrip())
+
+
+def _init_log_archives(cursor):
+    """Create every log table's archive up front, so readers can always query it."""
+    for table, (time_col, _) in _LOG_TABLES.items():
+        columns = _table_columns(cursor, table)
+        if columns:
+            _ensure_log_archive(cursor, table, time_col, columns)
+
+
+def _month_start(dt: datetime) -> datetime:
+    return dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month(dt: datetime) -> datetime:
+    return (_month_start(dt) + timedelta(days=32)).replace(day=1)
+
+
+def _log_partitions(cursor, archive: str) -> dict:
+    """{month start: partition name} for a partitioned archive (PostgreSQL)."""
+    cursor.execute('''
+        SELECT c.relname FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        WHERE p.relname = ?
+    ''', (archive,))
+    partitions = {}
+    for row in cursor.fetchall():
+        name = row['relname']
+        suffix = name.rsplit('_p', 1)[-1]
+        if suffix.isdigit() and len(suffix) == 6:
+            partitions[datetime(int(suffix[:4]), int(suffix[4:]), 1)] = name
+    return partitions
+
+
+def _ensure_log_partitions(cursor, archive: str, oldest: datetime, cutoff: datetime):
+    """Create the monthly partitions covering [oldest, cutoff) (PostgreSQL)."""
+    month = _month_start(oldest)
+    while month < cutoff:
+        upper = _next_month(month)
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS {archive}_p{month:%Y%m} PARTITION OF {archive}
+            FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')
+        ''')
+        month = upper
+
+
+def _rotate_log_table(conn, table: str, hot_days: int, retention_days: int) -> dict:
+    """Roll up, archive and compact one log table; commits once at the end."""
+    time_col, key_expr = _LOG_TABLES[table]
+    archive = f'{table}_archive'
+    cursor = conn.cursor()
+    columns = _table_columns(cursor, table)
+    if not columns:
+        return {'archived': 0, 'compacted': 0}
+    _ensure_log_archive(cursor, table, time_col, columns)
+
+    hot_cutoff = _log_cutoff(hot_days)
+    keep_cutoff = _log_cutoff(retention_days)
+    hot_bound = hot_cutoff.strftime('%Y-%m-%d %H:%M:%S')
+    keep_bound = keep_cutoff.strftime('%Y-%m-%d %H:%M:%S')
+
+    cursor.execute(f'SELECT MIN({time_col}) AS oldest FROM {table} WHERE {time_col} < ?', (hot_bound,))
+    oldest = cursor.fetchone()['oldest']
+    archived = 0
+    if oldest is not None:
+        day_expr = f"to_char({time_col}, 'YYYY-MM-DD')" if _USE_POSTGRES else f"substr({time_col}, 1, 10)"
+        cursor.execute(f'''
+            INSERT INTO log_daily_rollups (log_table, day, event_key, event_count)
+            SELECT ?, {day_expr}, {key_expr}, COUNT(*)
+            FROM {table}
+            WHERE {time_col} < ?
+            GROUP BY {day_expr}, {key_expr}
+            ON CONFLICT(log_table, day, event_key)
+            DO UPDATE SET event_count = log_daily_rollups.event_count + excluded.event_count
+        ''', (table, hot_bound))
+        if _USE_POSTGRES:
+            if isinstance(oldest, str):
+                oldest = datetime.strptime(oldest[:10], '%Y-%m-%d')
+            _ensure_log_partitions(cursor, archive, oldest, hot_cutoff)
+        column_list = ', '.join(columns)
+        cursor.execute(f'''
+            INSERT INTO {archive} ({column_list})
+            SELECT {column_list} FROM {table} WHERE {time_col} < ?
+        ''', (hot_bound,))
+        cursor.execute(f'DELETE FROM {table} WHERE {time_col} < ?', (hot_bound,))
+        archived = cursor.rowcount
+
+    compacted = 0
+    if _USE_POSTGRES:
+        for month, name in sorted(_log_partitions(cursor, archive).items()):
+            if _next_month(month) <= keep_cutoff:
+                cursor.execute(f'SELECT COUNT(*) AS cnt FROM {name}')
+                compacted += cursor.fetchone()['cnt']
+                cursor.execute(f'DROP TABLE {name}')
+    # The partition straddling the cutoff (all of it on SQLite) is trimmed by rows
+    cursor.execute(f'DELETE FROM {archive} WHERE {time_col} < ?', (keep_bound,))
+    compacted += cursor.rowcount
+    conn.commit()
+    return {'archived': archived, 'compacted': compacted}
+
+
+def rotate_event_logs(policies: dict = None) -> dict:
+    """Archive log rows older than each table's hot window and compact old archives.
+
+    Rows leaving a hot table are first counted into log_daily_rollups, so
+    per-day totals survive compaction. Queued events are flushed first.
+
+    Args:
+        policies: Optional {table: (hot_days, retention_days)} overriding
+            get_log_retention_policy() for the given tables.
+
+    Returns:
+        {table: {'archived': n, 'compacted': n}}
+    """
+    flush_event_logs()
+    results = {}
+    for table in _LOG_TABLES:
+        hot_days, retention_days = (policies or {}).get(table) or get_log_retention_policy(table)
+        try:
+            with db_connection() as conn:
+                results[table] = _rotate_log_table(conn, table, hot_days, retention_days)
+        except Exception as e:
+            logging.error("[LOGS] Rotating %s failed: %s", table, e)
+            continue
+        if any(results[table].values()):
+            logging.info("[LOGS] %s: archived %d rows, compacted %d",
+                         table, results[table]['archived'], results[table]['compacted'])
+    return results
+
+
+def get_log_rollup_counts(table: str, since_day: str) -> dict:
+    """Daily-rollup totals per event key for days on or after ``since_day``.
+
+    Rollups only cover rows already rotated out of the hot table, so these
+    counts never overlap a count taken over the hot table.
+    """
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT event_key, SUM(event_count) AS cnt FROM log_daily_rollups
+            WHERE log_table = ? AND day >= ?
+            GROUP BY event_key
+        ''', (table, since_day))
+        return {row['event_key']: int(row['cnt']) for row in cursor.fetchall()}
+
+
 # ---------------------------------------------------------------------------
 # Database Health Metrics
 # ---------------------------------------------------------------------------
@@ -6466,7 +7908,7 @@ _ALL_TABLES = [
     'website_analyses', 'webscraper_accounts', 'contributors',
     'scorecard_scores', 'campaigns', 'sequence_mappings', 'campaign_personas',
     'enrollment_batches', 'enrollment_contacts', 'audit_log',
-    'pipeline_runs', 'pipeline_step_results',
+    'pipeline_runs', 'pipeline_step_results', 'log_daily_rollups',
 ]
 
 
@@ -6569,3 +8011,8 @@ def get_active_campaign_for_signal(signal_type: str) -> Optional[dict]:
         if c.get('status') == 'active':
             return get_campaign(c['id'])
     return None
+
+
+# Initialize database on module import (last, so startup tasks can use
+# anything defined in this module)
+init_db()
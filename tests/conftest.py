@@ -394,6 +394,9 @@ def test_db(tmp_path, monkeypatch):
 
     yield db_path
 
+    # Write queued activity/audit events into this test's database, not the next one's
+    database.flush_event_logs()
+
 
 @pytest.fixture
 def flask_app(test_db, monkeypatch):
@@ -684,3 +687,79 @@ def sample_enrollment_contacts():
             'status': 'discovered',
         },
     ]
+
+
+# ---------------------------------------------------------------------------
+# Local fake Apollo server
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def fake_apollo_server(monkeypatch):
+    """Run a local HTTP server that impersonates the Apollo API.
+
+    Point apollo_client at it via APOLLO_API_BASE_URL. Configure per-path
+    responses with ``server.routes[path] = callable(body) -> dict`` and an
+    artificial latency with ``server.delay``; every request is recorded in
+    ``server.hits`` as (path, body) and peak concurrency in ``server.max_inflight``.
+    """
+    import threading
+    import time as _time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _State:
+        def __init__(self):
+            self.routes = {}
+            self.hits = []
+            self.delay = 0.0
+            self.lock = threading.Lock()
+            self.inflight = 0
+            self.max_inflight = 0
+
+        def count(self, path):
+            with self.lock:
+                return sum(1 for p, _ in self.hits if p == path)
+
+    state = _State()
+
+    class _Handler(BaseHTTPRequestHandler):
+        def _respond(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            raw = self.rfile.read(length) if length else b''
+            body = json.loads(raw) if raw else {}
+            with state.lock:
+                state.hits.append((self.path, body))
+                state.inflight += 1
+                state.max_inflight = max(state.max_inflight, state.inflight)
+            if state.delay:
+                _time.sleep(state.delay)
+            with state.lock:
+                state.inflight -= 1
+            route = state.routes.get(self.path)
+            if route is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            payload = json.dumps(route(body)).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_POST = _respond
+        do_GET = _respond
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.base_url = f'http://127.0.0.1:{server.server_address[1]}'
+    monkeypatch.setenv('APOLLO_API_KEY', 'test-key-123')
+    monkeypatch.setenv('APOLLO_API_BASE_URL', state.base_url)
+    try:
+        yield state
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,165 @@
+"""
+Tests for duplicate-account detection: cleanup_duplicate_accounts,
+find_duplicate_account_groups and find_potential_duplicates.
+
+Rows are inserted with raw SQL so duplicates exist before cleanup runs
+(init_db removes them on startup).
+"""
+import sqlite3
+
+import pytest
+
+
+pytestmark = pytest.mark.integration
+
+
+def _insert(db_path, rows):
+    """Insert (company_name, github_org, website, current_tier, last_scanned_at) rows; returns ids."""
+    conn = sqlite3.connect(db_path)
+    ids = [conn.execute(
+        "INSERT INTO monitored_accounts (company_name, github_org, website, current_tier, last_scanned_at) "
+        "VALUES (?, ?, ?, ?, ?)", row).lastrowid for row in rows]
+    conn.commit()
+    conn.close()
+    return ids
+
+
+def _account_ids(db_path):
+    conn = sqlite3.connect(db_path)
+    ids = [r[0] for r in conn.execute("SELECT id FROM monitored_accounts ORDER BY id")]
+    conn.close()
+    return ids
+
+
+class TestCleanupDuplicateAccounts:
+
+    def test_keeps_best_account_per_name_and_org(self, test_db):
+        import database
+        ids = _insert(test_db, [
+            ('Acme', None, None, 1, '2024-01-01'),
+            ('ACME', None, None, 2, None),
+            ('acme', None, None, 2, '2024-01-01'),
+            ('Globex', 'globex', None, 0, None),
+            ('Globex Corporation', 'GlobEx', None, 0, None),
+            ('Initech', '', None, 0, None),
+            ('Initrode', '', None, 0, None),
+        ])
+
+        result = database.cleanup_duplicate_accounts()
+
+        assert result['deleted'] == 3
+        assert result['kept'] == 2
+        assert [(g['type'], g['kept_id'], g['removed_ids']) for g in result['groups']] == [
+            ('name', ids[2], [ids[0], ids[1]]),
+            ('org', ids[4], [ids[3]]),
+        ]
+        assert _account_ids(test_db) == [ids[2], ids[4], ids[5], ids[6]]
+
+    def test_groups_linked_by_name_and_org_merge(self, test_db):
+        from database import find_duplicate_account_groups
+        ids = _insert(test_db, [
+            ('Umbrella', 'umbrella-corp', None, 0, None),
+            ('UMBRELLA', None, None, 0, None),
+            ('Umbrella Pharma', 'Umbrella-Corp', None, 0, None),
+        ])
+
+        groups = find_duplicate_account_groups()
+
+        assert len(groups) == 1
+        assert groups[0]['type'] == 'name+org'
+        assert groups[0]['kept_id'] == ids[2]
+        assert groups[0]['removed_ids'] == ids[:2]
+
+    def test_dry_run_previews_without_deleting(self, test_db):
+        import database
+        ids = _insert(test_db, [('Hooli', None, None, 0, None), ('hooli', None, None, 0, None)])
+
+        result = database.cleanup_duplicate_accounts(dry_run=True)
+
+        assert result['dry_run'] is True
+        assert result['deleted'] == 1
+        assert result['groups'][0]['removed_ids'] == [ids[0]]
+        assert _account_ids(test_db) == ids
+
+    def test_children_move_to_kept_account(self, test_db):
+        import database
+        from v2.services.signal_service import create_signal
+        keep_id, dup_id = _insert(test_db, [('Stark', None, None, 3, None), ('stark', None, None, 0, None)])
+        signal_id = create_signal(account_id=dup_id, signal_description='Hiring localization lead')
+        conn = sqlite3.connect(test_db)
+        conn.execute("INSERT INTO website_analyses (account_id, company_name, website_url) "
+                     "VALUES (?, 'stark', 'stark.com')", (dup_id,))
+        conn.commit()
+        conn.close()
+
+        database.cleanup_duplicate_accounts()
+
+        conn = sqlite3.connect(test_db)
+        assert conn.execute("SELECT account_id FROM intent_signals WHERE id = ?",
+                            (signal_id,)).fetchone()[0] == keep_id
+        assert conn.execute("SELECT account_id FROM website_analyses").fetchone()[0] == keep_id
+        conn.close()
+
+    def test_opt_in_normalized_name_and_domain_keys(self, test_db):
+        from database import find_duplicate_account_groups
+        ids = _insert(test_db, [
+            ('Wayne Enterprises', None, 'https://wayne.com', 0, None),
+            ('Wayne Enterprises, Inc.', None, None, 0, None),
+            ('Wayne Holdings', None, 'http://www.wayne.com/about', 0, None),
+            ('Other', None, None, 0, None),
+        ])
+
+        assert find_duplicate_account_groups() == []
+        assert find_duplicate_account_groups(('normalized_name',))[0]['removed_ids'] == ids[:1]
+
+        groups = find_duplicate_account_groups(('normalized_name', 'domain'))
+        assert [(g['type'], g['kept_id'], g['removed_ids']) for g in groups] == [
+            ('normalized_name+domain', ids[2], ids[:2]),
+        ]
+
+        with pytest.raises(ValueError):
+            find_duplicate_account_groups(('bogus',))
+
+    def test_renamed_account_keys_are_recomputed(self, test_db):
+        from database import find_duplicate_account_groups
+        ids = _insert(test_db, [('Soylent Co', None, None, 0, None), ('Soylent', None, None, 0, None)])
+        assert len(find_duplicate_account_groups(('normalized_name',))) == 1
+
+        conn = sqlite3.connect(test_db)
+        conn.execute("UPDATE monitored_accounts SET company_name = 'Tyrell' WHERE id = ?", (ids[0],))
+        conn.commit()
+        conn.close()
+        assert find_duplicate_account_groups(('normalized_name',)) == []
+
+
+class TestFindPotentialDuplicates:
+
+    def test_match_reasons(self, test_db):
+        import database
+        ids = _insert(test_db, [
+            ('Acme Robotics', None, None, 0, None),
+            ('Acme Robotics Inc', None, None, 0, None),
+            ('Acme Robotics Europe', None, None, 0, None),
+            ('Roadrunner', 'acme-gh', None, 0, None),
+            ('Coyote', None, 'https://www.acme.io/', 0, None),
+            ('Acmeish Thing', None, None, 0, None),
+        ])
+
+        matches = database.find_potential_duplicates(
+            'acme robotics', github_org='ACME-GH', website='acme.io/contact')
+
+        reasons = {m['id']: (m['match_reason'], m['match_confidence']) for m in matches}
+        assert reasons == {
+            ids[0]: ('exact_name', 100),
+            ids[1]: ('normalized_name', 80),
+            ids[2]: ('partial_name', 50),
+            ids[3]: ('github_org', 100),
+            ids[4]: ('website_domain', 100),
+        }
+        assert [m['match_confidence'] for m in matches] == sorted(
+            (m['match_confidence'] for m in matches), reverse=True)
+
+    def test_no_matches(self, test_db):
+        import database
+        _insert(test_db, [('Acme', None, None, 0, None)])
+        assert database.find_potential_duplicates('Initech', website='initech.com') == []
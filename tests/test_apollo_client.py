@@ -0,0 +1,158 @@
+"""
+Tests for apollo_client request coalescing (single-flight) and bulk enrichment.
+
+Concurrency tests run against the local fake Apollo server fixture so the
+upstream call count is measured at the HTTP layer, not via mocks.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import apollo_client
+from apollo_client import SingleFlight, apollo_api_call_coalesced, bulk_match_people
+
+
+pytestmark = pytest.mark.unit
+
+SEARCH_PATH = '/api/v1/mixed_people/api_search'
+SEARCH_URL = 'https://api.apollo.io' + SEARCH_PATH
+
+
+@pytest.fixture(autouse=True)
+def _unlimited_rate(monkeypatch):
+    monkeypatch.setattr(apollo_client, 'rate_limiter',
+                        apollo_client.ApolloRateLimiter(max_requests=10_000))
+
+
+def _concurrent(n, fn):
+    barrier = threading.Barrier(n)
+
+    def _run(_):
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        return list(pool.map(_run, range(n)))
+
+
+class TestSingleFlight:
+
+    def test_sequential_calls_are_not_cached(self):
+        sf = SingleFlight()
+        calls = []
+        assert sf.do('k', lambda: calls.append(1) or 'a') == 'a'
+        assert sf.do('k', lambda: calls.append(1) or 'b') == 'b'
+        assert len(calls) == 2
+        assert sf.coalesced == 0
+
+    def test_error_propagates_to_all_waiters(self):
+        sf = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def _boom():
+            started.set()
+            release.wait(2)
+            raise RuntimeError('upstream down')
+
+        errors = []
+
+        def _call():
+            try:
+                sf.do('k', _boom)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        leader = threading.Thread(target=_call)
+        leader.start()
+        started.wait(2)
+        followers = [threading.Thread(target=_call) for _ in range(3)]
+        for t in followers:
+            t.start()
+        deadline = time.monotonic() + 2
+        while sf.coalesced < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        for t in [leader, *followers]:
+            t.join(2)
+        assert errors == ['upstream down'] * 4
+
+
+class TestCoalescedApolloCall:
+
+    def test_identical_concurrent_searches_share_one_upstream_call(self, fake_apollo_server):
+        fake_apollo_server.delay = 0.3
+        fake_apollo_server.routes[SEARCH_PATH] = lambda body: {'people': [{'id': 'p1'}]}
+        body = {'q_organization_domains_list': ['acme.com'], 'person_titles': ['CTO']}
+
+        responses = _concurrent(8, lambda: apollo_api_call_coalesced('post', SEARCH_URL, json=dict(body)))
+
+        assert fake_apollo_server.count(SEARCH_PATH) == 1
+        assert all(r.status_code == 200 for r in responses)
+        assert all(r.json()['people'][0]['id'] == 'p1' for r in responses)
+
+    def test_different_payloads_are_not_coalesced(self, fake_apollo_server):
+        fake_apollo_server.delay = 0.2
+        fake_apollo_server.routes[SEARCH_PATH] = lambda body: {'people': [], 'echo': body['person_titles']}
+
+        titles = [['CTO'], ['VP Engineering'], ['CTO'], ['VP Engineering']]
+        it = iter(titles)
+        lock = threading.Lock()
+
+        def _call():
+            with lock:
+                t = next(it)
+            return apollo_api_call_coalesced('post', SEARCH_URL, json={'person_titles': t})
+
+        responses = _concurrent(4, _call)
+        assert fake_apollo_server.count(SEARCH_PATH) == 2
+        assert sorted(r.json()['echo'][0] for r in responses) == ['CTO', 'CTO', 'VP Engineering', 'VP Engineering']
+
+    def test_key_ignores_json_key_order(self, fake_apollo_server):
+        fake_apollo_server.delay = 0.3
+        fake_apollo_server.routes[SEARCH_PATH] = lambda body: {'people': []}
+        bodies = iter([{'a': 1, 'b': 2}, {'b': 2, 'a': 1}])
+        lock = threading.Lock()
+
+        def _call():
+            with lock:
+                b = next(bodies)
+            return apollo_api_call_coalesced('post', SEARCH_URL, json=b)
+
+        _concurrent(2, _call)
+        assert fake_apollo_server.count(SEARCH_PATH) == 1
+
+
+BULK_PATH = '/api/v1/people/bulk_match'
+MATCH_PATH = '/api/v1/people/match'
+
+
+class TestBulkMatchPeople:
+
+    def test_chunks_ids_into_groups_of_ten(self, fake_apollo_server):
+        fake_apollo_server.routes[BULK_PATH] = lambda body: {
+            'matches': [{'id': d['id'], 'email': f"{d['id']}@x.com"} for d in body['details']]}
+
+        result = bulk_match_people([f'p{i}' for i in range(23)] + ['p0', None])
+
+        assert fake_apollo_server.count(BULK_PATH) == 3
+        sizes = [len(b['details']) for p, b in fake_apollo_server.hits if p == BULK_PATH]
+        assert sizes == [10, 10, 3]
+        assert len(result) == 23
+        assert result['p22']['email'] == 'p22@x.com'
+
+    def test_unmatched_entries_map_to_none(self, fake_apollo_server):
+        fake_apollo_server.routes[BULK_PATH] = lambda body: {'matches': [{'id': 'a'}, None]}
+        assert bulk_match_people(['a', 'b']) == {'a': {'id': 'a'}, 'b': None}
+
+    def test_falls_back_to_single_match_when_bulk_unavailable(self, fake_apollo_server):
+        fake_apollo_server.routes[MATCH_PATH] = lambda body: (
+            {'person': {'id': body['id']}} if body['id'] != 'gone' else {})
+
+        result = bulk_match_people(['a', 'b', 'gone'])
+
+        assert fake_apollo_server.count(BULK_PATH) == 1
+        assert fake_apollo_server.count(MATCH_PATH) == 3
+        assert result == {'a': {'id': 'a'}, 'b': {'id': 'b'}, 'gone': None}
@@ -7,12 +7,15 @@ so there is no cross-test contamination.
 
 Tested functions:
   - save_report()
+  - backfill_report_scorecards()
+  - reports.is_latest upkeep (get_paginated_reports / delete_report_by_id)
   - save_signals()
   - update_account_status()  (the main tier-update path)
   - enrich_existing_account()
   - calculate_tier_from_scan()
-  - auto_retier_if_version_changed()
+  - auto_retier_if_version_changed()  (streamed, chunked, tier_audit_log progress)
   - add_account_to_tier_0()
+  - parse_revenue_usd() / backfill_account_revenue_usd()
   - update_account_metadata()
   - set_setting() / get_setting()
 """
@@ -260,6 +263,131 @@ class TestSaveReport:
         assert len(report['scan_data']['repos_scanned']) == 500
         assert len(report['ai_analysis']['details']) == 100_000
 
+    def test_scorecard_columns_projected(self, fresh_db):
+        """scoring_v2 fields are denormalized into report columns at write time."""
+        scan_data = _minimal_scan_data(scoring_v2={
+            'org_maturity_level': 'PREPARING',
+            'org_maturity_label': 'Preparing',
+            'org_intent_score': 71,
+            'readiness_index': '0.5',
+            'confidence_percent': 'n/a',
+            'outreach_angle_label': 'Pre-launch',
+            'risk_level': 'low',
+        })
+        rid = save_report('ScoreCo', 'scoreco', scan_data, {}, 1.0)
+
+        row = _raw_query_one(fresh_db, 'SELECT * FROM reports WHERE id = ?', (rid,))
+        assert row['scorecard_extracted'] == 1
+        assert row['org_maturity_level'] == 'PREPARING'
+        assert row['org_intent_score'] == 71.0
+        assert row['readiness_index'] == 0.5
+        assert row['confidence_percent'] is None
+        assert row['risk_level'] == 'low'
+
+    def test_scorecard_columns_null_without_scoring(self, fresh_db):
+        """Reports without scoring_v2 are marked extracted with NULL columns."""
+        rid = save_report('PlainCo', 'plainco', _minimal_scan_data(), {}, 1.0)
+
+        row = _raw_query_one(fresh_db, 'SELECT * FROM reports WHERE id = ?', (rid,))
+        assert row['scorecard_extracted'] == 1
+        assert row['org_maturity_level'] is None
+        assert row['org_intent_score'] is None
+
+
+class TestBackfillReportScorecards:
+    """Tests for backfill_report_scorecards() — populates legacy report rows."""
+
+    def _insert_legacy_report(self, db_path, scan_data):
+        conn = sqlite3.connect(db_path)
+        rid = conn.execute(
+            "INSERT INTO reports (company_name, scan_data) VALUES ('Legacy', ?)",
+            (scan_data if isinstance(scan_data, str) else json.dumps(scan_data),),
+        ).lastrowid
+        conn.commit()
+        conn.close()
+        return rid
+
+    def test_backfills_in_batches_and_is_idempotent(self, fresh_db):
+        ids = [
+            self._insert_legacy_report(fresh_db, {'scoring_v2': {'org_intent_score': i, 'risk_level': 'high'}})
+            for i in range(5)
+        ]
+        bad = self._insert_legacy_report(fresh_db, '{broken')
+
+        assert database.backfill_report_scorecards(batch_size=2) == 6
+        assert database.backfill_report_scorecards(batch_size=2) == 0
+
+        rows = _raw_query(fresh_db, 'SELECT * FROM reports ORDER BY id')
+        assert all(r['scorecard_extracted'] == 1 for r in rows)
+        by_id = {r['id']: r for r in rows}
+        assert [by_id[i]['org_intent_score'] for i in ids] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert by_id[bad]['org_intent_score'] is None
+
+
+class TestLatestReportFlag:
+    """Tests for the reports.is_latest pointer behind get_paginated_reports() and get_recent_reports()."""
+
+    def _save(self, company, signals=0):
+        scan = _minimal_scan_data(company=company, signals=[{'type': 'x'}] * signals)
+        return save_report(company, company.lower(), scan, {}, 1.0)
+
+    def _latest_ids(self, db_path):
+        return [r['id'] for r in _raw_query(db_path, 'SELECT id FROM reports WHERE is_latest = 1 ORDER BY id')]
+
+    def test_save_report_moves_flag_case_insensitively(self, fresh_db):
+        first = self._save('Acme')
+        other = self._save('Globex')
+        second = self._save('ACME')
+        assert self._latest_ids(fresh_db) == [other, second]
+
+        page = database.get_paginated_reports(sort_by='company_name', sort_order='asc')
+        assert page['total_items'] == 2
+        assert [r['id'] for r in page['reports']] == [second, other]
+        assert first not in [r['id'] for r in page['reports']]
+
+    def test_filters_apply_to_latest_only(self, fresh_db):
+        self._save('Acme', signals=5)
+        latest = self._save('Acme', signals=1)
+        self._save('Globex', signals=3)
+
+        page = database.get_paginated_reports(max_signals=2)
+        assert [r['id'] for r in page['reports']] == [latest]
+
+    def test_delete_latest_promotes_previous(self, fresh_db):
+        first = self._save('Acme')
+        second = self._save('Acme')
+
+        assert database.delete_report_by_id(second)['success']
+        assert self._latest_ids(fresh_db) == [first]
+
+        assert database.delete_report_by_id(first)['success']
+        assert database.get_paginated_reports()['total_items'] == 0
+
+    def test_rebuild_seeds_legacy_rows(self, fresh_db):
+        conn = sqlite3.connect(fresh_db)
+        conn.executemany(
+            "INSERT INTO reports (company_name, created_at) VALUES (?, ?)",
+            [('Acme', '2024-01-01'), ('acme', '2024-02-01'), ('Globex', '2024-01-15')],
+        )
+        conn.commit()
+        conn.close()
+
+        init_db()
+        assert self._latest_ids(fresh_db) == [2, 3]
+
+    def test_recent_reports_lists_latest_per_company(self, fresh_db):
+        conn = sqlite3.connect(fresh_db)
+        conn.executemany(
+            "INSERT INTO reports (company_name, created_at) VALUES (?, ?)",
+            [('Acme', '2024-01-01'), ('acme', '2024-02-01'), ('Globex', '2024-01-15')],
+        )
+        conn.commit()
+        conn.close()
+        init_db()
+
+        assert [r['id'] for r in database.get_recent_reports()] == [2, 3]
+        assert [r['id'] for r in database.get_recent_reports(limit=1)] == [2]
+
 
 # =========================================================================
 # save_signals() Tests
@@ -897,6 +1025,36 @@ class TestAutoRetier:
         account = _get_account(fresh_db, 'retieredco')
         assert account['current_tier'] == TIER_PREPARING
 
+    @patch('scoring.get_scoring_fingerprint', return_value='new-fp-cols')
+    def test_retier_reads_scorecard_columns_not_blob(self, mock_fp, fresh_db):
+        """A non-zero V2 tier is computed from the scorecard columns alone."""
+        rid = self._setup_account_with_v2_report(fresh_db, 'ColumnCo', 'thinking', TIER_TRACKING)
+        conn = sqlite3.connect(fresh_db)
+        conn.execute("UPDATE reports SET scan_data = '{}' WHERE id = ?", (rid,))
+        conn.commit()
+        conn.close()
+
+        set_setting('scoring_fingerprint', 'old-fp')
+        assert auto_retier_if_version_changed() == 1
+        assert _get_account(fresh_db, 'columnco')['current_tier'] == TIER_THINKING
+
+    @patch('scoring.get_scoring_fingerprint', return_value='new-fp-empty')
+    def test_retier_empty_scorecard_uses_legacy_tiering(self, mock_fp, fresh_db):
+        """A report with an empty scoring_v2 still gets a tier from the full scan."""
+        scan_data = _minimal_scan_data(company='EmptyCo', org='emptyco',
+                                       scoring_v2={}, goldilocks_status='launched')
+        rid = save_report('EmptyCo', 'emptyco', scan_data, {}, 1.0)
+        add_account_to_tier_0('EmptyCo', 'emptyco')
+        conn = sqlite3.connect(fresh_db)
+        conn.execute('UPDATE monitored_accounts SET latest_report_id = ? WHERE LOWER(company_name) = ?',
+                     (rid, 'emptyco'))
+        conn.commit()
+        conn.close()
+
+        set_setting('scoring_fingerprint', 'old-fp')
+        assert auto_retier_if_version_changed() == 1
+        assert _get_account(fresh_db, 'emptyco')['current_tier'] == 3
+
     @patch('scoring.get_scoring_fingerprint', return_value='same-fp')
     def test_no_retier_when_fingerprint_matches(self, mock_fp, fresh_db):
         """No re-tiering when fingerprint hasn't changed."""
@@ -934,6 +1092,34 @@ class TestAutoRetier:
 
         assert get_setting('scoring_fingerprint') == 'new-fp-3'
 
+    @patch('scoring.get_scoring_fingerprint', return_value='new-fp-4')
+    def test_retier_streams_chunks_through_pool_and_audits(self, mock_fp, fresh_db, monkeypatch):
+        """Chunked, pool-tiered runs give the same tiers and log progress."""
+        monkeypatch.setattr(database, '_RETIER_CHUNK_SIZE', 1)
+        monkeypatch.setattr(database, '_RETIER_PARALLEL_MIN_ACCOUNTS', 0)
+        monkeypatch.setattr(database, '_RETIER_WORKERS', 2)
+        self._setup_account_with_v2_report(fresh_db, 'PoolA', 'preparing', TIER_TRACKING)
+        self._setup_account_with_v2_report(fresh_db, 'PoolB', 'thinking', TIER_THINKING)
+        rid = self._setup_account_with_v2_report(fresh_db, 'PoolC', 'thinking', TIER_TRACKING)
+        # Scorecard not extracted yet: tiered from the scan blob
+        conn = sqlite3.connect(fresh_db)
+        conn.execute('UPDATE reports SET scorecard_extracted = 0 WHERE id = ?', (rid,))
+        conn.commit()
+        conn.close()
+
+        set_setting('scoring_fingerprint', 'old-fp')
+        assert auto_retier_if_version_changed() == 2
+        assert _get_account(fresh_db, 'poola')['current_tier'] == TIER_PREPARING
+        assert _get_account(fresh_db, 'poolc')['current_tier'] == TIER_THINKING
+
+        audit = database.get_tier_audit_log()[0]
+        assert (audit['old_fingerprint'], audit['new_fingerprint']) == ('old-fp', 'new-fp-4')
+        assert (audit['total_accounts'], audit['accounts_changed']) == (3, 2)
+        assert json.loads(audit['changes_detail']) == {
+            'processed': 3, 'transitions': {'0->2': 1, '0->1': 1}}
+        assert json.loads(audit['tier_counts_before']) == {'0': 2, '1': 1}
+        assert json.loads(audit['tier_counts_after']) == {'1': 2, '2': 1}
+
 
 # =========================================================================
 # add_account_to_tier_0() Tests
@@ -1038,6 +1224,73 @@ class TestAddAccountToTier0:
 # update_account_metadata() Tests
 # =========================================================================
 
+class TestAnnualRevenueUsd:
+    """Tests for the numeric annual_revenue_usd column and its write paths."""
+
+    @pytest.mark.parametrize('text,expected', [
+        ('$50M', 50_000_000),
+        ('$4.6B', 4_600_000_000),
+        ('250K', 250_000),
+        ('1,500,000', 1_500_000),
+        ('1.2 billion', 1_200_000_000),
+        ('$10M-$50M', 10_000_000),
+        ('$10-50M', 10_000_000),
+        ('1-10 Million', 1_000_000),
+        ('$1 to 5B', 1_000_000_000),
+        ('$500K-$1M', 500_000),
+        ('Founded 2015, $40M revenue', 40_000_000),
+        ('100000000 USD', 100_000_000),
+        (75_000_000, 75_000_000),
+        ('unknown', None),
+        ('', None),
+        (None, None),
+    ])
+    def test_parse_revenue_usd(self, text, expected):
+        assert database.parse_revenue_usd(text) == expected
+
+    def test_write_paths_keep_column_in_sync(self, fresh_db):
+        add_account_to_tier_0('RevCo', 'revco', annual_revenue='$50M')
+        assert _get_account(fresh_db, 'RevCo')['annual_revenue_usd'] == 50_000_000
+
+        add_account_to_tier_0('RevCo', 'revco', annual_revenue='$1.5B')
+        assert _get_account(fresh_db, 'RevCo')['annual_revenue_usd'] == 1_500_000_000
+
+        database.update_account_annual_revenue('RevCo', '900K')
+        assert _get_account(fresh_db, 'RevCo')['annual_revenue_usd'] == 900_000
+
+        enrich_existing_account('RevCo', annual_revenue='n/a')
+        row = _get_account(fresh_db, 'RevCo')
+        assert row['annual_revenue'] == 'n/a'
+        assert row['annual_revenue_usd'] is None
+
+    def test_backfill_legacy_rows(self, fresh_db):
+        conn = sqlite3.connect(fresh_db)
+        conn.executemany(
+            "INSERT INTO monitored_accounts (company_name, annual_revenue) VALUES (?, ?)",
+            [('A', '$2M'), ('B', 'n/a'), ('C', None), ('D', '$3B')],
+        )
+        conn.commit()
+        conn.close()
+
+        assert database.backfill_account_revenue_usd(batch_size=1) == 2
+        assert database.backfill_account_revenue_usd() == 0
+        assert [r['annual_revenue_usd'] for r in _raw_query(
+            fresh_db, 'SELECT annual_revenue_usd FROM monitored_accounts ORDER BY company_name')] == [
+            2_000_000, None, None, 3_000_000_000]
+
+    def test_datatable_revenue_filter_and_sort(self, fresh_db):
+        for name, revenue in [('Small', '$5M'), ('Mid', '$80M'), ('Big', '$2.5B'), ('Unknown', None)]:
+            add_account_to_tier_0(name, name.lower(), annual_revenue=revenue)
+
+        def names(**kwargs):
+            result = database.get_all_accounts_datatable(1, 0, 10, **kwargs)
+            return [a['company_name'] for a in result['data']]
+
+        assert names(revenue_min=10, order_column=1) == ['Mid', 'Big']
+        assert names(revenue_max=100, order_column=1, order_dir='desc') == ['Mid', 'Small']
+        assert names(revenue_min=5, revenue_max=5) == ['Small']
+
+
 class TestUpdateAccountMetadata:
     """Tests for update_account_metadata() — direct metadata update."""
 
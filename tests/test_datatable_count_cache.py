@@ -0,0 +1,85 @@
+"""
+Tests for the DataTables count cache behind get_all_accounts_datatable and
+get_scorecard_datatable.
+
+Rows are inserted with raw SQL (which bypasses invalidation) to observe
+whether a count came from the cache.
+"""
+import sqlite3
+
+import pytest
+
+
+pytestmark = pytest.mark.integration
+
+
+def _raw_insert_accounts(db_path, *names, tier=0):
+    conn = sqlite3.connect(db_path)
+    conn.executemany("INSERT INTO monitored_accounts (company_name, current_tier) VALUES (?, ?)",
+                     [(name, tier) for name in names])
+    conn.commit()
+    conn.close()
+
+
+def _counts(**kwargs):
+    import database
+    result = database.get_all_accounts_datatable(1, 0, 10, **kwargs)
+    return result['recordsTotal'], result['recordsFiltered']
+
+
+class TestAccountsDatatableCounts:
+
+    def test_repeat_draws_reuse_counts(self, test_db):
+        _raw_insert_accounts(test_db, 'One', 'Two')
+        assert _counts() == (2, 2)
+        assert _counts(tier_filter=[0, 1]) == (2, 2)
+
+        _raw_insert_accounts(test_db, 'Three')
+        assert _counts() == (2, 2)
+        # The same filter set in another order hits the same entry
+        assert _counts(tier_filter=[1, 0, 0]) == (2, 2)
+
+    def test_account_writes_invalidate(self, test_db):
+        import database
+        _raw_insert_accounts(test_db, 'One')
+        assert _counts() == (1, 1)
+
+        database.add_account_to_tier_0('Two', 'two')
+        assert _counts() == (2, 2)
+
+        database.archive_account(database.get_account_by_company('Two')['id'])
+        assert _counts() == (1, 1)
+
+    def test_v2_account_writes_invalidate(self, test_db):
+        from v2.services.account_service import find_or_create_account
+        assert _counts(tier_filter=[0]) == (0, 0)
+        find_or_create_account('Fresh Co')
+        assert _counts(tier_filter=[0]) == (1, 1)
+
+    def test_ttl_expiry(self, test_db, monkeypatch):
+        import database
+        _raw_insert_accounts(test_db, 'One')
+        assert _counts(last_scanned_filter='7d') == (1, 1)
+
+        _raw_insert_accounts(test_db, 'Two')
+        monkeypatch.setattr(database, '_COUNT_CACHE_TTL_SECONDS', -1)
+        assert _counts(last_scanned_filter='7d') == (2, 2)
+
+    def test_filters_are_cached_separately(self, test_db):
+        _raw_insert_accounts(test_db, 'Zero')
+        _raw_insert_accounts(test_db, 'Two', tier=2)
+        assert _counts(tier_filter=[2]) == (2, 1)
+        assert _counts(tier_filter=[0]) == (2, 1)
+        assert _counts(search_value='zero') == (2, 1)
+
+
+class TestScorecardDatatableCounts:
+
+    def test_upsert_invalidates(self, test_db):
+        import database
+        _raw_insert_accounts(test_db, 'Scored')
+        assert database.get_scorecard_datatable(1, 0, 10)['recordsTotal'] == 0
+
+        database.upsert_scorecard_scores([{'account_id': 1, 'company_name': 'Scored', 'cohort': 'A'}])
+        result = database.get_scorecard_datatable(1, 0, 10, cohort_filter='A')
+        assert (result['recordsTotal'], result['recordsFiltered']) == (1, 1)
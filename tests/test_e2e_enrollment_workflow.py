@@ -345,6 +345,7 @@ class TestFullEnrollmentWorkflow:
 
         # Check audit log
         import database
+        database.flush_event_logs()
         conn = database.get_db_connection()
         cur = conn.cursor()
         cur.execute("SELECT * FROM audit_log WHERE action = 'apollo_enrollment' ORDER BY id DESC LIMIT 1")
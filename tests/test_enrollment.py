@@ -52,6 +52,65 @@ class TestEnrollmentBatchCRUD:
         ok = database.update_enrollment_batch(sample_batch, hacker_field='evil')
         assert ok is False
 
+    def test_increment_batch_counters(self, test_db, sample_batch):
+        import database
+        database.update_enrollment_batch(sample_batch, generated=2, failed=1)
+        ok = database.increment_enrollment_batch(sample_batch, generated=3, failed=1)
+        assert ok is True
+        batch = database.get_enrollment_batch(sample_batch)
+        assert batch['generated'] == 5
+        assert batch['failed'] == 2
+
+    def test_increment_batch_rejects_invalid_fields(self, test_db, sample_batch):
+        import database
+        assert database.increment_enrollment_batch(sample_batch, status=1) is False
+        assert database.increment_enrollment_batch(sample_batch, generated=0) is False
+
+    def test_increment_batch_concurrent_no_lost_updates(self, test_db, sample_batch):
+        """Concurrent increments must all land (no read-modify-write race)."""
+        import database
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: database.increment_enrollment_batch(sample_batch, failed=1),
+                          range(40)))
+        batch = database.get_enrollment_batch(sample_batch)
+        assert batch['failed'] == 40
+
+    def test_progress_writer_coalesces_writes(self, test_db, sample_batch):
+        import database
+        from unittest.mock import patch
+        with patch.object(database, '_apply_enrollment_batch_progress',
+                          wraps=database._apply_enrollment_batch_progress) as spy:
+            with database.EnrollmentProgressWriter(sample_batch, interval_ms=60_000) as progress:
+                for i in range(25):
+                    progress.add(enrolled=1)
+                    progress.set_phase(f'Enrolling ({i + 1}/25)...')
+        # First update goes out immediately, the rest are flushed once on exit
+        assert spy.call_count == 2
+        batch = database.get_enrollment_batch(sample_batch)
+        assert batch['enrolled'] == 25
+        assert batch['current_phase'] == 'Enrolling (25/25)...'
+
+    def test_progress_writer_flush_noop_when_empty(self, test_db, sample_batch):
+        import database
+        progress = database.EnrollmentProgressWriter(sample_batch)
+        assert progress.flush() is False
+
+    def test_get_enrollment_account_context(self, test_db):
+        import database
+        database.add_account_to_tier_0('CtxCorp', 'ctxcorp', annual_revenue='$2B')
+        acct = database.get_account_by_company('CtxCorp')
+        database.upsert_scorecard_scores([{
+            'account_id': acct['id'], 'company_name': 'CtxCorp', 'cohort': 'A',
+            'locale_count': 7,
+        }])
+        ctx = database.get_enrollment_account_context([acct['id'], None, 99999])
+        assert set(ctx) == {acct['id']}
+        assert ctx[acct['id']]['cohort'] == 'A'
+        assert ctx[acct['id']]['locale_count'] == 7
+        assert 'evidence_summary' in ctx[acct['id']]
+        assert database.get_enrollment_account_context([]) == {}
+
     def test_get_batches_for_campaign(self, test_db, sample_campaign):
         import database
         id1 = database.create_enrollment_batch(sample_campaign, [1])
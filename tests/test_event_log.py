@@ -0,0 +1,160 @@
+"""
+Tests for batched event logging (database.EventLogSink) behind
+activity_service.log_activity and database.log_audit_event.
+"""
+import sqlite3
+import time
+
+import pytest
+
+
+pytestmark = pytest.mark.integration
+
+
+def _rows(db_path, sql):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(sql).fetchall()
+    conn.close()
+    return rows
+
+
+@pytest.fixture
+def sink(test_db):
+    """A small audit_log sink whose background flush never fires during a test."""
+    import database
+    return database.EventLogSink('TEST', '''
+        INSERT INTO audit_log (timestamp, action, details) VALUES (?, ?, ?)
+    ''', max_queue=3, batch_size=100, interval=3600)
+
+
+class TestEventLogSink:
+
+    def test_rows_are_queued_until_flush(self, test_db, sink):
+        for i in range(2):
+            sink.log(('2024-01-01 00:00:00', 'queued', str(i)))
+
+        assert sink.pending() == 2
+        assert _rows(test_db, "SELECT * FROM audit_log WHERE action = 'queued'") == []
+        assert sink.flush() == 2
+        assert sink.flush() == 0
+        assert _rows(test_db, "SELECT details FROM audit_log WHERE action = 'queued' ORDER BY id") == [('0',), ('1',)]
+
+    def test_full_queue_flushes_in_caller(self, test_db, sink):
+        for i in range(4):
+            sink.log(('2024-01-01 00:00:00', 'backpressure', str(i)))
+
+        # The fourth event found the queue full and wrote the first three itself
+        assert len(_rows(test_db, "SELECT * FROM audit_log WHERE action = 'backpressure'")) == 3
+        assert sink.pending() == 1
+
+    def test_failed_flush_requeues(self, test_db, sink, monkeypatch):
+        import database
+        sink.log(('2024-01-01 00:00:00', 'retry', None))
+
+        def _broken():
+            raise sqlite3.OperationalError('database is locked')
+
+        with monkeypatch.context() as m:
+            m.setattr(database, 'get_db_connection', _broken)
+            with pytest.raises(sqlite3.OperationalError):
+                sink.flush()
+
+        assert sink.pending() == 1
+        assert sink.flush() == 1
+
+    def test_failed_later_batch_requeues_only_uncommitted_rows(self, test_db, monkeypatch):
+        import database
+        small = database.EventLogSink('SMALL', '''
+            INSERT INTO audit_log (timestamp, action, details) VALUES (?, ?, ?)
+        ''', batch_size=2, interval=3600)
+        # A full batch would wake the background flusher; keep every flush in this test
+        monkeypatch.setattr(small, '_ensure_flusher', lambda: None)
+        for i in range(5):
+            small.log(('2024-01-01 00:00:00', 'partial', str(i)))
+
+        real_bulk_write = database._bulk_write
+        calls = []
+
+        def _fail_second(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 2:
+                raise sqlite3.OperationalError('disk I/O error')
+            return real_bulk_write(*args, **kwargs)
+
+        with monkeypatch.context() as m:
+            m.setattr(database, '_bulk_write', _fail_second)
+            with pytest.raises(sqlite3.OperationalError):
+                small.flush()
+
+        assert small.pending() == 3
+        assert small.flush() == 3
+        sql = "SELECT details FROM audit_log WHERE action = 'partial' ORDER BY details"
+        assert _rows(test_db, sql) == [(str(i),) for i in range(5)]
+
+    def test_background_thread_flushes(self, test_db):
+        import database
+        fast = database.EventLogSink('FAST', '''
+            INSERT INTO audit_log (timestamp, action) VALUES (?, ?)
+        ''', interval=0.05)
+        fast.log(('2024-01-01 00:00:00', 'background'))
+
+        sql = "SELECT action FROM audit_log WHERE action = 'background'"
+        deadline = time.monotonic() + 5
+        while not _rows(test_db, sql) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert _rows(test_db, sql) == [('background',)]
+
+
+class TestActivityAndAuditLogging:
+
+    def test_log_activity_batches_and_readers_see_it(self, test_db):
+        from v2.services import activity_service
+        for i in range(3):
+            activity_service.log_activity('signal_created', 'signal', i, {'n': i}, created_by='test')
+
+        entries = activity_service.get_recent_activity(event_type='signal_created')
+        assert sorted(e['entity_id'] for e in entries) == [0, 1, 2]
+        assert all(e['created_at'] for e in entries)
+        assert activity_service.get_activity_for_signal(1)[0]['details'] == '{"n": 1}'
+
+    def test_log_audit_event(self, test_db):
+        import database
+        database.log_audit_event('auth_failure', 'x' * 3000, ip_address='10.0.0.1')
+
+        logs = database.get_recent_audit_logs(action_filter='auth_failure')
+        assert len(logs) == 1
+        assert len(logs[0]['details']) == 2000
+        assert logs[0]['ip_address'] == '10.0.0.1'
+
+    def test_flush_event_logs_writes_every_sink(self, test_db):
+        import database
+        from v2.services.activity_service import log_activity
+        log_activity('csv_imported')
+        database.log_audit_event('email_send')
+
+        assert database.flush_event_logs() == 2
+        assert _rows(test_db, "SELECT event_type FROM activity_log WHERE event_type = 'csv_imported'") == [
+            ('csv_imported',)]
+        assert _rows(test_db, "SELECT action FROM audit_log WHERE action = 'email_send'") == [('email_send',)]
+
+    def test_readers_survive_failed_flush(self, test_db, monkeypatch):
+        import database
+        from v2.services import activity_service
+
+        def _broken():
+            raise sqlite3.OperationalError('database is locked')
+
+        with monkeypatch.context() as m:
+            m.setattr(activity_service._activity_sink, 'flush', _broken)
+            m.setattr(database._audit_log_sink, 'flush', _broken)
+            assert activity_service.get_recent_activity() == []
+            assert activity_service.get_activity_for_account(1) == []
+            assert activity_service.get_activity_for_signal(1) == []
+            assert isinstance(database.get_recent_audit_logs(), list)
+
+    def test_activity_summary_sees_queued_events(self, test_db):
+        from v2.services.activity_service import log_activity
+        from v2.services.analytics_service import get_recent_activity_summary
+        log_activity('draft_approved')
+
+        assert get_recent_activity_summary(7)['events'] == [{'event_type': 'draft_approved', 'cnt': 1}]
@@ -0,0 +1,126 @@
+"""
+Tests for log rotation and retention (database.rotate_event_logs) and the
+daily rollups behind analytics_service.get_recent_activity_summary.
+"""
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+
+pytestmark = pytest.mark.integration
+
+
+def _ago(days):
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _rows(db_path, sql):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(sql).fetchall()
+    conn.close()
+    return rows
+
+
+def _insert_activity(db_path, rows):
+    """Insert (event_type, age_in_days) activity rows."""
+    conn = sqlite3.connect(db_path)
+    conn.executemany("INSERT INTO activity_log (event_type, created_at) VALUES (?, ?)",
+                     [(event_type, _ago(age)) for event_type, age in rows])
+    conn.commit()
+    conn.close()
+
+
+class TestRotateEventLogs:
+
+    def test_old_rows_move_to_archive_with_rollups(self, test_db):
+        import database
+        _insert_activity(test_db, [('signal_created', 1), ('signal_created', 40),
+                                   ('signal_created', 40), ('draft_approved', 41)])
+
+        result = database.rotate_event_logs({'activity_log': (30, 365)})
+
+        assert result['activity_log'] == {'archived': 3, 'compacted': 0}
+        assert _rows(test_db, "SELECT COUNT(*) FROM activity_log") == [(1,)]
+        assert _rows(test_db, "SELECT COUNT(*) FROM activity_log_archive") == [(3,)]
+        rollups = _rows(test_db, "SELECT event_key, SUM(event_count) FROM log_daily_rollups "
+                                 "WHERE log_table = 'activity_log' GROUP BY event_key ORDER BY event_key")
+        assert rollups == [('draft_approved', 1), ('signal_created', 2)]
+
+        # A second run has nothing left to move and does not double-count
+        assert database.rotate_event_logs({'activity_log': (30, 365)})['activity_log'] == {
+            'archived': 0, 'compacted': 0}
+        assert _rows(test_db, "SELECT SUM(event_count) FROM log_daily_rollups "
+                              "WHERE log_table = 'activity_log'") == [(3,)]
+
+    def test_archive_compaction_keeps_rollups(self, test_db):
+        import database
+        _insert_activity(test_db, [('csv_imported', 100), ('csv_imported', 10)])
+        database.rotate_event_logs({'activity_log': (5, 365)})
+
+        result = database.rotate_event_logs({'activity_log': (5, 30)})
+
+        assert result['activity_log'] == {'archived': 0, 'compacted': 1}
+        assert _rows(test_db, "SELECT COUNT(*) FROM activity_log_archive") == [(1,)]
+        assert _rows(test_db, "SELECT SUM(event_count) FROM log_daily_rollups "
+                              "WHERE log_table = 'activity_log'") == [(2,)]
+
+    def test_every_log_table_rotates(self, test_db):
+        import database
+        conn = sqlite3.connect(test_db)
+        conn.execute("INSERT INTO audit_log (timestamp, action) VALUES (?, 'auth_failure')", (_ago(60),))
+        conn.execute("INSERT INTO webhook_logs (timestamp, event_type, status) VALUES (?, 'tier_change', 'ok')",
+                     (_ago(60),))
+        conn.execute("INSERT INTO feedback_log (critique, created_at) VALUES ('too long', ?)", (_ago(400),))
+        conn.commit()
+        conn.close()
+
+        result = database.rotate_event_logs()
+
+        for table in ('audit_log', 'webhook_logs', 'feedback_log'):
+            assert result[table]['archived'] == 1
+            assert _rows(test_db, f"SELECT COUNT(*) FROM {table}") == [(0,)]
+        assert _rows(test_db, "SELECT log_table, event_key FROM log_daily_rollups ORDER BY log_table") == [
+            ('audit_log', 'auth_failure'), ('feedback_log', ''), ('webhook_logs', 'tier_change')]
+
+    def test_retention_policy_from_environment(self, monkeypatch):
+        import database
+        monkeypatch.setenv('AUDIT_LOG_HOT_DAYS', '7')
+        monkeypatch.setenv('AUDIT_LOG_RETENTION_DAYS', '3')
+        # Retention never ends before the hot window does
+        assert database.get_log_retention_policy('audit_log') == (7, 7)
+        with pytest.raises(ValueError):
+            database.get_log_retention_policy('accounts')
+
+
+class TestActivitySummary:
+
+    def test_summary_combines_hot_rows_and_rollups(self, test_db):
+        import database
+        from v2.services.analytics_service import get_recent_activity_summary
+        _insert_activity(test_db, [('signal_created', 1), ('signal_created', 40),
+                                   ('draft_approved', 45), ('draft_approved', 200)])
+        database.rotate_event_logs({'activity_log': (30, 365)})
+
+        assert get_recent_activity_summary(7)['events'] == [{'event_type': 'signal_created', 'cnt': 1}]
+        assert get_recent_activity_summary(90)['events'] == [
+            {'event_type': 'signal_created', 'cnt': 2}, {'event_type': 'draft_approved', 'cnt': 1}]
+
+
+class TestEntityTimelines:
+
+    def test_account_timeline_continues_into_archive(self, test_db):
+        import database
+        from v2.services.activity_service import get_activity_for_account, get_recent_activity
+        conn = sqlite3.connect(test_db)
+        conn.executemany("INSERT INTO activity_log (event_type, entity_type, entity_id, created_at) "
+                         "VALUES (?, 'account', 7, ?)",
+                         [('account_created', _ago(90)), ('tier_changed', _ago(40)), ('note_added', _ago(1))])
+        conn.commit()
+        conn.close()
+        database.rotate_event_logs({'activity_log': (30, 365)})
+
+        assert [e['event_type'] for e in get_recent_activity()] == ['note_added']
+        assert [e['event_type'] for e in get_activity_for_account(7)] == [
+            'note_added', 'tier_changed', 'account_created']
+        assert [e['event_type'] for e in get_activity_for_account(7, limit=2)] == ['note_added', 'tier_changed']
@@ -225,6 +225,56 @@ class TestErrorRecovery:
         assert b2['status'] == 'completed'
 
 
+class TestEmailGenerationPhase:
+    """Test the concurrent email-generation phase of the enrollment worker."""
+
+    def test_generation_phase_counts_successes_and_failures(self, flask_app, sample_campaign, monkeypatch):
+        import app as app_module
+        import database
+
+        monkeypatch.setenv('AI_INTEGRATIONS_OPENAI_API_KEY', 'sk-test')
+        monkeypatch.setenv('AI_INTEGRATIONS_OPENAI_BASE_URL', 'http://localhost')
+        monkeypatch.setattr(app_module._openai_limiter, 'interval', 0)
+
+        database.add_account_to_tier_0('GenCorp', 'gencorp')
+        acct = database.get_account_by_company('GenCorp')
+        batch_id = database.create_enrollment_batch(sample_campaign, [acct['id']])
+        for i in range(12):
+            database.create_enrollment_contact(
+                batch_id, 'GenCorp', account_id=acct['id'],
+                email=f'p{i}@gencorp.com', first_name='Bad' if i % 4 == 0 else f'P{i}',
+                status='discovered',
+            )
+        database.update_enrollment_batch(batch_id, total_contacts=12, status='discovered')
+
+        def _create(**kwargs):
+            if 'Bad' in kwargs['messages'][1]['content']:
+                raise RuntimeError('LLM error')
+            resp = MagicMock()
+            resp.choices = [MagicMock()]
+            resp.choices[0].message.content = json.dumps({'subject_1': 'Hi', 'email_1': 'Body'})
+            return resp
+
+        mock_openai = MagicMock()
+        mock_openai.OpenAI.return_value.chat.completions.create.side_effect = _create
+        # No active email account → the worker stops right after phase 1
+        no_accounts = MagicMock(status_code=200)
+        no_accounts.json.return_value = {'email_accounts': [], 'typed_custom_fields': []}
+
+        with patch.dict('sys.modules', {'openai': mock_openai}), \
+             patch('requests.get', return_value=no_accounts), \
+             patch.object(app_module, 'get_enrollment_account_context',
+                          wraps=database.get_enrollment_account_context) as ctx_spy:
+            app_module._enrollment_pipeline_worker(batch_id)
+
+        batch = database.get_enrollment_batch(batch_id)
+        assert batch['generated'] == 9
+        assert batch['failed'] == 3
+        assert len(database.get_enrollment_contacts(batch_id, status='email_generated')) == 9
+        # Account context is fetched once per account, not once per contact
+        assert ctx_spy.call_count == 1
+
+
 class TestScoringToEnrollmentIntegration:
     """Test that scoring results can drive enrollment decisions."""
 
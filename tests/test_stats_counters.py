@@ -0,0 +1,97 @@
+"""
+Tests for the write-behind usage counters behind increment_daily_stat and
+increment_hourly_api_calls.
+"""
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def stats_buffer(test_db, monkeypatch):
+    """A private counter buffer whose background flush never fires during a test."""
+    import database
+    buffer = database._StatsCounterBuffer(interval=3600)
+    monkeypatch.setattr(database, '_stats_buffer', buffer)
+    return buffer
+
+
+def _db_rows(db_path, sql):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(sql).fetchall()
+    conn.close()
+    return rows
+
+
+class TestStatsCounters:
+
+    def test_increments_are_buffered_until_flush(self, test_db, stats_buffer):
+        import database
+        for _ in range(5):
+            database.increment_hourly_api_calls()
+        database.increment_hourly_api_calls(3)
+
+        assert _db_rows(test_db, "SELECT * FROM hourly_api_stats") == []
+        assert database.get_current_hour_api_calls() == 8
+
+        assert database.flush_stats_counters() is True
+        assert database.flush_stats_counters() is False
+        assert _db_rows(test_db, "SELECT api_calls FROM hourly_api_stats") == [(8,)]
+
+        database.increment_hourly_api_calls(2)
+        assert database.get_current_hour_api_calls() == 10
+        database.flush_stats_counters()
+        assert _db_rows(test_db, "SELECT api_calls FROM hourly_api_stats") == [(10,)]
+
+    def test_daily_stats_merge_pending_and_upsert(self, test_db, stats_buffer):
+        import database
+        today = datetime.now().strftime('%Y-%m-%d')
+        database.increment_daily_stat('scans_run')
+        database.increment_daily_stat('webhooks_fired', 4)
+        database.flush_stats_counters()
+        database.increment_daily_stat('scans_run', 2)
+
+        assert _db_rows(test_db, "SELECT date, scans_run, api_calls_estimated, webhooks_fired "
+                                 "FROM system_stats") == [(today, 1, 0, 4)]
+        stats = database.get_stats_last_n_days(7)
+        assert [(s['date'], s['scans_run'], s['webhooks_fired']) for s in stats] == [(today, 3, 4)]
+
+        database.flush_stats_counters()
+        assert _db_rows(test_db, "SELECT scans_run FROM system_stats") == [(3,)]
+
+    def test_invalid_stat_name(self, test_db, stats_buffer):
+        import database
+        with pytest.raises(ValueError):
+            database.increment_daily_stat('bogus')
+
+    def test_failed_flush_keeps_increments(self, test_db, stats_buffer, monkeypatch):
+        import database
+        database.increment_hourly_api_calls(5)
+
+        def _broken():
+            raise sqlite3.OperationalError('database is locked')
+
+        with monkeypatch.context() as m:
+            m.setattr(database, 'get_db_connection', _broken)
+            with pytest.raises(sqlite3.OperationalError):
+                database.flush_stats_counters()
+
+        assert stats_buffer.pending_hourly(datetime.now().strftime('%Y-%m-%d-%H')) == 5
+        database.flush_stats_counters()
+        assert _db_rows(test_db, "SELECT api_calls FROM hourly_api_stats") == [(5,)]
+
+    def test_background_thread_flushes(self, test_db, monkeypatch):
+        import time
+        import database
+        buffer = database._StatsCounterBuffer(interval=0.05)
+        monkeypatch.setattr(database, '_stats_buffer', buffer)
+
+        database.increment_daily_stat('api_calls_estimated', 7)
+        deadline = time.monotonic() + 5
+        while not _db_rows(test_db, "SELECT api_calls_estimated FROM system_stats") and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert _db_rows(test_db, "SELECT api_calls_estimated FROM system_stats") == [(7,)]
@@ -0,0 +1,111 @@
+"""
+Tests for bulk account status transitions
+(account_service.bulk_update_account_status and POST /v2/api/accounts/status/bulk).
+"""
+import sqlite3
+
+import pytest
+
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def accounts(test_db):
+    """Four accounts, each with one 'new' and one 'actioned' signal."""
+    from v2.services.account_service import find_or_create_account
+    from v2.services.signal_service import create_signal, update_signal_status
+    ids = [find_or_create_account(f'BulkCo{i}') for i in range(4)]
+    for aid in ids:
+        create_signal(account_id=aid, signal_description='fresh')
+        update_signal_status(create_signal(account_id=aid, signal_description='worked'), 'actioned')
+    return ids
+
+
+def _signal_statuses(db_path, account_id):
+    conn = sqlite3.connect(db_path)
+    rows = sorted(r[0] for r in conn.execute(
+        "SELECT status FROM intent_signals WHERE account_id = ?", (account_id,)))
+    conn.close()
+    return rows
+
+
+def _account_status(db_path, account_id):
+    conn = sqlite3.connect(db_path)
+    status = conn.execute("SELECT account_status FROM monitored_accounts WHERE id = ?",
+                          (account_id,)).fetchone()[0]
+    conn.close()
+    return status
+
+
+class TestBulkUpdateAccountStatus:
+
+    def test_noise_archives_all_active_signals(self, test_db, accounts):
+        from v2.services.account_service import bulk_update_account_status
+        from v2.services.signal_service import check_signal_status_counts
+
+        result = bulk_update_account_status(accounts[:3] + [999999], 'noise', created_by='tester')
+
+        assert result['updated_account_ids'] == accounts[:3]
+        assert result['not_found'] == [999999]
+        assert result['signals_updated'] == 6
+        for aid in accounts[:3]:
+            assert _account_status(test_db, aid) == 'noise'
+            assert _signal_statuses(test_db, aid) == ['archived', 'archived']
+        assert _signal_statuses(test_db, accounts[3]) == ['actioned', 'new']
+        assert check_signal_status_counts()['consistent']
+
+        conn = sqlite3.connect(test_db)
+        logged = conn.execute(
+            "SELECT entity_id, created_by FROM activity_log WHERE event_type = 'account_marked_noise' "
+            "ORDER BY entity_id").fetchall()
+        conn.close()
+        assert logged == [(aid, 'tester') for aid in accounts[:3]]
+
+    @pytest.mark.parametrize('status', ['sequenced', 'revisit'])
+    def test_sequenced_and_revisit_action_new_signals(self, test_db, accounts, status, monkeypatch):
+        from v2.services import account_service
+        monkeypatch.setattr(account_service, '_BULK_STATUS_CHUNK', 3)
+
+        result = account_service.bulk_update_account_status(accounts + accounts[:1], status)
+
+        assert result['updated_account_ids'] == accounts
+        assert result['signals_updated'] == 4
+        assert {_account_status(test_db, aid) for aid in accounts} == {status}
+        assert _signal_statuses(test_db, accounts[0]) == ['actioned', 'actioned']
+
+    def test_reset_to_new_has_no_cascade(self, test_db, accounts):
+        from v2.services.account_service import bulk_update_account_status
+        bulk_update_account_status(accounts[:1], 'noise')
+
+        result = bulk_update_account_status(accounts[:1], 'new')
+
+        assert result['signals_updated'] == 0
+        assert _account_status(test_db, accounts[0]) == 'new'
+        assert _signal_statuses(test_db, accounts[0]) == ['archived', 'archived']
+
+    def test_invalid_status_raises(self, test_db):
+        from v2.services.account_service import bulk_update_account_status
+        with pytest.raises(ValueError):
+            bulk_update_account_status([1], 'bogus')
+
+
+class TestBulkStatusEndpoint:
+
+    def test_bulk_endpoint(self, flask_app, test_db, accounts):
+        resp = flask_app.post('/v2/api/accounts/status/bulk',
+                              json={'account_ids': accounts[:2], 'status': 'sequenced'})
+        data = resp.get_json()
+        assert resp.status_code == 200
+        assert data['updated_account_ids'] == accounts[:2]
+        assert _account_status(test_db, accounts[1]) == 'sequenced'
+
+    @pytest.mark.parametrize('body', [
+        {'account_ids': [1]},
+        {'account_ids': [], 'status': 'noise'},
+        {'account_ids': [1, 'x'], 'status': 'noise'},
+        {'account_ids': [1], 'status': 'bogus'},
+        {'account_ids': list(range(1, 1002)), 'status': 'noise'},
+    ])
+    def test_bulk_endpoint_validation(self, flask_app, test_db, body):
+        assert flask_app.post('/v2/api/accounts/status/bulk', json=body).status_code == 400
@@ -0,0 +1,136 @@
+"""
+Tests for the v2 Apollo people-search endpoint (/v2/api/signals/<id>/search).
+
+Runs against the local fake Apollo server so upstream call counts and
+concurrency are observed at the HTTP layer.
+"""
+import sqlite3
+
+import pytest
+
+import apollo_client
+
+
+pytestmark = pytest.mark.integration
+
+SEARCH_PATH = '/api/v1/mixed_people/api_search'
+MATCH_PATH = '/api/v1/people/match'
+BULK_MATCH_PATH = '/api/v1/people/bulk_match'
+
+
+def _seed_signal(db_path, company_name='TestCorp', website='https://testcorp.com'):
+    conn = sqlite3.connect(db_path)
+    cur = conn.execute(
+        "INSERT INTO monitored_accounts (company_name, website, account_status) VALUES (?, ?, 'new')",
+        (company_name, website),
+    )
+    aid = cur.lastrowid
+    cur = conn.execute(
+        "INSERT INTO intent_signals (account_id, signal_description, signal_type) VALUES (?, 'test', 'dependency_injection')",
+        (aid,),
+    )
+    sid = cur.lastrowid
+    conn.commit()
+    conn.close()
+    return sid
+
+
+def _matched(person_id, status):
+    return {'id': person_id, 'name': 'Matched', 'email': f'{person_id}@testcorp.com',
+            'email_status': status}
+
+
+def _bulk(status):
+    return lambda body: {'matches': [_matched(d['id'], status) for d in body['details']]}
+
+
+def _people(prefix, n):
+    return [{'id': f'{prefix}{i}', 'name': f'Person {prefix}{i}', 'first_name': 'P', 'last_name': f'{i}',
+             'title': 'VP Engineering', 'email': 'email_not_unlocked@domain.com',
+             'email_status': '', 'linkedin_url': ''} for i in range(n)]
+
+
+@pytest.fixture
+def apollo(fake_apollo_server, monkeypatch):
+    monkeypatch.setattr(apollo_client, 'rate_limiter',
+                        apollo_client.ApolloRateLimiter(max_requests=10_000))
+    return fake_apollo_server
+
+
+PERSONAS = [{'title': 'VP Engineering'}, {'title': 'Head of Product'}, {'title': 'Director of Localization'}]
+
+
+class TestParallelSearch:
+
+    def test_persona_searches_run_concurrently(self, flask_app, test_db, apollo):
+        sid = _seed_signal(test_db)
+        apollo.delay = 0.2
+        apollo.routes[SEARCH_PATH] = lambda body: {'people': []}
+
+        resp = flask_app.post(f'/v2/api/signals/{sid}/search', json={'personas': PERSONAS})
+
+        assert resp.status_code == 200
+        # 3 personas x (domain + company name) searches, fanned out in parallel
+        assert apollo.count(SEARCH_PATH) >= 6
+        assert apollo.max_inflight > 1
+
+    def test_enrichment_stops_once_max_results_met(self, flask_app, test_db, apollo):
+        sid = _seed_signal(test_db)
+        apollo.routes[SEARCH_PATH] = lambda body: (
+            {'people': _people('d', 25)} if 'q_organization_domains_list' in body else {'people': []})
+        apollo.routes[BULK_MATCH_PATH] = _bulk('verified')
+
+        resp = flask_app.post(f'/v2/api/signals/{sid}/search',
+                              json={'personas': PERSONAS[:1], 'max_results': 2})
+
+        data = resp.get_json()
+        assert data['total'] == 2
+        # Only the first bulk wave is enriched, not all 25 candidates
+        assert apollo.count(BULK_MATCH_PATH) == 1
+        assert apollo.count(MATCH_PATH) == 0
+
+    def test_likely_pass_reuses_first_pass_matches(self, flask_app, test_db, apollo):
+        sid = _seed_signal(test_db)
+        apollo.routes[SEARCH_PATH] = lambda body: (
+            {'people': _people('d', 5)} if 'q_organization_domains_list' in body else {'people': []})
+        apollo.routes[BULK_MATCH_PATH] = _bulk('likely')
+
+        resp = flask_app.post(f'/v2/api/signals/{sid}/search',
+                              json={'personas': PERSONAS[:1], 'max_results': 3})
+
+        data = resp.get_json()
+        assert data['total'] == 3
+        assert data['unverified_count'] == 3
+        # The likely/guessed pass reuses the verified pass's bulk response
+        assert apollo.count(BULK_MATCH_PATH) == 1
+        assert apollo.count(MATCH_PATH) == 0
+
+
+class TestBulkEnrichment:
+
+    def test_25_candidates_enriched_in_3_bulk_calls(self, flask_app, test_db, apollo):
+        sid = _seed_signal(test_db)
+        apollo.routes[SEARCH_PATH] = lambda body: (
+            {'people': _people('d', 25)} if 'q_organization_domains_list' in body else {'people': []})
+        apollo.routes[BULK_MATCH_PATH] = _bulk('verified')
+
+        resp = flask_app.post(f'/v2/api/signals/{sid}/search',
+                              json={'personas': PERSONAS[:1], 'max_results': 25})
+
+        assert resp.get_json()['total'] == 25
+        assert apollo.count(BULK_MATCH_PATH) == 3
+        assert apollo.count(MATCH_PATH) == 0
+
+    def test_falls_back_to_per_candidate_match(self, flask_app, test_db, apollo):
+        sid = _seed_signal(test_db)
+        apollo.routes[SEARCH_PATH] = lambda body: (
+            {'people': _people('d', 4)} if 'q_organization_domains_list' in body else {'people': []})
+        # No bulk route → fake server answers 404, as for plans without bulk access
+        apollo.routes[MATCH_PATH] = lambda body: {'person': _matched(body['id'], 'verified')}
+
+        resp = flask_app.post(f'/v2/api/signals/{sid}/search',
+                              json={'personas': PERSONAS[:1], 'max_results': 4})
+
+        assert resp.get_json()['total'] == 4
+        assert apollo.count(BULK_MATCH_PATH) == 1
+        assert apollo.count(MATCH_PATH) == 4
@@ -0,0 +1,99 @@
+"""
+Tests for the cached campaign catalog behind campaign_service.recommend_campaign.
+"""
+import sqlite3
+
+import pytest
+
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """Count database connections opened through database.py."""
+    import database
+    stats = {'count': 0}
+    original = database.get_db_connection
+
+    def _counted():
+        stats['count'] += 1
+        return original()
+
+    monkeypatch.setattr(database, 'get_db_connection', _counted)
+    return stats
+
+
+def _active_campaign(name, prompt=''):
+    import database
+    campaign_id = database.create_campaign(name, prompt, [])['id']
+    database.update_campaign(campaign_id, status='active')
+    return campaign_id
+
+
+class TestRecommendCampaign:
+
+    def test_matches_type_angle_and_fallback(self, test_db):
+        from v2.services.campaign_service import recommend_campaign
+        hiring = _active_campaign('Hiring Signal')
+        quality = _active_campaign('Translation Quality', prompt='Lead with a pre launch quality checklist')
+
+        rec = recommend_campaign('job_posting_intent')
+        assert rec['campaign_id'] == hiring
+        assert "'Hiring Signal' campaign" in rec['reasoning']
+
+        assert recommend_campaign('unknown', outreach_angle='pre_launch')['campaign_id'] == quality
+        # Fallback is the newest active campaign; both share a created_at second here
+        assert recommend_campaign('unknown')['campaign_id'] in (hiring, quality)
+        assert 'Falling back' in recommend_campaign('unknown', outreach_angle='nomatch')['reasoning']
+
+    def test_no_active_campaigns(self, test_db):
+        import database
+        from v2.services.campaign_service import recommend_campaign
+        database.create_campaign('Draft only', '', [])
+        assert recommend_campaign('ghost_branch')['campaign_id'] is None
+
+    def test_repeat_calls_do_not_touch_the_database(self, test_db, connections):
+        from v2.services.campaign_service import recommend_campaign
+        _active_campaign('RepoRadar')
+
+        recommend_campaign('ghost_branch')
+        before = connections['count']
+        for signal_type in ('ghost_branch', 'rfc_discussion', 'funding_round', None) * 50:
+            recommend_campaign(signal_type, outreach_angle='scale')
+        assert connections['count'] == before
+
+    def test_campaign_writes_invalidate(self, test_db):
+        import database
+        from v2.services.campaign_service import recommend_campaign
+        first = _active_campaign('Scale & Expansion')
+        assert recommend_campaign('funding_round')['campaign_id'] == first
+
+        database.update_campaign(first, status='draft')
+        assert recommend_campaign('funding_round')['campaign_id'] is None
+
+        database.update_campaign(first, status='active')
+        assert recommend_campaign('funding_round')['campaign_id'] == first
+
+        database.delete_campaign(first)
+        assert recommend_campaign('funding_round')['campaign_id'] is None
+
+    def test_raw_writes_need_explicit_invalidation_or_ttl(self, test_db, monkeypatch):
+        from v2.services import campaign_service
+        assert campaign_service.recommend_campaign('ghost_branch')['campaign_id'] is None
+
+        conn = sqlite3.connect(test_db)
+        conn.execute("INSERT INTO campaigns (name, status) VALUES ('RepoRadar', 'active')")
+        conn.commit()
+        conn.close()
+        assert campaign_service.recommend_campaign('ghost_branch')['campaign_id'] is None
+
+        campaign_service.invalidate_campaign_catalog()
+        assert campaign_service.recommend_campaign('ghost_branch')['campaign_name'] == 'RepoRadar'
+
+        conn = sqlite3.connect(test_db)
+        conn.execute("UPDATE campaigns SET status = 'draft'")
+        conn.commit()
+        conn.close()
+        monkeypatch.setattr(campaign_service, '_CATALOG_TTL_SECONDS', -1)
+        assert campaign_service.recommend_campaign('ghost_branch')['campaign_id'] is None
@@ -0,0 +1,171 @@
+"""
+Tests for the batch consolidation engine (consolidation_service.consolidate_accounts)
+and the wrappers built on it: consolidate_account, consolidate_all and the
+post-ingestion _consolidate_batch_signals.
+"""
+import json
+import sqlite3
+import time
+
+import pytest
+
+
+pytestmark = pytest.mark.integration
+
+
+def _seed(db_path, signals_per_account, campaign=True):
+    """Seed accounts with signals; ``signals_per_account`` is a list of signal_type lists."""
+    conn = sqlite3.connect(db_path)
+    if campaign:
+        conn.execute("INSERT INTO campaigns (name, status) VALUES ('Dependency Outreach', 'active')")
+    account_ids = []
+    for idx, types in enumerate(signals_per_account):
+        aid = conn.execute("INSERT INTO monitored_accounts (company_name) VALUES (?)", (f'Merge{idx}',)).lastrowid
+        account_ids.append(aid)
+        for n, signal_type in enumerate(types):
+            conn.execute(
+                "INSERT INTO intent_signals (account_id, signal_description, signal_type, evidence_value, "
+                "bdr_quality_score) VALUES (?, ?, ?, ?, ?)",
+                (aid, f'{signal_type} finding', signal_type, f'ev{n}', n + 1),
+            )
+    conn.commit()
+    conn.close()
+    return account_ids
+
+
+def _active(db_path):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        "SELECT account_id, signal_type, evidence_type FROM intent_signals WHERE status != 'archived' "
+        "ORDER BY account_id").fetchall()
+    conn.close()
+    return rows
+
+
+class TestConsolidateAccounts:
+
+    def test_merges_every_candidate_account(self, test_db):
+        from v2.services.consolidation_service import consolidate_accounts
+        ids = _seed(test_db, [
+            ['timezone_library', 'dependency_detected', 'ghost_branch'],
+            ['rfc_discussion', 'funding_round'],
+            ['ghost_branch'],
+        ])
+
+        result = consolidate_accounts()
+
+        assert result['consolidated'] == 2
+        assert result['signals_merged'] == 5
+        assert [a['account_id'] for a in result['accounts']] == ids[:2]
+        assert _active(test_db) == [
+            (ids[0], 'dependency_detected', 'consolidated'),
+            (ids[1], 'rfc_discussion', 'consolidated'),
+            (ids[2], 'ghost_branch', 'manual'),
+        ]
+
+        conn = sqlite3.connect(test_db)
+        desc, evidence, score, campaign_id, fp = conn.execute(
+            "SELECT signal_description, evidence_value, bdr_quality_score, recommended_campaign_id, "
+            "dedup_fingerprint FROM intent_signals WHERE id = ?",
+            (result['accounts'][0]['new_signal_id'],)).fetchone()
+        conn.close()
+        assert desc.startswith('3 i18n signals detected. Dependency Detected:')
+        assert len(json.loads(evidence)) == 3
+        assert score == 3
+        assert campaign_id is not None
+        assert fp
+
+    def test_dry_run_reports_diff_without_writing(self, test_db):
+        from v2.services.consolidation_service import consolidate_accounts
+        ids = _seed(test_db, [['timezone_library', 'dependency_detected'], ['ghost_branch']])
+        before = _active(test_db)
+
+        result = consolidate_accounts(dry_run=True)
+
+        assert _active(test_db) == before
+        assert result['consolidated'] == 1
+        entry = result['accounts'][0]
+        assert entry['account_id'] == ids[0]
+        assert entry['action'] == 'would consolidate'
+        assert len(entry['archive_signal_ids']) == 2
+        assert entry['new_signal']['signal_type'] == 'dependency_detected'
+
+    def test_restricts_to_account_ids_and_chunks_commits(self, test_db):
+        from v2.services.consolidation_service import consolidate_accounts
+        ids = _seed(test_db, [['a', 'b']] * 5)
+
+        result = consolidate_accounts(ids[:3], chunk_size=2)
+
+        assert result['consolidated'] == 3
+        assert len({a['new_signal_id'] for a in result['accounts']}) == 3
+        assert sum(1 for row in _active(test_db) if row[2] == 'consolidated') == 3
+
+    def test_recommend_campaign_called_once_per_type(self, test_db, monkeypatch):
+        from v2.services import campaign_service
+        from v2.services.consolidation_service import consolidate_accounts
+        _seed(test_db, [['ghost_branch', 'timezone_library']] * 4 + [['rfc_discussion', 'funding_round']])
+        calls = []
+        original = campaign_service.recommend_campaign
+
+        def _counting(signal_type, **kwargs):
+            calls.append(signal_type)
+            return original(signal_type, **kwargs)
+
+        monkeypatch.setattr(campaign_service, 'recommend_campaign', _counting)
+        consolidate_accounts()
+        assert sorted(calls) == ['ghost_branch', 'rfc_discussion']
+
+    def test_wrappers(self, test_db):
+        from v2.services.consolidation_service import consolidate_account, consolidate_all
+        ids = _seed(test_db, [['a', 'b'], ['c'], ['d', 'e']])
+
+        assert consolidate_account(ids[1]) is None
+        new_id = consolidate_account(ids[0])
+        assert new_id
+
+        result = consolidate_all()
+        assert [a['account_id'] for a in result['accounts']] == [ids[2]]
+        assert consolidate_all() == {'consolidated': 0, 'signals_merged': 0, 'accounts': []}
+
+    def test_post_ingestion_batch(self, test_db):
+        from v2.services.ingestion_service import _consolidate_batch_signals
+        ids = _seed(test_db, [['a', 'b'], ['c', 'd'], ['e']])
+        conn = sqlite3.connect(test_db)
+        created = [{'signal_id': r[0]} for r in conn.execute(
+            "SELECT id FROM intent_signals WHERE account_id IN (?, ?)", (ids[0], ids[2]))]
+        conn.close()
+
+        assert _consolidate_batch_signals(created) == 1
+        assert [r[0] for r in _active(test_db) if r[2] == 'consolidated'] == [ids[0]]
+
+
+@pytest.mark.slow
+class TestConsolidationBenchmark:
+    """consolidate_all over 5k accounts x 4 signals."""
+
+    def test_consolidate_5k_accounts(self, test_db):
+        conn = sqlite3.connect(test_db)
+        conn.execute("INSERT INTO campaigns (name, status) VALUES ('Dependency Outreach', 'active')")
+        conn.executemany(
+            "INSERT INTO monitored_accounts (id, company_name) VALUES (?, ?)",
+            ((i, f'Bench{i}') for i in range(1, 5001)),
+        )
+        conn.executemany(
+            "INSERT INTO intent_signals (account_id, signal_description, signal_type) VALUES (?, 'bench', ?)",
+            ((a, t) for a in range(1, 5001) for t in ('ghost_branch', 'timezone_library', 'rfc_discussion', 'x')),
+        )
+        conn.commit()
+        conn.close()
+
+        from v2.services.consolidation_service import consolidate_all
+        start = time.perf_counter()
+        preview = consolidate_all(dry_run=True)
+        dry_secs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = consolidate_all()
+        secs = time.perf_counter() - start
+
+        print(f"\n5k accounts / 20k signals: dry-run={dry_secs:.2f}s consolidate={secs:.2f}s")
+        assert preview['consolidated'] == result['consolidated'] == 5000
+        assert result['signals_merged'] == 20000
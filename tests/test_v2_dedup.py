@@ -0,0 +1,308 @@
+"""
+Tests for set-based exact-duplicate detection and the MinHash/LSH
+near-duplicate index in v2.services.dedup_service.
+"""
+import sqlite3
+import time
+
+import pytest
+
+
+pytestmark = pytest.mark.integration
+
+
+def _seed_account(db_path, name):
+    conn = sqlite3.connect(db_path)
+    aid = conn.execute("INSERT INTO monitored_accounts (company_name) VALUES (?)", (name,)).lastrowid
+    conn.commit()
+    conn.close()
+    return aid
+
+
+def _create(account_id, signal_type, evidence, description='sig'):
+    from v2.services.signal_service import create_signal
+    return create_signal(account_id=account_id, signal_description=description,
+                         signal_type=signal_type, evidence_value=evidence)
+
+
+def _raw_signal(db_path, account_id, signal_type, evidence, status='new'):
+    """Insert a signal without a fingerprint, as legacy rows and raw writers do."""
+    conn = sqlite3.connect(db_path)
+    sid = conn.execute(
+        "INSERT INTO intent_signals (account_id, signal_description, signal_type, evidence_value, status) "
+        "VALUES (?, 'raw', ?, ?, ?)",
+        (account_id, signal_type, evidence, status),
+    ).lastrowid
+    conn.commit()
+    conn.close()
+    return sid
+
+
+class TestSignalFingerprint:
+
+    def test_null_and_empty_evidence_differ(self):
+        from v2.services.dedup_service import signal_fingerprint
+        assert signal_fingerprint('t', None) != signal_fingerprint('t', '')
+        assert signal_fingerprint(None, 'x') != signal_fingerprint('', 'x')
+        assert signal_fingerprint('t', 'x') == signal_fingerprint('t', 'x')
+
+    def test_create_signal_persists_fingerprint(self, test_db):
+        from v2.services.dedup_service import signal_fingerprint
+        aid = _seed_account(test_db, 'FpCo')
+        sid = _create(aid, 'ghost_branch', {'branch': 'i18n'})
+
+        conn = sqlite3.connect(test_db)
+        fp, evidence = conn.execute(
+            "SELECT dedup_fingerprint, evidence_value FROM intent_signals WHERE id = ?", (sid,)).fetchone()
+        conn.close()
+        assert fp == signal_fingerprint('ghost_branch', evidence)
+
+
+class TestFindExactDuplicates:
+
+    def test_clusters_keep_oldest_and_ignore_archived(self, test_db):
+        from v2.services.dedup_service import find_exact_duplicates
+        a = _seed_account(test_db, 'DupA')
+        b = _seed_account(test_db, 'DupB')
+        first = _create(a, 'rfc', 'url1')
+        dupes = [_create(a, 'rfc', 'url1') for _ in range(2)]
+        _create(a, 'rfc', 'url2')
+        _create(b, 'rfc', 'url1')
+        null_keep = _create(b, 'ghost', None)
+        null_dupe = _create(b, 'ghost', None)
+        _create(b, 'ghost', '')
+        _raw_signal(test_db, a, 'rfc', 'url1', status='archived')
+
+        clusters = find_exact_duplicates()
+
+        assert [c['count'] for c in clusters] == [3, 2]
+        assert clusters[0]['keep_signal_id'] == first
+        assert clusters[0]['duplicate_signal_ids'] == dupes
+        assert clusters[0]['company_name'] == 'DupA'
+        assert set(clusters[0]['signals'][0]) == {
+            'id', 'signal_description', 'signal_source', 'status', 'created_at', 'company_name'}
+        assert clusters[1]['keep_signal_id'] == null_keep
+        assert clusters[1]['duplicate_signal_ids'] == [null_dupe]
+        assert clusters[1]['evidence_value'] is None
+
+    def test_legacy_rows_are_fingerprinted_on_demand(self, test_db):
+        from v2.services.dedup_service import find_exact_duplicates
+        aid = _seed_account(test_db, 'LegacyDup')
+        keep = _raw_signal(test_db, aid, 'rfc', 'same')
+        _raw_signal(test_db, aid, 'rfc', 'same')
+        _create(aid, 'rfc', 'same')
+
+        clusters = find_exact_duplicates()
+        assert len(clusters) == 1
+        assert clusters[0]['keep_signal_id'] == keep
+        assert clusters[0]['count'] == 3
+
+
+class TestSetBasedArchive:
+
+    def test_auto_archive_exact_duplicates(self, test_db):
+        from v2.services.dedup_service import auto_archive_exact_duplicates, find_exact_duplicates
+        a = _seed_account(test_db, 'AutoA')
+        keep = _create(a, 'rfc', 'x')
+        for _ in range(3):
+            _create(a, 'rfc', 'x')
+        _create(a, 'rfc', 'y')
+        keep_b = _create(a, 'dep', 'z')
+        _create(a, 'dep', 'z')
+
+        result = auto_archive_exact_duplicates()
+
+        assert result == {'clusters_processed': 2, 'signals_archived': 4}
+        assert find_exact_duplicates() == []
+        conn = sqlite3.connect(test_db)
+        logged = sorted(r[0] for r in conn.execute(
+            "SELECT entity_id FROM activity_log WHERE event_type = 'duplicates_archived'"))
+        active = conn.execute("SELECT COUNT(*) FROM intent_signals WHERE status != 'archived'").fetchone()[0]
+        conn.close()
+        assert logged == sorted([keep, keep_b])
+        assert active == 3
+        assert auto_archive_exact_duplicates() == {'clusters_processed': 0, 'signals_archived': 0}
+
+    def test_consolidate_same_type_duplicates(self, test_db):
+        from v2.services.dedup_service import consolidate_same_type_duplicates
+        a = _seed_account(test_db, 'TypeA')
+        keep = _create(a, 'timezone_library', 'e1')
+        for i in range(4):
+            _create(a, 'timezone_library', f'e{i + 2}')
+        _create(a, 'rfc', 'only')
+
+        assert consolidate_same_type_duplicates() == {'clusters_processed': 1, 'signals_archived': 4}
+
+        conn = sqlite3.connect(test_db)
+        remaining = sorted(r[0] for r in conn.execute(
+            "SELECT id FROM intent_signals WHERE status != 'archived' AND signal_type = 'timezone_library'"))
+        conn.close()
+        assert remaining == [keep]
+
+    def test_summary_and_same_type_groups(self, test_db):
+        from v2.services.dedup_service import find_same_account_type_dupes, get_dedup_summary
+        a = _seed_account(test_db, 'SumA')
+        for ev in ('x', 'x', 'y'):
+            _create(a, 'rfc', ev)
+        _create(a, 'dep', 'z')
+
+        summary = get_dedup_summary()
+        assert summary['total_active_signals'] == 4
+        assert summary['exact_duplicates'] == 1
+        assert summary['same_type_clusters'] == 1
+
+        groups = find_same_account_type_dupes(a)
+        assert len(groups) == 1
+        assert groups[0]['count'] == 3
+        assert groups[0]['all_same_evidence'] is False
+
+    def test_same_type_groups_capped_largest_first(self, test_db):
+        from v2.services.dedup_service import find_same_account_type_dupes
+        for i in range(51):
+            a = _seed_account(test_db, f'Cap{i}')
+            for ev in ('x', 'y'):
+                _create(a, 'rfc', f'{ev}{i}')
+        big = _seed_account(test_db, 'CapBig')
+        for ev in ('p', 'q', 'r'):
+            _create(big, 'dep', ev)
+
+        groups = find_same_account_type_dupes()
+        assert len(groups) == 50
+        assert (groups[0]['account_id'], groups[0]['count']) == (big, 3)
+        assert all(g['count'] == 2 for g in groups[1:])
+
+
+ANNOUNCEMENT = [
+    "Stripe hiring Localization Program Manager to lead i18n efforts across 30 markets",
+    "Job posting: Localization Program Manager at Stripe to lead i18n efforts across 30 markets",
+    "Stripe is hiring a Localization Program Manager to lead its i18n efforts in 30 markets",
+]
+
+
+class TestNearDuplicates:
+
+    def test_signature_similarity(self):
+        from v2.services.dedup_service import near_dup_signature, signature_similarity
+        sig = near_dup_signature(ANNOUNCEMENT[0], None)
+        assert len(sig) == 64 * 8
+        assert signature_similarity(sig, near_dup_signature(ANNOUNCEMENT[0].upper() + '!', None)) == 1.0
+        assert signature_similarity(sig, near_dup_signature(ANNOUNCEMENT[1], None)) >= 0.45
+        assert signature_similarity(sig, near_dup_signature('New GitHub repo created for payments API', None)) < 0.2
+        assert near_dup_signature(None, '') == ''
+
+    def test_create_signal_indexes_bands(self, test_db):
+        aid = _seed_account(test_db, 'BandCo')
+        sid = _create(aid, 'job', 'url', description=ANNOUNCEMENT[0])
+        conn = sqlite3.connect(test_db)
+        bands = conn.execute("SELECT COUNT(*) FROM signal_lsh_bands WHERE signal_id = ?", (sid,)).fetchone()[0]
+        conn.close()
+        assert bands == 32
+
+    def test_clusters_reworded_signals_per_account(self, test_db):
+        from v2.services.dedup_service import find_near_duplicates, find_similar_signals
+        a = _seed_account(test_db, 'NearA')
+        b = _seed_account(test_db, 'NearB')
+        ids = [_create(a, 'job', None, description=d) for d in ANNOUNCEMENT]
+        _create(a, 'repo', None, description='New GitHub repo created for payments API with Go')
+        _create(b, 'job', None, description=ANNOUNCEMENT[0])
+        archived = _create(a, 'job', None, description=ANNOUNCEMENT[0])
+        conn = sqlite3.connect(test_db)
+        conn.execute("UPDATE intent_signals SET status = 'archived' WHERE id = ?", (archived,))
+        conn.commit()
+        conn.close()
+
+        clusters = find_near_duplicates()
+        assert len(clusters) == 1
+        assert clusters[0]['account_id'] == a
+        assert clusters[0]['keep_signal_id'] == ids[0]
+        assert clusters[0]['duplicate_signal_ids'] == ids[1:]
+        assert clusters[0]['signals'][0]['similarity'] == 1.0
+        assert find_near_duplicates(account_id=b) == []
+        assert find_near_duplicates(threshold=1.0) == []
+
+        matches = find_similar_signals(ids[1])
+        assert {m['id'] for m in matches} == {ids[0], ids[2]}
+        assert find_similar_signals(999999) is None
+
+    def test_legacy_rows_are_indexed_on_demand(self, test_db):
+        from v2.services.dedup_service import find_near_duplicates
+        aid = _seed_account(test_db, 'NearLegacy')
+        keep = _raw_signal(test_db, aid, 'job', ANNOUNCEMENT[0])
+        _create(aid, 'job', ANNOUNCEMENT[1])
+
+        clusters = find_near_duplicates()
+        assert [c['keep_signal_id'] for c in clusters] == [keep]
+
+        # Nulling the signature re-indexes the signal (e.g. after an account move)
+        other = _seed_account(test_db, 'NearMoved')
+        conn = sqlite3.connect(test_db)
+        conn.execute("UPDATE intent_signals SET account_id = ?, minhash_signature = NULL WHERE id = ?",
+                     (other, keep))
+        conn.commit()
+        conn.close()
+        assert find_near_duplicates() == []
+
+    def test_endpoints(self, flask_app, test_db):
+        aid = _seed_account(test_db, 'NearApi')
+        ids = [_create(aid, 'job', None, description=d) for d in ANNOUNCEMENT[:2]]
+
+        data = flask_app.get(f'/v2/api/dedup/near?account_id={aid}').get_json()
+        assert data['total_clusters'] == 1
+        assert data['total_duplicates'] == 1
+
+        data = flask_app.get(f'/v2/api/dedup/near/{ids[0]}?threshold=0.4').get_json()
+        assert [m['id'] for m in data['matches']] == [ids[1]]
+
+        assert flask_app.get('/v2/api/dedup/near?threshold=2').status_code == 400
+        assert flask_app.get('/v2/api/dedup/near/999999').status_code == 404
+
+
+@pytest.mark.slow
+class TestDedupBenchmark:
+    """Exact dedup over 100k signals in a single pass."""
+
+    def test_find_and_archive_100k(self, test_db):
+        from v2.services.dedup_service import auto_archive_exact_duplicates, find_exact_duplicates
+        conn = sqlite3.connect(test_db)
+        conn.executemany(
+            "INSERT INTO monitored_accounts (id, company_name) VALUES (?, ?)",
+            ((i, f'Bench{i}') for i in range(1, 2001)),
+        )
+        # 50 signals per account across 25 fingerprints -> 25k exact duplicates
+        conn.executemany(
+            "INSERT INTO intent_signals (account_id, signal_description, signal_type, evidence_value) "
+            "VALUES (?, 'bench', 'rfc', ?)",
+            ((a, f'ev{n % 25}') for a in range(1, 2001) for n in range(50)),
+        )
+        conn.commit()
+        conn.close()
+
+        start = time.perf_counter()
+        clusters = find_exact_duplicates()
+        find_secs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = auto_archive_exact_duplicates()
+        archive_secs = time.perf_counter() - start
+
+        print(f"\n100k signals: find={find_secs:.2f}s (incl. fingerprint backfill) "
+              f"auto-archive={archive_secs:.2f}s")
+        assert len(clusters) == 50_000
+        assert result['signals_archived'] == 50_000
+
+    def test_near_dup_index_inline_ingestion(self, test_db):
+        from v2.services.dedup_service import find_near_duplicates
+        accounts = [_seed_account(test_db, f'Ingest{i}') for i in range(200)]
+        start = time.perf_counter()
+        for n in range(2000):
+            _create(accounts[n % 200], 'job', f'https://jobs.example.com/{n}',
+                    description=f'{ANNOUNCEMENT[n % 3]} (posting {n % 7})')
+        ingest_ms = (time.perf_counter() - start) * 1000 / 2000
+
+        start = time.perf_counter()
+        clusters = find_near_duplicates()
+        find_secs = time.perf_counter() - start
+
+        print(f"\n2k signals: create_signal={ingest_ms:.2f}ms avg incl. LSH indexing, "
+              f"near-dup scan={find_secs:.2f}s, {len(clusters)} clusters")
+        assert len(clusters) == 200
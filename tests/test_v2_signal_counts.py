@@ -0,0 +1,157 @@
+"""
+Tests for the trigger-maintained signal_status_counts table behind the
+queue tab counts (get_signal_counts_by_status / check_signal_status_counts).
+
+Every test drives the real write paths and then asserts the materialized
+counts agree with a live recount.
+"""
+import sqlite3
+
+import pytest
+
+
+pytestmark = pytest.mark.integration
+
+
+def _assert_consistent():
+    from v2.services.signal_service import check_signal_status_counts
+    result = check_signal_status_counts()
+    assert result['consistent'], result['mismatches']
+
+
+def _live_counts(db_path):
+    """The pre-materialization join-and-group computation."""
+    conn = sqlite3.connect(db_path)
+    counts = dict(conn.execute('''
+        SELECT a.account_status, COUNT(*) FROM intent_signals s
+        JOIN monitored_accounts a ON s.account_id = a.id
+        WHERE s.status != 'archived' GROUP BY a.account_status
+    ''').fetchall())
+    noise = conn.execute('''
+        SELECT COUNT(*) FROM intent_signals s
+        JOIN monitored_accounts a ON s.account_id = a.id
+        WHERE a.account_status = 'noise'
+    ''').fetchone()[0]
+    conn.close()
+    if noise:
+        counts['noise'] = noise
+    return counts
+
+
+@pytest.fixture
+def accounts(test_db):
+    from v2.services.account_service import find_or_create_account
+    from v2.services.signal_service import create_signal
+    ids = [find_or_create_account(f'CountCo{i}') for i in range(3)]
+    for aid in ids:
+        for n in range(3):
+            create_signal(account_id=aid, signal_description=f'sig {n}')
+    return ids
+
+
+class TestSignalStatusCounts:
+
+    def test_create_signal_updates_counts(self, test_db, accounts):
+        from v2.services.signal_service import get_signal_counts_by_status
+        assert get_signal_counts_by_status() == {'new': 9}
+        _assert_consistent()
+
+    def test_signal_status_change_and_archive(self, test_db, accounts):
+        from v2.services.signal_service import (
+            get_signal_counts_by_status, update_signal_status, archive_signal,
+        )
+        update_signal_status(1, 'actioned')
+        archive_signal(2)
+        archive_signal(2)
+
+        assert get_signal_counts_by_status() == _live_counts(test_db) == {'new': 8}
+        _assert_consistent()
+
+    def test_account_transitions_cascade(self, test_db, accounts):
+        from v2.services.account_service import (
+            mark_account_noise, mark_account_sequenced, mark_account_revisit,
+        )
+        from v2.services.signal_service import get_signal_counts_by_status
+
+        mark_account_sequenced(accounts[0])
+        mark_account_noise(accounts[1])
+        assert get_signal_counts_by_status() == _live_counts(test_db) == {
+            'new': 3, 'sequenced': 3, 'noise': 3}
+
+        mark_account_revisit(accounts[0])
+        mark_account_noise(accounts[0])
+        assert get_signal_counts_by_status() == _live_counts(test_db) == {'new': 3, 'noise': 6}
+        _assert_consistent()
+
+    def test_account_delete_and_bulk_clear(self, test_db, accounts):
+        import database
+        from v2.services.ingestion_service import _clear_all_signals
+        from v2.services.signal_service import get_signal_counts_by_status
+
+        database.delete_account(accounts[0])
+        assert get_signal_counts_by_status() == _live_counts(test_db) == {'new': 6}
+        _assert_consistent()
+
+        _clear_all_signals()
+        assert get_signal_counts_by_status() == {}
+        _assert_consistent()
+
+    def test_raw_sql_moves_between_accounts(self, test_db, accounts):
+        from v2.services.account_service import mark_account_sequenced
+        mark_account_sequenced(accounts[2])
+
+        conn = sqlite3.connect(test_db)
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("UPDATE intent_signals SET account_id = ? WHERE account_id = ?",
+                     (accounts[2], accounts[0]))
+        conn.execute("UPDATE monitored_accounts SET account_status = NULL WHERE id = ?", (accounts[1],))
+        conn.commit()
+        conn.close()
+
+        from v2.services.signal_service import get_signal_counts_by_status
+        assert get_signal_counts_by_status() == _live_counts(test_db)
+        _assert_consistent()
+
+    def test_checker_detects_and_repairs_drift(self, test_db, accounts):
+        from v2.services.signal_service import check_signal_status_counts, get_signal_counts_by_status
+        conn = sqlite3.connect(test_db)
+        conn.execute("UPDATE signal_status_counts SET visible_count = 42 WHERE workflow_status = 'new'")
+        conn.execute("INSERT INTO signal_status_counts (workflow_status, visible_count, total_count) "
+                     "VALUES ('revisit', 5, 5)")
+        conn.commit()
+        conn.close()
+
+        result = check_signal_status_counts()
+        assert not result['consistent']
+        assert {m['workflow_status'] for m in result['mismatches']} == {'new', 'revisit'}
+        assert result['repaired'] is False
+
+        assert check_signal_status_counts(repair=True)['repaired'] is True
+        assert get_signal_counts_by_status() == {'new': 9}
+        _assert_consistent()
+
+    def test_seeds_from_existing_data(self, test_db, accounts):
+        import database
+        conn = sqlite3.connect(test_db)
+        conn.execute("DELETE FROM signal_status_counts")
+        conn.commit()
+        conn.close()
+
+        database.init_db()
+        _assert_consistent()
+
+
+class TestSignalCountsCheckEndpoint:
+
+    def test_check_and_repair(self, flask_app, test_db, accounts):
+        conn = sqlite3.connect(test_db)
+        conn.execute("UPDATE signal_status_counts SET total_count = 0")
+        conn.commit()
+        conn.close()
+
+        data = flask_app.post('/v2/api/signals/counts/check', json={}).get_json()
+        assert data['consistent'] is False
+
+        data = flask_app.post('/v2/api/signals/counts/check', json={'repair': True}).get_json()
+        assert data['repaired'] is True
+        assert flask_app.post('/v2/api/signals/counts/check').get_json()['consistent'] is True
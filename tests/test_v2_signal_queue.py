@@ -0,0 +1,150 @@
+"""
+Tests for signal queue keyset pagination (list_signals cursor mode,
+/v2/api/signals?cursor=..., and the supporting composite indexes).
+"""
+import sqlite3
+import time
+
+import pytest
+
+
+pytestmark = pytest.mark.integration
+
+
+def _seed_queue(db_path, accounts):
+    """Seed accounts and signals.
+
+    ``accounts`` is a list of (tier, account_status, owner, n_signals). Signals
+    cycle through five created_at values so ties exercise the id tiebreaker.
+    """
+    conn = sqlite3.connect(db_path)
+    for idx, (tier, status, owner, n) in enumerate(accounts):
+        cur = conn.execute(
+            "INSERT INTO monitored_accounts (company_name, current_tier, account_status, account_owner) "
+            "VALUES (?, ?, ?, ?)",
+            (f'Corp{idx}', tier, status, owner),
+        )
+        aid = cur.lastrowid
+        for i in range(n):
+            conn.execute(
+                "INSERT INTO intent_signals (account_id, signal_description, created_at) VALUES (?, ?, ?)",
+                (aid, f'sig {idx}-{i}', f'2026-01-{(i % 5) + 1:02d} 10:00:00'),
+            )
+    conn.commit()
+    conn.close()
+
+
+def _walk(**kwargs):
+    from v2.services.signal_service import list_signals
+    pages, token = [], None
+    while True:
+        page = list_signals(cursor=token, **kwargs)
+        pages.append(page)
+        token = page['next_cursor']
+        if token is None:
+            return pages
+
+
+class TestKeysetPagination:
+
+    def test_cursor_walk_matches_offset_order(self, test_db):
+        _seed_queue(test_db, [(2, 'new', 'ann', 7), (0, 'new', 'bob', 6), (1, 'new', None, 8)])
+        from v2.services.signal_service import list_signals
+
+        expected = [s['id'] for s in list_signals(limit=1000)['signals']]
+        pages = _walk(limit=4)
+
+        walked = [s['id'] for p in pages for s in p['signals']]
+        assert walked == expected
+        assert len(walked) == 21
+        assert all(len(p['signals']) <= 4 for p in pages)
+
+    def test_cursor_respects_filters(self, test_db):
+        _seed_queue(test_db, [(1, 'new', 'ann', 5), (1, 'sequenced', 'ann', 5), (0, 'new', 'bob', 5)])
+
+        pages = _walk(status='new', owner='ann', limit=2)
+
+        signals = [s for p in pages for s in p['signals']]
+        assert len(signals) == 5
+        assert {s['account_owner'] for s in signals} == {'ann'}
+
+    def test_include_total_false_skips_count(self, test_db):
+        _seed_queue(test_db, [(1, 'new', None, 3)])
+        from v2.services.signal_service import list_signals
+
+        result = list_signals(limit=10, include_total=False)
+        assert result['total'] is None
+        assert len(result['signals']) == 3
+        assert result['next_cursor'] is None
+
+    def test_invalid_cursor_raises(self, test_db):
+        from v2.services.signal_service import list_signals
+        with pytest.raises(ValueError):
+            list_signals(cursor='not-a-cursor')
+
+    def test_composite_indexes_exist(self, test_db):
+        conn = sqlite3.connect(test_db)
+        names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        conn.close()
+        assert {'idx_intent_signals_status_created', 'idx_intent_signals_account_created',
+                'idx_accounts_status_owner'} <= names
+
+
+class TestSignalsEndpointCursor:
+
+    def test_endpoint_pages_with_cursor(self, flask_app, test_db):
+        _seed_queue(test_db, [(1, 'new', None, 5)])
+
+        first = flask_app.get('/v2/api/signals?limit=3').get_json()
+        assert first['total'] == 5
+        assert first['next_cursor']
+
+        second = flask_app.get(f"/v2/api/signals?limit=3&cursor={first['next_cursor']}").get_json()
+        assert second['total'] is None
+        assert second['next_cursor'] is None
+        ids = [s['id'] for s in first['signals'] + second['signals']]
+        assert len(set(ids)) == 5
+
+    def test_endpoint_rejects_bad_cursor(self, flask_app, test_db):
+        resp = flask_app.get('/v2/api/signals?cursor=%%%')
+        assert resp.status_code == 400
+
+
+@pytest.mark.slow
+class TestSignalQueueBenchmark:
+    """Deep-page latency at 500k signals: keyset pages stay flat, offset pages don't."""
+
+    N_ACCOUNTS = 5000
+    PER_ACCOUNT = 100
+
+    def test_deep_keyset_page_is_fast_at_500k(self, test_db):
+        conn = sqlite3.connect(test_db)
+        conn.executemany(
+            "INSERT INTO monitored_accounts (id, company_name, current_tier, account_status) VALUES (?, ?, ?, 'new')",
+            ((i, f'Corp{i}', i % 5) for i in range(1, self.N_ACCOUNTS + 1)),
+        )
+        conn.executemany(
+            "INSERT INTO intent_signals (account_id, signal_description, created_at) VALUES (?, 'bench', ?)",
+            ((a, f'2026-01-01 {(n // 60) % 24:02d}:{n % 60:02d}:00')
+             for a in range(1, self.N_ACCOUNTS + 1) for n in range(self.PER_ACCOUNT)),
+        )
+        conn.commit()
+        conn.execute("ANALYZE")
+        conn.close()
+
+        from v2.services.signal_service import list_signals
+
+        deep_offset = 400_000
+        start = time.perf_counter()
+        by_offset = list_signals(limit=50, offset=deep_offset, include_total=False)
+        offset_secs = time.perf_counter() - start
+
+        anchor = list_signals(limit=1, offset=deep_offset - 1, include_total=False)
+        start = time.perf_counter()
+        by_cursor = list_signals(limit=50, cursor=anchor['next_cursor'], include_total=False)
+        cursor_secs = time.perf_counter() - start
+
+        print(f"\n500k signals, page at offset {deep_offset}: "
+              f"offset={offset_secs * 1000:.0f}ms keyset={cursor_secs * 1000:.0f}ms")
+        assert [s['id'] for s in by_cursor['signals']] == [s['id'] for s in by_offset['signals']]
+        assert cursor_secs < offset_secs
@@ -0,0 +1,162 @@
+"""
+Tests for the single-connection signal workspace loader
+(signal_service.get_signal_workspace).
+"""
+import json
+import sqlite3
+import time
+
+import pytest
+
+
+pytestmark = pytest.mark.integration
+
+
+SCORING = {
+    'org_maturity_level': 3,
+    'org_maturity_label': 'Preparing',
+    'org_intent_score': 72,
+    'readiness_index': 0.64,
+    'confidence_percent': 80,
+    'outreach_angle_label': 'Pre-launch',
+    'risk_level': 'low',
+}
+
+
+def _seed_workspace(db_path, scan_data=None, n_prospects=2, drafts_per_prospect=2, company='WsCorp'):
+    conn = sqlite3.connect(db_path)
+    report_id = None
+    if scan_data is not None:
+        report_id = conn.execute(
+            "INSERT INTO reports (company_name, scan_data) VALUES ('WsCorp', ?)",
+            (scan_data if isinstance(scan_data, str) else json.dumps(scan_data),),
+        ).lastrowid
+    aid = conn.execute(
+        "INSERT INTO monitored_accounts (company_name, latest_report_id) VALUES (?, ?)",
+        (company, report_id),
+    ).lastrowid
+    cid = conn.execute("INSERT INTO campaigns (name) VALUES ('Launch')").lastrowid
+    for priority in (2, 1):
+        conn.execute(
+            "INSERT INTO campaign_personas (campaign_id, persona_name, sequence_id, priority) VALUES (?, ?, 'seq', ?)",
+            (cid, f'persona{priority}', priority),
+        )
+    sid = conn.execute(
+        "INSERT INTO intent_signals (account_id, signal_description, recommended_campaign_id) VALUES (?, 'sig', ?)",
+        (aid, cid),
+    ).lastrowid
+    for i in range(n_prospects):
+        pid = conn.execute(
+            "INSERT INTO prospects (account_id, signal_id, full_name, email) VALUES (?, ?, ?, ?)",
+            (aid, sid, f'P{i}', f'p{i}@wscorp.com'),
+        ).lastrowid
+        for step in range(1, drafts_per_prospect + 1):
+            conn.execute(
+                "INSERT INTO drafts (prospect_id, signal_id, sequence_step, subject, status) "
+                "VALUES (?, ?, ?, 's', 'approved')",
+                (pid, sid, step),
+            )
+    conn.commit()
+    conn.close()
+    return sid
+
+
+@pytest.fixture
+def sql_trace(monkeypatch):
+    """Record connections opened and statements executed through database.py."""
+    import database
+    stats = {'connections': 0, 'statements': []}
+    original = database.get_db_connection
+
+    def _traced():
+        conn = original()
+        stats['connections'] += 1
+        conn.set_trace_callback(stats['statements'].append)
+        return conn
+
+    monkeypatch.setattr(database, 'get_db_connection', _traced)
+    return stats
+
+
+class TestWorkspaceLoader:
+
+    def test_loads_full_workspace_on_one_connection(self, test_db, sql_trace):
+        sid = _seed_workspace(test_db, {'scoring_v2': SCORING, 'repos': ['x'] * 10})
+        from v2.services.signal_service import get_signal_workspace
+
+        ws = get_signal_workspace(sid)
+
+        assert sql_trace['connections'] == 1
+        assert len(sql_trace['statements']) <= 7
+        assert ws['signal']['id'] == sid
+        assert ws['account']['company_name'] == 'WsCorp'
+        assert ws['campaign']['name'] == 'Launch'
+        assert [p['priority'] for p in ws['personas']] == [1, 2]
+        assert len(ws['prospects']) == 2
+        assert len(ws['drafts']) == 4
+        assert ws['enrollment_ready'] is True
+        assert ws['scorecard'] == {
+            'maturity_level': 3,
+            'maturity_label': 'Preparing',
+            'intent_score': 72,
+            'readiness_index': 0.64,
+            'confidence_percent': 80,
+            'outreach_angle': 'Pre-launch',
+            'risk_level': 'low',
+        }
+        assert not any(k.startswith('sc_') for k in ws['signal'])
+
+    def test_scorecard_none_without_report_or_scoring(self, test_db):
+        from v2.services.signal_service import get_signal_workspace
+        assert get_signal_workspace(_seed_workspace(test_db))['scorecard'] is None
+        assert get_signal_workspace(_seed_workspace(test_db, {'repos': []}, company='Other'))['scorecard'] is None
+
+    def test_malformed_scan_data_is_tolerated(self, test_db):
+        from v2.services.signal_service import get_signal_workspace
+        ws = get_signal_workspace(_seed_workspace(test_db, '{not json'))
+        assert ws['scorecard'] is None
+        assert ws['signal']
+
+    def test_scorecard_read_from_denormalized_columns(self, test_db):
+        sid = _seed_workspace(test_db, {})
+        conn = sqlite3.connect(test_db)
+        conn.execute(
+            "UPDATE reports SET scorecard_extracted = 1, org_maturity_label = 'Thinking', "
+            "org_intent_score = 55, scan_data = '{not json'"
+        )
+        conn.commit()
+        conn.close()
+        from v2.services.signal_service import get_signal_workspace
+
+        scorecard = get_signal_workspace(sid)['scorecard']
+        assert scorecard['maturity_label'] == 'Thinking'
+        assert scorecard['intent_score'] == 55
+        assert scorecard['risk_level'] is None
+
+    def test_missing_signal_returns_none(self, test_db):
+        from v2.services.signal_service import get_signal_workspace
+        assert get_signal_workspace(999999) is None
+
+
+@pytest.mark.slow
+class TestWorkspaceBenchmark:
+    """Workspace latency with a multi-megabyte scan report and a busy signal."""
+
+    def test_workspace_latency(self, test_db):
+        scan_data = {
+            'scoring_v2': SCORING,
+            'signals': [{'repo': f'repo{i}', 'evidence': 'x' * 400} for i in range(5000)],
+        }
+        sid = _seed_workspace(test_db, scan_data, n_prospects=25, drafts_per_prospect=4)
+        from v2.services.signal_service import get_signal_workspace
+
+        get_signal_workspace(sid)
+        runs = 20
+        start = time.perf_counter()
+        for _ in range(runs):
+            ws = get_signal_workspace(sid)
+        avg_ms = (time.perf_counter() - start) * 1000 / runs
+
+        print(f"\nworkspace load ({len(json.dumps(scan_data)) // 1024} KB scan_data, "
+              f"{len(ws['prospects'])} prospects, {len(ws['drafts'])} drafts): {avg_ms:.1f}ms avg")
+        assert ws['scorecard']['intent_score'] == 72
@@ -0,0 +1,121 @@
+"""
+Tests for populate_webscraper_from_reporadar (full and incremental) and the
+webscraper_bulk_* helpers.
+"""
+import sqlite3
+
+import pytest
+
+
+pytestmark = pytest.mark.integration
+
+
+def _insert_accounts(db_path, rows):
+    """Insert (company_name, website) monitored accounts; returns ids."""
+    conn = sqlite3.connect(db_path)
+    ids = [conn.execute("INSERT INTO monitored_accounts (company_name, website) VALUES (?, ?)", row).lastrowid
+           for row in rows]
+    conn.commit()
+    conn.close()
+    return ids
+
+
+def _linked(db_path):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT monitored_account_id, website_url, current_tier, scan_status "
+                        "FROM webscraper_accounts ORDER BY monitored_account_id").fetchall()
+    conn.close()
+    return rows
+
+
+def _backdate_last_run(db_path):
+    """Make the recorded last run older than every change stamp."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE system_settings SET value = '2000-01-01 00:00:00' WHERE key = 'webscraper_populated_at'")
+    conn.execute("UPDATE monitored_accounts SET website_changed_at = '1999-01-01 00:00:00'")
+    conn.commit()
+    conn.close()
+
+
+class TestPopulateWebscraper:
+
+    def test_full_population_links_each_account_once(self, test_db):
+        import database
+        ids = _insert_accounts(test_db, [('Acme', 'acme.com'), ('Blank', '  '), ('NoSite', None),
+                                         ('Globex', 'globex.com')])
+        conn = sqlite3.connect(test_db)
+        conn.execute("UPDATE monitored_accounts SET archived_at = CURRENT_TIMESTAMP WHERE id = ?", (ids[3],))
+        conn.commit()
+        conn.close()
+
+        assert database.populate_webscraper_from_reporadar() == {'created': 1, 'skipped': 0, 'errors': 0}
+        assert _linked(test_db) == [(ids[0], 'acme.com', 4, 'not_scanned')]
+
+        assert database.populate_webscraper_from_reporadar() == {'created': 0, 'skipped': 1, 'errors': 0}
+        assert len(_linked(test_db)) == 1
+
+    def test_incremental_only_considers_changed_accounts(self, test_db):
+        import database
+        ids = _insert_accounts(test_db, [('Acme', 'acme.com'), ('Initech', None), ('Hooli', 'hooli.com')])
+        database.populate_webscraper_from_reporadar(incremental=True)
+        assert [r[0] for r in _linked(test_db)] == [ids[0], ids[2]]
+        _backdate_last_run(test_db)
+
+        # Hooli's row is removed out of band: a full run restores it, an incremental one does not
+        conn = sqlite3.connect(test_db)
+        conn.execute("DELETE FROM webscraper_accounts WHERE monitored_account_id = ?", (ids[2],))
+        conn.execute("UPDATE monitored_accounts SET website = 'initech.com' WHERE id = ?", (ids[1],))
+        conn.commit()
+        conn.close()
+        new_id = _insert_accounts(test_db, [('Pied Piper', 'piedpiper.com')])[0]
+
+        result = database.populate_webscraper_from_reporadar(incremental=True)
+        assert result == {'created': 2, 'skipped': 0, 'errors': 0}
+        assert [r[0] for r in _linked(test_db)] == [ids[0], ids[1], new_id]
+
+        database.populate_webscraper_from_reporadar()
+        assert [r[0] for r in _linked(test_db)] == [ids[0], ids[1], ids[2], new_id]
+
+    def test_monitored_account_link_is_unique(self, test_db):
+        import database
+        account_id = _insert_accounts(test_db, [('Acme', 'acme.com')])[0]
+        database.populate_webscraper_from_reporadar()
+
+        conn = sqlite3.connect(test_db)
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute("INSERT INTO webscraper_accounts (company_name, monitored_account_id) VALUES ('Acme', ?)",
+                         (account_id,))
+        conn.close()
+
+    def test_duplicate_merge_keeps_one_webscraper_row(self, test_db):
+        import database
+        keep_id, dup_id = _insert_accounts(test_db, [('Stark', 'stark.com'), ('stark', 'stark.io')])
+        database.populate_webscraper_from_reporadar()
+
+        database.cleanup_duplicate_accounts()
+
+        assert [r[0] for r in _linked(test_db)].count(max(keep_id, dup_id)) == 1
+
+
+class TestWebscraperBulk:
+
+    def test_bulk_helpers_chunk_long_id_lists(self, test_db, monkeypatch):
+        import database
+        monkeypatch.setattr(database, '_BULK_WRITE_CHUNK_SIZE', 2)
+        _insert_accounts(test_db, [(f'Co{i}', f'co{i}.com') for i in range(5)])
+        database.populate_webscraper_from_reporadar()
+        conn = sqlite3.connect(test_db)
+        ids = [r[0] for r in conn.execute("SELECT id FROM webscraper_accounts ORDER BY id")]
+        conn.close()
+
+        assert database.webscraper_bulk_change_tier(ids + ids[:1], 2) == 5
+        assert database.webscraper_bulk_archive(ids[:3]) == 3
+        assert database.webscraper_bulk_archive(ids[:3]) == 0
+        assert database.webscraper_bulk_delete(ids[3:]) == 2
+        assert database.webscraper_bulk_change_tier(ids, 9) == 0
+
+        conn = sqlite3.connect(test_db)
+        rows = conn.execute("SELECT current_tier, tier_label, archived_at IS NOT NULL "
+                            "FROM webscraper_accounts").fetchall()
+        conn.close()
+        assert rows == [(2, 'Active Expansion', 1)] * 3
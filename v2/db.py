@@ -7,7 +7,13 @@ This keeps the coupling clean and provides v2-specific convenience functions.
 import json
 import logging
 from contextlib import contextmanager
-from database import db_connection as _db_connection, _insert_returning_id
+from database import (
+    db_connection as _db_connection, _insert_returning_id, _json_path_sql,
+    get_campaigns_generation as _get_campaigns_generation,
+    _search_match_query, _search_join_sql, parse_revenue_usd as _parse_revenue_usd,
+    _touch_accounts, EventLogSink, _event_timestamp, flush_event_logs as _flush_event_logs,
+    get_log_retention_policy, get_log_rollup_counts,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +28,77 @@ def insert_returning_id(cursor, sql, params):
     return _insert_returning_id(cursor, sql, params)
 
 
+def json_path_sql(column, *path):
+    """SQL expression selecting the JSON value at ``path`` inside ``column``.
+
+    Lets queries pull a few fields out of a large JSON blob without shipping
+    and parsing the whole document in Python. Malformed JSON yields NULL.
+    """
+    return _json_path_sql(column, *path)
+
+
+def search_match_query(text):
+    """Full-text query string for ``text`` (every word as a prefix), or None."""
+    return _search_match_query(text)
+
+
+def search_join_sql(index, alias, key_column):
+    """JOIN restricting rows to full-text hits; exposes ``{alias}.search_rank``.
+
+    ``index`` is 'signals' or 'accounts'. Bind search_match_query() to the
+    single placeholder; lower search_rank is a better match.
+    """
+    return _search_join_sql(index, alias, key_column)
+
+
+def parse_revenue_usd(annual_revenue):
+    """Whole US dollars from a revenue string like "$50M" (None if unparseable)."""
+    return _parse_revenue_usd(annual_revenue)
+
+
+def accounts_changed():
+    """Drop cached account/scorecard datatable counts after an account write.
+
+    Call after committing an insert, delete, or a change to a filterable
+    column (name, org, website, revenue, tier, archive state).
+    """
+    _touch_accounts()
+
+
+def event_log_sink(name, insert_sql):
+    """Batched writer for an append-only log table (see database.EventLogSink).
+
+    ``sink.log(row)`` queues a tuple for ``insert_sql``'s placeholders; rows
+    are written in multi-row batches by a background thread.
+    """
+    return EventLogSink(name, insert_sql)
+
+
+def event_timestamp():
+    """UTC 'YYYY-MM-DD HH:MM:SS' for a log row's created_at, taken when the event happens."""
+    return _event_timestamp()
+
+
+def flush_event_logs():
+    """Write all queued activity/audit events now (tests, shutdown, read-your-writes)."""
+    return _flush_event_logs()
+
+
+def log_hot_days(table):
+    """Days of history kept in a log table before rotate_event_logs archives it."""
+    return get_log_retention_policy(table)[0]
+
+
+def log_rollup_counts(table, since_day):
+    """{event key: count} from daily rollups of archived log rows since 'YYYY-MM-DD'."""
+    return get_log_rollup_counts(table, since_day)
+
+
+def campaigns_generation():
+    """In-process counter bumped by every campaign create/update/delete."""
+    return _get_campaigns_generation()
+
+
 def row_to_dict(row):
     """Convert a database row to a plain dict.
 
@@ -33,20 +33,26 @@ def register_v2_tools(mcp):
     # ------------------------------------------------------------------
 
     @mcp.tool()
-    def list_signal_queue(status: str = "new", owner: str = None, limit: int = 20) -> str:
+    def list_signal_queue(status: str = "new", owner: str = None, limit: int = 20, cursor: str = None,
+                          q: str = None) -> str:
         """List intent signals in the queue, filtered by workflow status and/or owner.
 
         Returns signals sorted newest-first with account info. Use this to see
-        what signals need attention.
+        what signals need attention. Pass the returned next_cursor back as
+        cursor to fetch the next page (next_cursor is null on the last page).
 
         Args:
             status: Filter by workflow status ('new', 'sequenced', 'revisit', 'noise'). Default 'new'.
             owner: Filter by account owner name. Optional.
             limit: Max signals to return. Default 20.
+            cursor: Page cursor from a previous call's next_cursor. Optional.
+            q: Full-text search over company, description, evidence and positioning.
+               Results are best-match first and are not paginated. Optional.
         """
         try:
             from v2.services.signal_service import list_signals
-            result = list_signals(status=status, owner=owner, limit=limit)
+            result = list_signals(status=status, owner=owner, limit=limit,
+                                  cursor=cursor, include_total=cursor is None, q=q)
             return _safe_json(result)
         except Exception as e:
             logger.exception("[MCP] list_signal_queue error")
@@ -219,7 +225,7 @@ def register_v2_tools(mcp):
             if not domain:
                 return _safe_json({"error": "Account has no website/domain configured"})
 
-            from apollo_client import apollo_api_call
+            from apollo_client import apollo_api_call_coalesced
 
             # Build search tiers from campaign personas or fallback
             search_tiers = []
@@ -274,7 +280,7 @@ def register_v2_tools(mcp):
                     search_body['person_seniorities'] = tier['seniorities']
 
                 try:
-                    resp = apollo_api_call(
+                    resp = apollo_api_call_coalesced(
                         'post',
                         'https://api.apollo.io/api/v1/mixed_people/api_search',
                         json=search_body,
@@ -839,6 +845,31 @@ def register_v2_tools(mcp):
             logger.exception("[MCP] find_duplicate_signals error")
             return _safe_json({"error": str(e)})
 
+    @mcp.tool()
+    def find_near_duplicate_signals(account_id: int = None, threshold: float = None) -> str:
+        """Find near-duplicate signals: same account, similarly worded description/evidence.
+
+        Catches the same announcement imported from several sources with
+        different wording, which exact dedup misses. Each cluster names the
+        signal to keep (oldest) and gives every signal's similarity (0-1) to it.
+        Review before archiving: near duplicates are not archived automatically.
+
+        Args:
+            account_id: Limit to one account. Optional.
+            threshold: Minimum estimated similarity, 0-1. Default 0.45.
+        """
+        try:
+            from v2.services.dedup_service import NEAR_DUP_THRESHOLD, find_near_duplicates
+            clusters = find_near_duplicates(account_id, threshold=threshold or NEAR_DUP_THRESHOLD)
+            return _safe_json({
+                "clusters": clusters,
+                "total_clusters": len(clusters),
+                "total_duplicates": sum(c["count"] - 1 for c in clusters),
+            })
+        except Exception as e:
+            logger.exception("[MCP] find_near_duplicate_signals error")
+            return _safe_json({"error": str(e)})
+
     @mcp.tool()
     def auto_clean_duplicates() -> str:
         """Automatically archive all exact duplicate signals.
@@ -1210,6 +1241,35 @@ def register_v2_tools(mcp):
             logger.exception("[MCP] mark_account_sequenced error")
             return _safe_json({"error": str(e)})
 
+    @mcp.tool()
+    def bulk_update_account_status(account_ids: str, status: str) -> str:
+        """Move many accounts to one status in a single transaction.
+
+        Applies the same signal cascade as the single-account tools: noise
+        archives all new/actioned signals, sequenced and revisit move 'new'
+        signals to 'actioned', and 'new' is a plain reset.
+
+        Args:
+            account_ids: Comma-separated account IDs (e.g. '12,34,56').
+            status: Target status: 'new', 'sequenced', 'revisit' or 'noise'.
+        """
+        if status not in ('new', 'sequenced', 'revisit', 'noise'):
+            return _safe_json({"error": f"Invalid status '{status}'"})
+        try:
+            ids = [int(x.strip()) for x in account_ids.split(',') if x.strip()]
+            if not ids:
+                return _safe_json({"error": "No valid account IDs provided"})
+            if len(ids) > 1000:
+                return _safe_json({"error": "Cannot update more than 1000 accounts at once"})
+
+            from v2.services.account_service import bulk_update_account_status as _bulk
+            return _safe_json(_bulk(ids, status, created_by='mcp'))
+        except ValueError:
+            return _safe_json({"error": "account_ids must be comma-separated integers"})
+        except Exception as e:
+            logger.exception("[MCP] bulk_update_account_status error")
+            return _safe_json({"error": str(e)})
+
     @mcp.tool()
     def reset_account_status(account_id: int) -> str:
         """Reset an account back to 'new' status.
@@ -86,6 +86,7 @@ class EventType(str, Enum):
     SEQUENCE_COMPLETED = "sequence_completed"
     REVISIT_SIGNAL_CREATED = "revisit_signal_created"
     ACCOUNT_MARKED_NOISE = "account_marked_noise"
+    ACCOUNT_STATUS_CHANGED = "account_status_changed"
     CSV_IMPORTED = "csv_imported"
 
 
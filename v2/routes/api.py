@@ -7,17 +7,19 @@ Uses validators.py for all user input validation.
 import logging
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 from flask import Blueprint, request, jsonify
 
 from v2.services.signal_service import (
     list_signals, get_signal, get_signal_workspace,
     update_signal_status, update_signal_campaign,
-    get_signal_counts_by_status, get_owners,
+    get_signal_counts_by_status, get_owners, check_signal_status_counts,
 )
 from v2.services.account_service import (
     get_account, update_account_status, get_account_domain,
     mark_account_noise, mark_account_sequenced, mark_account_revisit,
+    bulk_update_account_status,
 )
 from v2.services.prospect_service import (
     get_prospects_for_signal, bulk_create_prospects, filter_actionable_prospects,
@@ -38,6 +40,9 @@ logger = logging.getLogger(__name__)
 
 api_bp = Blueprint('v2_api', __name__, url_prefix='/v2/api')
 
+# Concurrent Apollo persona searches per people-search request
+_APOLLO_SEARCH_WORKERS = 4
+
 
 # ---------------------------------------------------------------------------
 # Error helpers
@@ -87,13 +92,35 @@ def api_list_signals():
             if not valid:
                 return _error(owner_filter)
 
-        result = list_signals(
-            status=status_filter,
-            owner=owner_filter,
-            signal_type=signal_type_filter,
-            limit=limit,
-            offset=offset,
-        )
+        # Full-text search across company, description, evidence and positioning
+        search_query = request.args.get('q', '').strip() or None
+        if search_query:
+            valid, search_query = validate_search_query(search_query)
+            if not valid:
+                return _error(search_query)
+
+        # Keyset pagination: the total is only counted on the first page
+        # unless the caller asks for it explicitly.
+        page_cursor = request.args.get('cursor') or None
+        include_total = request.args.get('include_total')
+        if include_total is None:
+            include_total = page_cursor is None
+        else:
+            include_total = include_total.lower() in ('1', 'true', 'yes')
+
+        try:
+            result = list_signals(
+                status=status_filter,
+                owner=owner_filter,
+                signal_type=signal_type_filter,
+                limit=limit,
+                offset=offset,
+                cursor=page_cursor,
+                include_total=include_total,
+                q=search_query,
+            )
+        except ValueError as e:
+            return _error(str(e))
 
         # Serialize datetimes
         for sig in result.get('signals', []):
@@ -101,7 +128,8 @@ def api_list_signals():
                 if sig.get(key) and hasattr(sig[key], 'isoformat'):
                     sig[key] = sig[key].isoformat()
 
-        return _success(signals=result['signals'], total=result['total'])
+        return _success(signals=result['signals'], total=result['total'],
+                        next_cursor=result['next_cursor'])
     except Exception as e:
         error_id = str(uuid.uuid4())[:8]
         logger.exception("[V2 API] Error listing signals (ref: %s)", error_id)
@@ -138,6 +166,22 @@ def api_signal_counts():
         return _error(f'Internal server error (ref: {error_id})', 500)
 
 
+@api_bp.route('/signals/counts/check', methods=['POST'])
+def api_check_signal_counts():
+    """Verify the materialized tab counts against a live recount.
+
+    Body (optional): {"repair": true} to rebuild the counts on mismatch.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        result = check_signal_status_counts(repair=bool(data.get('repair')))
+        return _success(**result)
+    except Exception as e:
+        error_id = str(uuid.uuid4())[:8]
+        logger.exception("[V2 API] Error checking signal counts (ref: %s)", error_id)
+        return _error(f'Internal server error (ref: {error_id})', 500)
+
+
 @api_bp.route('/signals/owners', methods=['GET'])
 def api_signal_owners():
     """Get distinct owners."""
@@ -239,175 +283,217 @@ def api_apollo_search(signal_id):
             if not isinstance(p, dict) or not p.get('title'):
                 return _error('Each persona must have a "title" field')
 
-        # Build Apollo people search request
-        from apollo_client import apollo_api_call
+        # Build Apollo people search request. Identical concurrent searches
+        # (double-clicks, MCP hitting the same account) share one upstream call.
+        from apollo_client import apollo_api_call_coalesced, bulk_match_people, BULK_MATCH_MAX
 
-        def _search_apollo(personas_list, org_filter):
-            """Run Apollo search for a list of personas with given org filter."""
-            candidates = []
-            for persona in personas_list:
-                all_titles = persona.get('allTitles') or [persona.get('title', '')]
-                all_titles = [t for t in all_titles if t]
-                if not all_titles:
-                    continue
+        pool = ThreadPoolExecutor(max_workers=_APOLLO_SEARCH_WORKERS)
 
-                # Use all seniority levels from the persona, not just the first
-                all_seniorities = persona.get('allSeniorities') or []
-                if not all_seniorities:
-                    single = persona.get('seniority', '')
-                    all_seniorities = [single] if single else []
-
-                search_body = {
-                    **org_filter,
-                    'person_titles': all_titles,
-                    'page': 1,
-                    'per_page': 25,
-                }
-                if all_seniorities:
-                    search_body['person_seniorities'] = all_seniorities
+        def _search_persona(persona, org_filter):
+            """Run one Apollo people search for a persona with the given org filter."""
+            candidates = []
+            all_titles = persona.get('allTitles') or [persona.get('title', '')]
+            all_titles = [t for t in all_titles if t]
+            if not all_titles:
+                return candidates
+
+            # Use all seniority levels from the persona, not just the first
+            all_seniorities = persona.get('allSeniorities') or []
+            if not all_seniorities:
+                single = persona.get('seniority', '')
+                all_seniorities = [single] if single else []
+
+            search_body = {
+                **org_filter,
+                'person_titles': all_titles,
+                'page': 1,
+                'per_page': 25,
+            }
+            if all_seniorities:
+                search_body['person_seniorities'] = all_seniorities
 
-                try:
-                    resp = apollo_api_call('post', 'https://api.apollo.io/api/v1/mixed_people/api_search', json=search_body)
-                    if resp.status_code == 200:
-                        result = resp.json()
-                        people = result.get('people', [])
-                        logger.info("[V2 API] Apollo search for %s (seniorities=%s): %d results",
-                                    all_titles[0], all_seniorities, len(people))
-                        for person in people:
-                            email_status = person.get('email_status', '')
-                            candidates.append({
-                                'full_name': person.get('name', ''),
-                                'first_name': person.get('first_name', ''),
-                                'last_name': person.get('last_name', ''),
-                                'title': person.get('title', ''),
-                                'email': person.get('email', ''),
-                                'email_status': email_status,
-                                'email_verified': bool(email_status == 'verified'),
-                                'linkedin_url': person.get('linkedin_url', ''),
-                                'apollo_person_id': person.get('id', ''),
-                            })
-                except RuntimeError as re_err:
-                    raise re_err
-                except Exception as e:
-                    logger.warning("[V2 API] Apollo search error: %s", e)
+            try:
+                resp = apollo_api_call_coalesced('post', 'https://api.apollo.io/api/v1/mixed_people/api_search', json=search_body)
+                if resp.status_code == 200:
+                    result = resp.json()
+                    people = result.get('people', [])
+                    logger.info("[V2 API] Apollo search for %s (seniorities=%s): %d results",
+                                all_titles[0], all_seniorities, len(people))
+                    for person in people:
+                        email_status = person.get('email_status', '')
+                        candidates.append({
+                            'full_name': person.get('name', ''),
+                            'first_name': person.get('first_name', ''),
+                            'last_name': person.get('last_name', ''),
+                            'title': person.get('title', ''),
+                            'email': person.get('email', ''),
+                            'email_status': email_status,
+                            'email_verified': bool(email_status == 'verified'),
+                            'linkedin_url': person.get('linkedin_url', ''),
+                            'apollo_person_id': person.get('id', ''),
+                        })
+            except RuntimeError as re_err:
+                raise re_err
+            except Exception as e:
+                logger.warning("[V2 API] Apollo search error: %s", e)
             return candidates
 
-        # Step 1: Search by domain first, then ALSO try company name
-        all_candidates = []
-        try:
-            if domain:
-                all_candidates = _search_apollo(personas, {'q_organization_domains_list': [domain]})
-
-            # Also search by company name (catches companies with mismatched domains)
-            if company_name:
-                name_candidates = _search_apollo(personas, {'q_organization_name': company_name})
-                if name_candidates:
-                    logger.info("[V2 API] Company-name search added %d candidates for: %s", len(name_candidates), company_name)
-                    all_candidates.extend(name_candidates)
-                else:
-                    # Retry with TLD suffix stripped (e.g. "Chata.ai" → "Chata", "Scale.io" → "Scale")
-                    import re as _re
-                    stripped_name = _re.sub(
-                        r'\.(ai|io|co|app|xyz|tech|dev|so|it|me|us|gg|fm|inc|llc|ltd|hq)$',
-                        '', company_name, flags=_re.IGNORECASE
-                    ).strip()
-                    if stripped_name and stripped_name.lower() != company_name.lower():
-                        stripped_candidates = _search_apollo(personas, {'q_organization_name': stripped_name})
-                        if stripped_candidates:
-                            logger.info("[V2 API] Stripped-name search added %d candidates for: %s (from '%s')",
-                                        len(stripped_candidates), stripped_name, company_name)
-                            all_candidates.extend(stripped_candidates)
-
-            # Last resort: broaden search (drop seniority filters only — no CEO/founder padding)
-            if not all_candidates:
-                broad_personas = []
-                for p in personas:
-                    broad_personas.append({'title': p.get('title', ''), 'allTitles': p.get('allTitles', [p.get('title', '')])})
-                org_filter = {'q_organization_domains_list': [domain]} if domain else {'q_organization_name': company_name}
-                all_candidates = _search_apollo(broad_personas, org_filter)
-        except RuntimeError as re_err:
-            return _error(str(re_err), 503)
-        # Dedup by apollo_person_id
-        seen_ids = set()
-        deduped_candidates = []
-        for p in all_candidates:
-            pid = p.get('apollo_person_id', '')
-            if pid and pid in seen_ids:
-                continue
-            if pid:
-                seen_ids.add(pid)
-            deduped_candidates.append(p)
+        def _submit_search(personas_list, org_filter):
+            """Start one search per persona in parallel; returns futures in persona order."""
+            return [pool.submit(_search_persona, p, org_filter) for p in personas_list]
 
-        # Step 2: Enrich top candidates to reveal emails via /people/match
-        # First pass: try for verified emails. If 0, retry accepting likely/guessed.
-        max_results = data.get('max_results', 3)
-
-        def _enrich_candidates(candidates, accept_likely=False):
-            """Enrich candidates via Apollo /people/match. Returns enriched list."""
-            results = []
-            for candidate in candidates:
-                if max_results and len(results) >= max_results:
-                    break
+        def _collect(futures):
+            """Join persona futures in submission order (RuntimeError propagates)."""
+            candidates = []
+            for f in futures:
+                candidates.extend(f.result())
+            return candidates
 
-                # If search already returned a real verified email, use it directly
-                candidate_email = candidate.get('email', '')
-                if (candidate_email
-                        and candidate_email != 'email_not_unlocked@domain.com'
-                        and candidate.get('email_verified')):
-                    results.append(candidate)
-                    continue
+        def _search_apollo(personas_list, org_filter):
+            """Run Apollo search for a list of personas with given org filter."""
+            return _collect(_submit_search(personas_list, org_filter))
 
-                # Try enrichment to reveal email
-                apollo_id = candidate.get('apollo_person_id')
-                if not apollo_id:
+        try:
+            # Step 1: Search by domain and by company name at the same time
+            all_candidates = []
+            try:
+                domain_futures = _submit_search(personas, {'q_organization_domains_list': [domain]}) if domain else []
+                name_futures = _submit_search(personas, {'q_organization_name': company_name}) if company_name else []
+
+                if domain_futures:
+                    all_candidates = _collect(domain_futures)
+
+                # Also search by company name (catches companies with mismatched domains)
+                if company_name:
+                    name_candidates = _collect(name_futures)
+                    if name_candidates:
+                        logger.info("[V2 API] Company-name search added %d candidates for: %s", len(name_candidates), company_name)
+                        all_candidates.extend(name_candidates)
+                    else:
+                        # Retry with TLD suffix stripped (e.g. "Chata.ai" → "Chata", "Scale.io" → "Scale")
+                        import re as _re
+                        stripped_name = _re.sub(
+                            r'\.(ai|io|co|app|xyz|tech|dev|so|it|me|us|gg|fm|inc|llc|ltd|hq)$',
+                            '', company_name, flags=_re.IGNORECASE
+                        ).strip()
+                        if stripped_name and stripped_name.lower() != company_name.lower():
+                            stripped_candidates = _search_apollo(personas, {'q_organization_name': stripped_name})
+                            if stripped_candidates:
+                                logger.info("[V2 API] Stripped-name search added %d candidates for: %s (from '%s')",
+                                            len(stripped_candidates), stripped_name, company_name)
+                                all_candidates.extend(stripped_candidates)
+
+                # Last resort: broaden search (drop seniority filters only — no CEO/founder padding)
+                if not all_candidates:
+                    broad_personas = []
+                    for p in personas:
+                        broad_personas.append({'title': p.get('title', ''), 'allTitles': p.get('allTitles', [p.get('title', '')])})
+                    org_filter = {'q_organization_domains_list': [domain]} if domain else {'q_organization_name': company_name}
+                    all_candidates = _search_apollo(broad_personas, org_filter)
+            except RuntimeError as re_err:
+                return _error(str(re_err), 503)
+            # Dedup by apollo_person_id
+            seen_ids = set()
+            deduped_candidates = []
+            for p in all_candidates:
+                pid = p.get('apollo_person_id', '')
+                if pid and pid in seen_ids:
                     continue
-
+                if pid:
+                    seen_ids.add(pid)
+                deduped_candidates.append(p)
+
+            # Step 2: Enrich top candidates to reveal emails via /people/bulk_match
+            # First pass: try for verified emails. If 0, retry accepting likely/guessed.
+            max_results = data.get('max_results', 3)
+            # apollo_person_id -> matched person (or None for a non-200), shared by both passes
+            match_cache = {}
+
+            def _match_wave(candidates):
+                """Bulk-enrich the wave's unmatched candidates; RuntimeError leaves them uncached."""
+                ids = [c['apollo_person_id'] for c in candidates if _needs_match(c)]
+                if not ids:
+                    return
                 try:
-                    enrich_resp = apollo_api_call('post', 'https://api.apollo.io/api/v1/people/match', json={
-                        'id': apollo_id,
-                        'reveal_personal_emails': False,
-                    })
-                    if enrich_resp.status_code == 200:
-                        person = enrich_resp.json().get('person', {})
-                        email = person.get('email', '')
-                        email_status = person.get('email_status', '')
-                        is_verified = email_status == 'verified'
-                        is_usable = email_status in ('verified', 'likely', 'guessed')
-
-                        if email and email != 'email_not_unlocked@domain.com' and (is_verified or accept_likely and is_usable):
-                            results.append({
-                                'full_name': person.get('name', '') or candidate['full_name'],
-                                'first_name': person.get('first_name', '') or candidate['first_name'],
-                                'last_name': person.get('last_name', '') or candidate['last_name'],
-                                'title': person.get('title', '') or candidate['title'],
-                                'email': email,
-                                'email_status': email_status,
-                                'email_verified': is_verified,
-                                'linkedin_url': person.get('linkedin_url', '') or candidate['linkedin_url'],
-                                'apollo_person_id': person.get('id', '') or apollo_id,
-                            })
-                            logger.info("[V2 API] Enriched %s -> %s (status=%s)",
-                                        candidate['full_name'], email, email_status)
-                        else:
-                            logger.info("[V2 API] Enrichment for %s: email=%s status=%s (skipped)",
-                                        candidate['full_name'], email or 'none', email_status)
-                    else:
-                        logger.warning("[V2 API] Apollo enrich returned %d for %s",
-                                       enrich_resp.status_code, candidate['full_name'])
+                    match_cache.update(bulk_match_people(ids))
                 except RuntimeError:
-                    logger.warning("[V2 API] Apollo enrich failed for %s", candidate['full_name'])
-                    continue
-            return results
+                    logger.warning("[V2 API] Apollo enrich failed for %d candidates", len(ids))
 
-        # First pass: verified emails only
-        enriched = _enrich_candidates(deduped_candidates, accept_likely=False)
-        unverified_count = 0
+            def _has_search_email(candidate):
+                """True when the search result already carries a real verified email."""
+                candidate_email = candidate.get('email', '')
+                return bool(candidate_email
+                            and candidate_email != 'email_not_unlocked@domain.com'
+                            and candidate.get('email_verified'))
 
-        # Fallback: if 0 verified, retry accepting likely/guessed emails
-        if not enriched and deduped_candidates:
-            logger.info("[V2 API] No verified emails found, retrying with likely/guessed for %d candidates", len(deduped_candidates))
-            enriched = _enrich_candidates(deduped_candidates, accept_likely=True)
-            unverified_count = sum(1 for p in enriched if not p.get('email_verified'))
+            def _accept(candidate, accept_likely):
+                """Turn a candidate (+ its cached match) into a result dict, or None."""
+                # If search already returned a real verified email, use it directly
+                if _has_search_email(candidate):
+                    return candidate
+
+                apollo_id = candidate.get('apollo_person_id')
+                person = match_cache.get(apollo_id)
+                if not person:
+                    return None
+                email = person.get('email', '')
+                email_status = person.get('email_status', '')
+                is_verified = email_status == 'verified'
+                is_usable = email_status in ('verified', 'likely', 'guessed')
+
+                if email and email != 'email_not_unlocked@domain.com' and (is_verified or accept_likely and is_usable):
+                    logger.info("[V2 API] Enriched %s -> %s (status=%s)",
+                                candidate['full_name'], email, email_status)
+                    return {
+                        'full_name': person.get('name', '') or candidate['full_name'],
+                        'first_name': person.get('first_name', '') or candidate['first_name'],
+                        'last_name': person.get('last_name', '') or candidate['last_name'],
+                        'title': person.get('title', '') or candidate['title'],
+                        'email': email,
+                        'email_status': email_status,
+                        'email_verified': is_verified,
+                        'linkedin_url': person.get('linkedin_url', '') or candidate['linkedin_url'],
+                        'apollo_person_id': person.get('id', '') or apollo_id,
+                    }
+                logger.info("[V2 API] Enrichment for %s: email=%s status=%s (skipped)",
+                            candidate['full_name'], email or 'none', email_status)
+                return None
+
+            def _needs_match(candidate):
+                if _has_search_email(candidate):
+                    return False
+                return bool(candidate.get('apollo_person_id')) and candidate['apollo_person_id'] not in match_cache
+
+            def _enrich_candidates(candidates, accept_likely=False):
+                """Enrich candidates in bulk-match waves, stopping once max_results is met."""
+                results = []
+                idx = 0
+                while idx < len(candidates):
+                    if max_results and len(results) >= max_results:
+                        break
+                    wave = candidates[idx:idx + BULK_MATCH_MAX]
+                    idx += len(wave)
+                    _match_wave(wave)
+                    for candidate in wave:
+                        if max_results and len(results) >= max_results:
+                            break
+                        accepted = _accept(candidate, accept_likely)
+                        if accepted:
+                            results.append(accepted)
+                return results
+
+            # First pass: verified emails only
+            enriched = _enrich_candidates(deduped_candidates, accept_likely=False)
+            unverified_count = 0
+
+            # Fallback: if 0 verified, retry accepting likely/guessed emails
+            # (reuses first-pass match responses from match_cache)
+            if not enriched and deduped_candidates:
+                logger.info("[V2 API] No verified emails found, retrying with likely/guessed for %d candidates", len(deduped_candidates))
+                enriched = _enrich_candidates(deduped_candidates, accept_likely=True)
+                unverified_count = sum(1 for p in enriched if not p.get('email_verified'))
+        finally:
+            pool.shutdown(wait=False)
 
         # Final dedup by email
         seen_emails = set()
@@ -956,6 +1042,45 @@ def api_update_account_status(account_id):
         return _error(f'Internal server error (ref: {error_id})', 500)
 
 
+_BULK_STATUS_MAX_ACCOUNTS = 1000
+
+
+@api_bp.route('/accounts/status/bulk', methods=['POST'])
+def api_bulk_update_account_status():
+    """Move many accounts to one status with the usual signal cascade.
+
+    Body: { account_ids: [int, ...], status: 'new'|'sequenced'|'revisit'|'noise' }
+    """
+    try:
+        data = request.get_json()
+        if not data or 'status' not in data:
+            return _error('status field is required')
+
+        valid, new_status = validate_scope(data['status'], ('new', 'sequenced', 'revisit', 'noise'))
+        if not valid:
+            return _error(new_status)
+
+        account_ids = data.get('account_ids')
+        if not account_ids or not isinstance(account_ids, list):
+            return _error('account_ids must be a non-empty list')
+        if len(account_ids) > _BULK_STATUS_MAX_ACCOUNTS:
+            return _error(f'Cannot update more than {_BULK_STATUS_MAX_ACCOUNTS} accounts at once')
+
+        cleaned_ids = []
+        for aid in account_ids:
+            valid, cleaned = validate_positive_int(aid, 'account_id')
+            if not valid:
+                return _error(f'Invalid account_id in list: {cleaned}')
+            cleaned_ids.append(cleaned)
+
+        result = bulk_update_account_status(cleaned_ids, new_status, created_by='api')
+        return _success(**result)
+    except Exception as e:
+        error_id = str(uuid.uuid4())[:8]
+        logger.exception("[V2 API] Error bulk-updating account status (ref: %s)", error_id)
+        return _error(f'Internal server error (ref: {error_id})', 500)
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
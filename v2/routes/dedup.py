@@ -26,6 +26,21 @@ def _success(**kwargs):
     return jsonify({'status': 'success', **kwargs})
 
 
+def _threshold_arg():
+    """Parse the optional ?threshold= similarity cutoff. Returns (ok, value_or_error)."""
+    from v2.services.dedup_service import NEAR_DUP_THRESHOLD
+    raw = request.args.get('threshold')
+    if raw is None or raw == '':
+        return True, NEAR_DUP_THRESHOLD
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        return False, 'threshold must be a number'
+    if not 0 < value <= 1:
+        return False, 'threshold must be between 0 and 1'
+    return True, value
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
@@ -78,6 +93,55 @@ def by_account():
         return _error('Internal server error', 500)
 
 
+@dedup_bp.route('/near', methods=['GET'])
+def near_duplicates():
+    """List near-duplicate clusters (same account, similar description + evidence).
+
+    Query params: account_id (optional), threshold (optional, 0-1)
+    """
+    try:
+        account_id = request.args.get('account_id')
+        if account_id:
+            valid, account_id = validate_positive_int(account_id, 'account_id')
+            if not valid:
+                return _error(account_id)
+        valid, threshold = _threshold_arg()
+        if not valid:
+            return _error(threshold)
+
+        from v2.services.dedup_service import find_near_duplicates
+        clusters = find_near_duplicates(account_id, threshold=threshold)
+        return _success(
+            clusters=clusters,
+            total_clusters=len(clusters),
+            total_duplicates=sum(c['count'] - 1 for c in clusters),
+        )
+    except Exception:
+        logger.exception("[DEDUP] Error finding near duplicates")
+        return _error('Internal server error', 500)
+
+
+@dedup_bp.route('/near/<int:signal_id>', methods=['GET'])
+def similar_signals(signal_id):
+    """List active signals on the same account that read like this one.
+
+    Query params: threshold (optional, 0-1)
+    """
+    try:
+        valid, threshold = _threshold_arg()
+        if not valid:
+            return _error(threshold)
+
+        from v2.services.dedup_service import find_similar_signals
+        matches = find_similar_signals(signal_id, threshold=threshold)
+        if matches is None:
+            return _error('Signal not found', 404)
+        return _success(signal_id=signal_id, matches=matches, total=len(matches))
+    except Exception:
+        logger.exception("[DEDUP] Error finding signals similar to %d", signal_id)
+        return _error('Internal server error', 500)
+
+
 @dedup_bp.route('/archive', methods=['POST'])
 def archive():
     """Archive specific duplicate signals, keeping one canonical signal.
@@ -84,6 +84,46 @@ def init_v2_schema(cursor, adapt_ddl, safe_add_column):
         ON intent_signals(scan_signal_id)
     ''')
 
+    # Composite indexes for the signal queue (filter by workflow status/owner,
+    # keyset-paginate by created_at within each account)
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_intent_signals_status_created
+        ON intent_signals(status, created_at DESC)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_intent_signals_account_created
+        ON intent_signals(account_id, created_at DESC, id DESC)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_accounts_status_owner
+        ON monitored_accounts(account_status, account_owner)
+    ''')
+
+    # Exact-dedup fingerprint of (signal_type, evidence_value); see
+    # dedup_service.signal_fingerprint
+    safe_add_column(cursor, 'intent_signals', "dedup_fingerprint TEXT")
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_intent_signals_dedup
+        ON intent_signals(account_id, dedup_fingerprint)
+    ''')
+
+    # Near-dedup MinHash signature plus its LSH band buckets; see
+    # dedup_service.near_dup_signature. Setting minhash_signature back to NULL
+    # makes the next near-dup scan re-index the signal.
+    safe_add_column(cursor, 'intent_signals', "minhash_signature TEXT")
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS signal_lsh_bands (
+            band_hash BIGINT NOT NULL,
+            signal_id INTEGER NOT NULL,
+            PRIMARY KEY (band_hash, signal_id),
+            FOREIGN KEY (signal_id) REFERENCES intent_signals(id) ON DELETE CASCADE
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_signal_lsh_bands_signal
+        ON signal_lsh_bands(signal_id)
+    ''')
+
     # -----------------------------------------------------------------------
     # prospects — people found via Apollo, tied to signals + accounts
     # -----------------------------------------------------------------------
@@ -201,6 +241,10 @@ def init_v2_schema(cursor, adapt_ddl, safe_add_column):
         CREATE INDEX IF NOT EXISTS idx_feedback_signal
         ON feedback_log(signal_id)
     ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_feedback_created
+        ON feedback_log(created_at)
+    ''')
 
     # -----------------------------------------------------------------------
     # activity_log — audit trail for all key actions
@@ -275,9 +319,359 @@ def init_v2_schema(cursor, adapt_ddl, safe_add_column):
     # Per-prospect sequence override (JSON: {num_steps, single_thread, sequence_id, sequence_name})
     safe_add_column(cursor, 'prospects', 'sequence_config_override TEXT')
 
+    # -----------------------------------------------------------------------
+    # signal_status_counts — queue tab counts, maintained by triggers
+    # -----------------------------------------------------------------------
+    _init_signal_status_counts(cursor)
+
+    # -----------------------------------------------------------------------
+    # Signal queue full-text search index, maintained by triggers
+    # -----------------------------------------------------------------------
+    _init_signal_search(cursor)
+
     logger.info("[V2] Schema initialization complete.")
 
 
+# Rebuilds signal_status_counts from scratch. workflow_status is the
+# account_status with NULL stored as '' so it can be the primary key;
+# visible_count matches list_signals (non-archived), total_count includes
+# archived signals (needed for the noise tab, see get_signal_counts_by_status).
+_SIGNAL_STATUS_COUNTS_REBUILD = '''
+    INSERT INTO signal_status_counts (workflow_status, visible_count, total_count)
+    SELECT COALESCE(a.account_status, ''),
+           SUM(CASE WHEN s.status != 'archived' THEN 1 ELSE 0 END),
+           COUNT(*)
+    FROM intent_signals s
+    JOIN monitored_accounts a ON s.account_id = a.id
+    GROUP BY COALESCE(a.account_status, '')
+'''
+
+_SQLITE_SIGNAL_COUNT_TRIGGERS = (
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_signal_counts_insert
+    AFTER INSERT ON intent_signals
+    BEGIN
+        INSERT OR IGNORE INTO signal_status_counts (workflow_status)
+        SELECT COALESCE(account_status, '') FROM monitored_accounts WHERE id = NEW.account_id;
+        UPDATE signal_status_counts
+        SET total_count = total_count + 1,
+            visible_count = visible_count + (CASE WHEN NEW.status != 'archived' THEN 1 ELSE 0 END)
+        WHERE workflow_status = (
+            SELECT COALESCE(account_status, '') FROM monitored_accounts WHERE id = NEW.account_id);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_signal_counts_delete
+    AFTER DELETE ON intent_signals
+    BEGIN
+        UPDATE signal_status_counts
+        SET total_count = total_count - 1,
+            visible_count = visible_count - (CASE WHEN OLD.status != 'archived' THEN 1 ELSE 0 END)
+        WHERE workflow_status = (
+            SELECT COALESCE(account_status, '') FROM monitored_accounts WHERE id = OLD.account_id);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_signal_counts_update
+    AFTER UPDATE OF status, account_id ON intent_signals
+    WHEN OLD.status IS NOT NEW.status OR OLD.account_id IS NOT NEW.account_id
+    BEGIN
+        UPDATE signal_status_counts
+        SET total_count = total_count - 1,
+            visible_count = visible_count - (CASE WHEN OLD.status != 'archived' THEN 1 ELSE 0 END)
+        WHERE workflow_status = (
+            SELECT COALESCE(account_status, '') FROM monitored_accounts WHERE id = OLD.account_id);
+        INSERT OR IGNORE INTO signal_status_counts (workflow_status)
+        SELECT COALESCE(account_status, '') FROM monitored_accounts WHERE id = NEW.account_id;
+        UPDATE signal_status_counts
+        SET total_count = total_count + 1,
+            visible_count = visible_count + (CASE WHEN NEW.status != 'archived' THEN 1 ELSE 0 END)
+        WHERE workflow_status = (
+            SELECT COALESCE(account_status, '') FROM monitored_accounts WHERE id = NEW.account_id);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_signal_counts_account_status
+    AFTER UPDATE OF account_status ON monitored_accounts
+    WHEN OLD.account_status IS NOT NEW.account_status
+    BEGIN
+        UPDATE signal_status_counts
+        SET total_count = total_count
+                - (SELECT COUNT(*) FROM intent_signals WHERE account_id = OLD.id),
+            visible_count = visible_count
+                - (SELECT COUNT(*) FROM intent_signals WHERE account_id = OLD.id AND status != 'archived')
+        WHERE workflow_status = COALESCE(OLD.account_status, '');
+        INSERT OR IGNORE INTO signal_status_counts (workflow_status)
+        VALUES (COALESCE(NEW.account_status, ''));
+        UPDATE signal_status_counts
+        SET total_count = total_count
+                + (SELECT COUNT(*) FROM intent_signals WHERE account_id = NEW.id),
+            visible_count = visible_count
+                + (SELECT COUNT(*) FROM intent_signals WHERE account_id = NEW.id AND status != 'archived')
+        WHERE workflow_status = COALESCE(NEW.account_status, '');
+    END
+    ''',
+    # Runs before the ON DELETE CASCADE removes the signals; by the time the
+    # per-signal delete trigger fires the account is gone, so it is a no-op.
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_signal_counts_account_delete
+    BEFORE DELETE ON monitored_accounts
+    BEGIN
+        UPDATE signal_status_counts
+        SET total_count = total_count
+                - (SELECT COUNT(*) FROM intent_signals WHERE account_id = OLD.id),
+            visible_count = visible_count
+                - (SELECT COUNT(*) FROM intent_signals WHERE account_id = OLD.id AND status != 'archived')
+        WHERE workflow_status = COALESCE(OLD.account_status, '');
+    END
+    ''',
+)
+
+_POSTGRES_SIGNAL_COUNT_TRIGGERS = (
+    '''
+    CREATE OR REPLACE FUNCTION signal_counts_apply(p_account_id INTEGER, p_status TEXT, p_sign INTEGER)
+    RETURNS void AS $$
+    DECLARE ws TEXT;
+    BEGIN
+        SELECT COALESCE(account_status, '') INTO ws FROM monitored_accounts WHERE id = p_account_id;
+        IF NOT FOUND THEN
+            RETURN;
+        END IF;
+        INSERT INTO signal_status_counts (workflow_status) VALUES (ws) ON CONFLICT DO NOTHING;
+        UPDATE signal_status_counts
+        SET total_count = total_count + p_sign,
+            visible_count = visible_count + (CASE WHEN p_status <> 'archived' THEN p_sign ELSE 0 END)
+        WHERE workflow_status = ws;
+    END;
+    $$ LANGUAGE plpgsql
+    ''',
+    '''
+    CREATE OR REPLACE FUNCTION trg_signal_counts_signals() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM signal_counts_apply(OLD.account_id, OLD.status, -1);
+        END IF;
+        IF TG_OP IN ('UPDATE', 'INSERT') THEN
+            PERFORM signal_counts_apply(NEW.account_id, NEW.status, 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    ''',
+    '''
+    CREATE OR REPLACE FUNCTION trg_signal_counts_accounts() RETURNS trigger AS $$
+    DECLARE n_total INTEGER; n_visible INTEGER;
+    BEGIN
+        SELECT COUNT(*), COUNT(*) FILTER (WHERE status <> 'archived')
+        INTO n_total, n_visible
+        FROM intent_signals WHERE account_id = OLD.id;
+        UPDATE signal_status_counts
+        SET total_count = total_count - n_total, visible_count = visible_count - n_visible
+        WHERE workflow_status = COALESCE(OLD.account_status, '');
+        IF TG_OP = 'DELETE' THEN
+            RETURN OLD;
+        END IF;
+        INSERT INTO signal_status_counts (workflow_status)
+        VALUES (COALESCE(NEW.account_status, '')) ON CONFLICT DO NOTHING;
+        UPDATE signal_status_counts
+        SET total_count = total_count + n_total, visible_count = visible_count + n_visible
+        WHERE workflow_status = COALESCE(NEW.account_status, '');
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    ''',
+    'DROP TRIGGER IF EXISTS trg_signal_counts ON intent_signals',
+    '''
+    CREATE TRIGGER trg_signal_counts
+    AFTER INSERT OR DELETE OR UPDATE OF status, account_id ON intent_signals
+    FOR EACH ROW EXECUTE PROCEDURE trg_signal_counts_signals()
+    ''',
+    'DROP TRIGGER IF EXISTS trg_signal_counts_account_status ON monitored_accounts',
+    '''
+    CREATE TRIGGER trg_signal_counts_account_status
+    AFTER UPDATE OF account_status ON monitored_accounts
+    FOR EACH ROW WHEN (OLD.account_status IS DISTINCT FROM NEW.account_status)
+    EXECUTE PROCEDURE trg_signal_counts_accounts()
+    ''',
+    'DROP TRIGGER IF EXISTS trg_signal_counts_account_delete ON monitored_accounts',
+    '''
+    CREATE TRIGGER trg_signal_counts_account_delete
+    BEFORE DELETE ON monitored_accounts
+    FOR EACH ROW EXECUTE PROCEDURE trg_signal_counts_accounts()
+    ''',
+)
+
+
+def _init_signal_status_counts(cursor):
+    """Create the signal_status_counts table and the triggers that maintain it.
+
+    Seeds the table from the live data the first time it is created (the
+    triggers keep it current from then on).
+    """
+    import database
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS signal_status_counts (
+            workflow_status TEXT PRIMARY KEY,
+            visible_count INTEGER NOT NULL DEFAULT 0,
+            total_count INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+
+    triggers = (_POSTGRES_SIGNAL_COUNT_TRIGGERS if database._USE_POSTGRES
+                else _SQLITE_SIGNAL_COUNT_TRIGGERS)
+    for ddl in triggers:
+        cursor.execute(ddl)
+
+    cursor.execute("SELECT COUNT(*) as cnt FROM signal_status_counts")
+    row = cursor.fetchone()
+    count = row['cnt'] if isinstance(row, dict) else row[0]
+    if count == 0:
+        rebuild_signal_status_counts(cursor)
+
+
+def rebuild_signal_status_counts(cursor):
+    """Recompute signal_status_counts from intent_signals (caller commits)."""
+    cursor.execute("DELETE FROM signal_status_counts")
+    cursor.execute(_SIGNAL_STATUS_COUNTS_REBUILD)
+
+
+# signal_fts rowid is the signal id; company_name is denormalized from the
+# owning account so one MATCH covers the whole queue row.
+_SQLITE_SIGNAL_SEARCH_DDL = (
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS signal_fts USING fts5(
+        company_name, signal_description, evidence_value, bdr_positioning,
+        tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+    )
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_signal_fts_insert
+    AFTER INSERT ON intent_signals
+    BEGIN
+        INSERT INTO signal_fts (rowid, company_name, signal_description, evidence_value, bdr_positioning)
+        SELECT NEW.id, (SELECT company_name FROM monitored_accounts WHERE id = NEW.account_id),
+               NEW.signal_description, NEW.evidence_value, NEW.bdr_positioning;
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_signal_fts_update
+    AFTER UPDATE OF signal_description, evidence_value, bdr_positioning, account_id ON intent_signals
+    BEGIN
+        DELETE FROM signal_fts WHERE rowid = OLD.id;
+        INSERT INTO signal_fts (rowid, company_name, signal_description, evidence_value, bdr_positioning)
+        SELECT NEW.id, (SELECT company_name FROM monitored_accounts WHERE id = NEW.account_id),
+               NEW.signal_description, NEW.evidence_value, NEW.bdr_positioning;
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_signal_fts_delete
+    AFTER DELETE ON intent_signals
+    BEGIN
+        DELETE FROM signal_fts WHERE rowid = OLD.id;
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_signal_fts_account_rename
+    AFTER UPDATE OF company_name ON monitored_accounts
+    WHEN OLD.company_name IS NOT NEW.company_name
+    BEGIN
+        UPDATE signal_fts SET company_name = NEW.company_name
+        WHERE rowid IN (SELECT id FROM intent_signals WHERE account_id = NEW.id);
+    END
+    ''',
+)
+
+_SIGNAL_FTS_REBUILD = '''
+    INSERT INTO signal_fts (rowid, company_name, signal_description, evidence_value, bdr_positioning)
+    SELECT s.id, a.company_name, s.signal_description, s.evidence_value, s.bdr_positioning
+    FROM intent_signals s
+    LEFT JOIN monitored_accounts a ON a.id = s.account_id
+'''
+
+_POSTGRES_SIGNAL_SEARCH_DDL = (
+    'ALTER TABLE intent_signals ADD COLUMN IF NOT EXISTS search_vector tsvector',
+    '''
+    CREATE OR REPLACE FUNCTION signal_search_vector(
+        p_company TEXT, p_description TEXT, p_evidence TEXT, p_positioning TEXT)
+    RETURNS tsvector AS $$
+        SELECT setweight(to_tsvector('simple', COALESCE(p_company, '')), 'A') ||
+               setweight(to_tsvector('simple', COALESCE(p_description, '')), 'B') ||
+               setweight(to_tsvector('simple', COALESCE(p_evidence, '')), 'C') ||
+               setweight(to_tsvector('simple', COALESCE(p_positioning, '')), 'C')
+    $$ LANGUAGE sql IMMUTABLE
+    ''',
+    '''
+    CREATE OR REPLACE FUNCTION trg_signal_search_vector() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := signal_search_vector(
+            (SELECT company_name FROM monitored_accounts WHERE id = NEW.account_id),
+            NEW.signal_description, NEW.evidence_value, NEW.bdr_positioning);
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    ''',
+    '''
+    CREATE OR REPLACE FUNCTION trg_signal_search_account_rename() RETURNS trigger AS $$
+    BEGIN
+        UPDATE intent_signals
+        SET search_vector = signal_search_vector(
+            NEW.company_name, signal_description, evidence_value, bdr_positioning)
+        WHERE account_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    ''',
+    'DROP TRIGGER IF EXISTS trg_signal_search_vector ON intent_signals',
+    '''
+    CREATE TRIGGER trg_signal_search_vector
+    BEFORE INSERT OR UPDATE OF signal_description, evidence_value, bdr_positioning, account_id
+    ON intent_signals
+    FOR EACH ROW EXECUTE PROCEDURE trg_signal_search_vector()
+    ''',
+    'DROP TRIGGER IF EXISTS trg_signal_search_account_rename ON monitored_accounts',
+    '''
+    CREATE TRIGGER trg_signal_search_account_rename
+    AFTER UPDATE OF company_name ON monitored_accounts
+    FOR EACH ROW WHEN (OLD.company_name IS DISTINCT FROM NEW.company_name)
+    EXECUTE PROCEDURE trg_signal_search_account_rename()
+    ''',
+    '''
+    UPDATE intent_signals s
+    SET search_vector = signal_search_vector(
+        a.company_name, s.signal_description, s.evidence_value, s.bdr_positioning)
+    FROM monitored_accounts a
+    WHERE a.id = s.account_id AND s.search_vector IS NULL
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_intent_signals_search
+    ON intent_signals USING GIN (search_vector)
+    ''',
+)
+
+
+def _init_signal_search(cursor):
+    """Create the signal search index and the triggers that keep it in sync.
+
+    On SQLite the FTS5 table is seeded from the live data the first time it
+    is created; on Postgres rows missing a search_vector are backfilled.
+    """
+    import database
+
+    if database._USE_POSTGRES:
+        for ddl in _POSTGRES_SIGNAL_SEARCH_DDL:
+            cursor.execute(ddl)
+        return
+
+    for ddl in _SQLITE_SIGNAL_SEARCH_DDL:
+        cursor.execute(ddl)
+    cursor.execute("SELECT COUNT(*) as cnt FROM signal_fts")
+    row = cursor.fetchone()
+    count = row['cnt'] if isinstance(row, dict) else row[0]
+    if count == 0:
+        cursor.execute(_SIGNAL_FTS_REBUILD)
+
+
 def _seed_writing_preferences(cursor):
     """Insert default writing preferences if the table is empty."""
     cursor.execute("SELECT COUNT(*) as cnt FROM writing_preferences")
@@ -15,7 +15,10 @@ import re
 from typing import Optional, List
 from urllib.parse import urlparse
 
-from v2.db import db_connection, insert_returning_id, row_to_dict, rows_to_dicts
+from v2.db import (
+    accounts_changed, db_connection, insert_returning_id, parse_revenue_usd, row_to_dict, rows_to_dicts,
+    safe_json_dumps,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +121,88 @@ def mark_account_noise(account_id: int) -> bool:
     return ok
 
 
+# Signal cascade per target account status: (new signal status, from statuses).
+# Matches the single-account mark_account_* helpers; 'new' is a plain reset.
+_STATUS_CASCADES = {
+    'sequenced': ('actioned', ('new',)),
+    'revisit': ('actioned', ('new',)),
+    'noise': ('archived', ('new', 'actioned')),
+    'new': None,
+}
+
+_BULK_STATUS_CHUNK = 500
+
+
+def bulk_update_account_status(account_ids: List[int], new_status: str,
+                               created_by: Optional[str] = None) -> dict:
+    """Move many accounts to ``new_status`` with the same signal cascade as mark_account_*.
+
+    The account update and the signal cascade are each one set-based UPDATE
+    (per chunk of _BULK_STATUS_CHUNK ids), and one activity row per account is
+    written with executemany, all in a single transaction.
+
+    Returns:
+        Dict with status, updated_account_ids, not_found (ids with no account)
+        and signals_updated.
+
+    Raises:
+        ValueError: if new_status is not a valid account status.
+    """
+    if new_status not in _STATUS_CASCADES:
+        raise ValueError(f"Invalid account status '{new_status}'")
+
+    ids = list(dict.fromkeys(account_ids))
+    cascade = _STATUS_CASCADES[new_status]
+    updated_ids = []
+    signals_updated = 0
+
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        for start in range(0, len(ids), _BULK_STATUS_CHUNK):
+            chunk = ids[start:start + _BULK_STATUS_CHUNK]
+            placeholders = ', '.join(['?'] * len(chunk))
+            cursor.execute(f'SELECT id FROM monitored_accounts WHERE id IN ({placeholders})', tuple(chunk))
+            found = {r['id'] for r in rows_to_dicts(cursor.fetchall())}
+            chunk = [aid for aid in chunk if aid in found]
+            if not chunk:
+                continue
+            placeholders = ', '.join(['?'] * len(chunk))
+
+            cursor.execute(f'''
+                UPDATE monitored_accounts
+                SET account_status = ?, status_changed_at = CURRENT_TIMESTAMP
+                WHERE id IN ({placeholders})
+            ''', (new_status,) + tuple(chunk))
+            if cascade:
+                signal_status, from_statuses = cascade
+                cursor.execute(f'''
+                    UPDATE intent_signals
+                    SET status = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE account_id IN ({placeholders})
+                      AND status IN ({', '.join(['?'] * len(from_statuses))})
+                ''', (signal_status,) + tuple(chunk) + from_statuses)
+                signals_updated += cursor.rowcount if hasattr(cursor, 'rowcount') else 0
+            updated_ids.extend(chunk)
+
+        event_type = 'account_marked_noise' if new_status == 'noise' else 'account_status_changed'
+        details = safe_json_dumps({'status': new_status, 'bulk': True})
+        cursor.executemany('''
+            INSERT INTO activity_log (event_type, entity_type, entity_id, details, created_by)
+            VALUES (?, 'account', ?, ?, ?)
+        ''', [(event_type, aid, details, created_by) for aid in updated_ids])
+        conn.commit()
+
+    logger.info("[ACCOUNT] Bulk status -> %s for %d accounts (%d signals cascaded)",
+                new_status, len(updated_ids), signals_updated)
+    updated = set(updated_ids)
+    return {
+        'status': new_status,
+        'updated_account_ids': updated_ids,
+        'not_found': [aid for aid in ids if aid not in updated],
+        'signals_updated': signals_updated,
+    }
+
+
 def check_all_sequences_complete(account_id: int) -> bool:
     """Check if ALL non-DNC prospects for this account have completed sequences.
 
@@ -280,11 +365,12 @@ def find_or_create_account(
         account_id = insert_returning_id(cursor, '''
             INSERT INTO monitored_accounts (
                 company_name, website, industry, company_size,
-                annual_revenue, account_owner, account_status
-            ) VALUES (?, ?, ?, ?, ?, ?, 'new')
+                annual_revenue, annual_revenue_usd, account_owner, account_status
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, 'new')
         ''', (company_name, website, industry, company_size,
-              annual_revenue, account_owner))
+              annual_revenue, parse_revenue_usd(annual_revenue), account_owner))
         conn.commit()
+        accounts_changed()
         logger.info("[ACCOUNT] Created new account %d: %s", account_id, company_name)
         return account_id
 
@@ -358,6 +444,9 @@ def update_account_enrichment(account_id: int, **fields) -> bool:
             continue  # Don't overwrite existing data (except for overwrite-allowed fields)
         updates.append(f"{field_name} = ?")
         params.append(str(value).strip())
+        if field_name == 'annual_revenue':
+            updates.append("annual_revenue_usd = ?")
+            params.append(parse_revenue_usd(value))
 
     if not updates:
         return False
@@ -370,6 +459,7 @@ def update_account_enrichment(account_id: int, **fields) -> bool:
             tuple(params),
         )
         conn.commit()
+        accounts_changed()
         logger.info("[ACCOUNT] Enriched account %d with %d fields", account_id, len(updates))
     return True
 
@@ -3,15 +3,26 @@ Activity Service — audit trail for all key actions in the v2 pipeline.
 
 Every meaningful action (signal creation, campaign assignment, draft approval,
 enrollment, etc.) is logged here so Eric always has a timeline of what happened.
+
+database.rotate_event_logs() moves rows past the hot window
+(ACTIVITY_LOG_HOT_DAYS) to activity_log_archive. The recent-activity feed reads
+the hot table only; per-account and per-signal timelines continue into the
+archive.
 """
 import logging
 from typing import Optional, List
 
-from v2.db import db_connection, insert_returning_id, row_to_dict, rows_to_dicts, safe_json_dumps
+from v2.db import db_connection, event_log_sink, event_timestamp, rows_to_dicts, safe_json_dumps
 
 logger = logging.getLogger(__name__)
 
 
+_activity_sink = event_log_sink('ACTIVITY', '''
+    INSERT INTO activity_log (event_type, entity_type, entity_id, details, created_by, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+''')
+
+
 def log_activity(
     event_type: str,
     entity_type: Optional[str] = None,
@@ -19,7 +30,7 @@ def log_activity(
     details: Optional[dict] = None,
     created_by: Optional[str] = None,
 ) -> None:
-    """Insert one row into activity_log.
+    """Queue one row for activity_log (written in batches in the background).
 
     Args:
         event_type: one of the EventType enum values (e.g. 'signal_created',
@@ -31,19 +42,14 @@ def log_activity(
         created_by: who or what triggered this event.
     """
     try:
-        with db_connection() as conn:
-            cursor = conn.cursor()
-            insert_returning_id(cursor, '''
-                INSERT INTO activity_log (event_type, entity_type, entity_id, details, created_by)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                event_type,
-                entity_type,
-                entity_id,
-                safe_json_dumps(details) if details else None,
-                created_by,
-            ))
-            conn.commit()
+        _activity_sink.log((
+            event_type,
+            entity_type,
+            entity_id,
+            safe_json_dumps(details) if details else None,
+            created_by,
+            event_timestamp(),
+        ))
     except Exception:
         # Activity logging must never crash the caller.
         logger.exception("[ACTIVITY] Failed to log event %s for %s/%s",
@@ -62,6 +68,7 @@ def get_recent_activity(
         event_type: optional filter (e.g. 'signal_created').
         entity_type: optional filter (e.g. 'signal', 'account').
     """
+    _activity_sink.flush_before_read()
     with db_connection() as conn:
         cursor = conn.cursor()
 
@@ -88,27 +95,34 @@ def get_recent_activity(
         return rows_to_dicts(cursor.fetchall())
 
 
-def get_activity_for_account(account_id: int, limit: int = 50) -> List[dict]:
-    """Return activity entries whose entity_type is 'account' and entity_id matches."""
+def _get_entity_activity(entity_type: str, entity_id: int, limit: int) -> List[dict]:
+    """One entity's timeline, newest first: hot rows, then archived ones up to ``limit``."""
+    _activity_sink.flush_before_read()
     with db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT * FROM activity_log
-            WHERE entity_type = 'account' AND entity_id = ?
+            WHERE entity_type = ? AND entity_id = ?
             ORDER BY created_at DESC
             LIMIT ?
-        ''', (account_id, limit))
-        return rows_to_dicts(cursor.fetchall())
+        ''', (entity_type, entity_id, limit))
+        rows = rows_to_dicts(cursor.fetchall())
+        if len(rows) < limit:
+            cursor.execute('''
+                SELECT * FROM activity_log_archive
+                WHERE entity_type = ? AND entity_id = ?
+                ORDER BY created_at DESC
+                LIMIT ?
+            ''', (entity_type, entity_id, limit - len(rows)))
+            rows += rows_to_dicts(cursor.fetchall())
+        return rows
+
+
+def get_activity_for_account(account_id: int, limit: int = 50) -> List[dict]:
+    """Return activity entries whose entity_type is 'account' and entity_id matches."""
+    return _get_entity_activity('account', account_id, limit)
 
 
 def get_activity_for_signal(signal_id: int, limit: int = 50) -> List[dict]:
     """Return activity entries whose entity_type is 'signal' and entity_id matches."""
-    with db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT * FROM activity_log
-            WHERE entity_type = 'signal' AND entity_id = ?
-            ORDER BY created_at DESC
-            LIMIT ?
-        ''', (signal_id, limit))
-        return rows_to_dicts(cursor.fetchall())
+    return _get_entity_activity('signal', signal_id, limit)
@@ -5,9 +5,12 @@ Provides read-only aggregate queries across signals, prospects, drafts, and
 enrollments to surface conversion rates and pipeline health.
 """
 import logging
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from v2.db import db_connection, rows_to_dicts, row_to_dict
+from v2.db import (
+    db_connection, rows_to_dicts, row_to_dict, log_hot_days, log_rollup_counts, flush_event_logs,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -183,7 +186,13 @@ def get_signal_source_breakdown() -> list:
 
 
 def get_recent_activity_summary(days: int = 7) -> dict:
-    """Activity counts by event_type over the last N days."""
+    """Activity counts by event_type over the last N days.
+
+    Reads the hot activity_log; days older than its hot window come from the
+    daily rollups of archived rows.
+    """
+    # Count events still queued in the activity sink too (errors are logged)
+    flush_event_logs()
     with db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
@@ -193,10 +202,20 @@ def get_recent_activity_summary(days: int = 7) -> dict:
             GROUP BY event_type
             ORDER BY cnt DESC
         ''', (f'-{days} days',))
-        return {
-            'days': days,
-            'events': rows_to_dicts(cursor.fetchall()),
-        }
+        events = rows_to_dicts(cursor.fetchall())
+
+    if days > log_hot_days('activity_log'):
+        since_day = (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d')
+        counts = {e['event_type']: e['cnt'] for e in events}
+        for event_type, cnt in log_rollup_counts('activity_log', since_day).items():
+            counts[event_type] = counts.get(event_type, 0) + cnt
+        events = [{'event_type': k, 'cnt': v}
+                  for k, v in sorted(counts.items(), key=lambda kv: kv[1], reverse=True)]
+
+    return {
+        'days': days,
+        'events': events,
+    }
 
 
 # ---------------------------------------------------------------------------
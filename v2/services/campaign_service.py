@@ -3,13 +3,18 @@ Campaign Service — campaign CRUD, persona lookup, and deterministic campaign
 recommendation based on signal type.
 
 Campaign recommendation is the core logic that maps an intent signal to the
-right outreach campaign. It queries existing campaigns from the DB and matches
-by signal type keywords — no hardcoded campaign IDs.
+right outreach campaign. It matches existing campaigns by signal type keywords
+— no hardcoded campaign IDs — against an in-process catalog of the active
+campaigns. The catalog is rebuilt after any campaign write in this process
+(see database.get_campaigns_generation) and at most _CATALOG_TTL_SECONDS after
+writes made by other processes.
 """
 import logging
+import threading
+import time
 from typing import Optional, List
 
-from v2.db import db_connection, row_to_dict, rows_to_dicts, safe_json_loads
+from v2.db import campaigns_generation, db_connection, row_to_dict, rows_to_dicts, safe_json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -214,6 +219,77 @@ def get_campaign(campaign_id: int) -> Optional[dict]:
 # Campaign Recommendation
 # ---------------------------------------------------------------------------
 
+_CATALOG_TTL_SECONDS = 30
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def _build_campaign_catalog() -> dict:
+    """Load active campaigns and precompute the signal_type → campaign map."""
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT id, name, prompt FROM campaigns WHERE status = 'active'
+            ORDER BY created_at DESC
+        ''')
+        campaigns = [
+            {
+                'id': c['id'],
+                'name': c['name'],
+                'name_lower': (c.get('name') or '').lower(),
+                'text_lower': ((c.get('name') or '') + ' ' + (c.get('prompt') or '')).lower(),
+            }
+            for c in rows_to_dicts(cursor.fetchall())
+        ]
+
+    # First campaign (in list order) whose name contains each keyword
+    by_keyword = {}
+    for keywords in _SIGNAL_CAMPAIGN_KEYWORDS.values():
+        for kw in keywords:
+            kw = kw.lower()
+            if kw not in by_keyword:
+                by_keyword[kw] = next((c for c in campaigns if kw in c['name_lower']), None)
+
+    by_signal_type = {}
+    for signal_type, keywords in _SIGNAL_CAMPAIGN_KEYWORDS.items():
+        camp = next((by_keyword[kw.lower()] for kw in keywords if by_keyword[kw.lower()]), None)
+        if camp:
+            by_signal_type[signal_type] = {
+                'campaign_id': camp['id'],
+                'campaign_name': camp['name'],
+                'reasoning': _SIGNAL_REASONING.get(signal_type, '').format(campaign=camp['name']),
+            }
+
+    return {
+        'campaigns': campaigns,
+        'by_signal_type': by_signal_type,
+        'by_angle': {},
+        'generation': campaigns_generation(),
+        'loaded_at': time.monotonic(),
+    }
+
+
+def get_campaign_catalog() -> dict:
+    """Return the cached campaign catalog, rebuilding it when stale."""
+    global _catalog
+    catalog = _catalog
+    if (catalog is None or catalog['generation'] != campaigns_generation()
+            or time.monotonic() - catalog['loaded_at'] > _CATALOG_TTL_SECONDS):
+        with _catalog_lock:
+            catalog = _catalog
+            if (catalog is None or catalog['generation'] != campaigns_generation()
+                    or time.monotonic() - catalog['loaded_at'] > _CATALOG_TTL_SECONDS):
+                catalog = _catalog = _build_campaign_catalog()
+    return catalog
+
+
+def invalidate_campaign_catalog() -> None:
+    """Drop the cached catalog, e.g. after writing campaigns with raw SQL."""
+    global _catalog
+    _catalog = None
+
+
 def recommend_campaign(
     signal_type: Optional[str],
     outreach_angle: Optional[str] = None,
@@ -227,11 +303,14 @@ def recommend_campaign(
        name or prompt.
     3. Fallback: return the first active campaign.
 
+    All three steps are lookups in the cached campaign catalog.
+
     Returns:
         dict with keys: campaign_id, campaign_name, reasoning.
         If no campaigns exist at all, returns a stub with campaign_id=None.
     """
-    active_campaigns = list_campaigns(active_only=True)
+    catalog = get_campaign_catalog()
+    active_campaigns = catalog['campaigns']
 
     if not active_campaigns:
         return {
@@ -241,34 +320,26 @@ def recommend_campaign(
         }
 
     # --- 1. Match by signal_type keywords ---
-    if signal_type and signal_type in _SIGNAL_CAMPAIGN_KEYWORDS:
-        keywords = _SIGNAL_CAMPAIGN_KEYWORDS[signal_type]
-        for kw in keywords:
-            for camp in active_campaigns:
-                if kw.lower() in (camp.get('name') or '').lower():
-                    reasoning_template = _SIGNAL_REASONING.get(signal_type, '')
-                    reasoning = reasoning_template.format(campaign=camp['name'])
-                    return {
-                        'campaign_id': camp['id'],
-                        'campaign_name': camp['name'],
-                        'reasoning': reasoning,
-                    }
+    if signal_type and signal_type in catalog['by_signal_type']:
+        return dict(catalog['by_signal_type'][signal_type])
 
     # --- 2. Match by outreach_angle label ---
     if outreach_angle:
         # Convert enum-style value to display-friendly words for matching.
         angle_words = outreach_angle.replace('_', ' ').lower()
-        for camp in active_campaigns:
-            camp_text = ((camp.get('name') or '') + ' ' + (camp.get('prompt') or '')).lower()
-            if angle_words in camp_text:
-                return {
-                    'campaign_id': camp['id'],
-                    'campaign_name': camp['name'],
-                    'reasoning': (
-                        f"Matched campaign '{camp['name']}' based on outreach angle "
-                        f"'{outreach_angle}'. Signal type: {signal_type or 'unknown'}."
-                    ),
-                }
+        if angle_words not in catalog['by_angle']:
+            catalog['by_angle'][angle_words] = next(
+                (c for c in active_campaigns if angle_words in c['text_lower']), None)
+        camp = catalog['by_angle'][angle_words]
+        if camp:
+            return {
+                'campaign_id': camp['id'],
+                'campaign_name': camp['name'],
+                'reasoning': (
+                    f"Matched campaign '{camp['name']}' based on outreach angle "
+                    f"'{outreach_angle}'. Signal type: {signal_type or 'unknown'}."
+                ),
+            }
 
     # --- 3. Fallback: first active campaign ---
     fallback = active_campaigns[0]
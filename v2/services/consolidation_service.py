@@ -14,12 +14,16 @@ Usage:
 
     # Consolidate all accounts with 2+ active signals
     consolidate_all()
+
+    # Preview the merges for a set of accounts without writing
+    consolidate_accounts([1, 2, 3], dry_run=True)
 """
 import json
 import logging
 from typing import Optional
 
-from v2.db import db_connection, insert_returning_id, row_to_dict, rows_to_dicts, safe_json_dumps
+from v2.db import db_connection, insert_returning_id, rows_to_dicts, safe_json_dumps
+from v2.services.dedup_service import index_near_dup_bands, near_dup_signature, signal_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -104,77 +108,198 @@ def _build_consolidated_evidence(signals: list) -> str:
     return safe_json_dumps(evidence_items)
 
 
-def consolidate_account(account_id: int) -> Optional[int]:
-    """Merge all active signals for an account into one consolidated signal.
-
-    - Creates a new consolidated signal with combined description/evidence
-    - Archives all original signals (preserved, not deleted)
-    - Picks the strongest signal type as the primary
-    - Re-recommends the best campaign
-
-    Returns:
-        The consolidated signal_id, or None if no consolidation needed.
+# Active signals on accounts with 2+ of them, grouped by account, oldest first.
+_CANDIDATE_SIGNALS = '''
+    SELECT * FROM (
+        SELECT s.*, a.company_name,
+               COUNT(*) OVER (PARTITION BY s.account_id) AS account_signal_count
+        FROM intent_signals s
+        JOIN monitored_accounts a ON s.account_id = a.id
+        WHERE s.status NOT IN ('archived', 'noise') {account_filter}
+    ) candidates
+    WHERE account_signal_count > 1
+    ORDER BY account_id, created_at ASC, id ASC
+'''
+
+_ACCOUNT_FILTER_CHUNK = 500
+
+
+def _load_candidate_signals(cursor, account_ids=None) -> list:
+    """Load every consolidation candidate in one query (chunked for explicit account lists)."""
+    if account_ids is None:
+        cursor.execute(_CANDIDATE_SIGNALS.format(account_filter=''))
+        return rows_to_dicts(cursor.fetchall())
+
+    rows = []
+    account_ids = sorted(set(account_ids))
+    for start in range(0, len(account_ids), _ACCOUNT_FILTER_CHUNK):
+        chunk = account_ids[start:start + _ACCOUNT_FILTER_CHUNK]
+        cursor.execute(_CANDIDATE_SIGNALS.format(
+            account_filter=f"AND s.account_id IN ({', '.join(['?'] * len(chunk))})",
+        ), tuple(chunk))
+        rows.extend(rows_to_dicts(cursor.fetchall()))
+    return rows
+
+
+def _plan_merges(signals: list) -> list:
+    """Compute one merge per account from candidate rows ordered by account_id.
+
+    Pure in-memory step: campaign recommendations are memoized per primary
+    signal type, so each distinct type hits recommend_campaign once per batch.
     """
     from v2.services.campaign_service import recommend_campaign
 
-    with db_connection() as conn:
-        cursor = conn.cursor()
-
-        # Get all active (non-archived) signals for this account
-        cursor.execute('''
-            SELECT * FROM intent_signals
-            WHERE account_id = ? AND status NOT IN ('archived', 'noise')
-            ORDER BY created_at ASC
-        ''', (account_id,))
-        signals = rows_to_dicts(cursor.fetchall())
-
-        if len(signals) <= 1:
-            return None  # Nothing to consolidate
+    by_account = {}
+    for s in signals:
+        by_account.setdefault(s['account_id'], []).append(s)
 
+    recommendations = {}
+    plans = []
+    for account_id, group in by_account.items():
         # Find the strongest signal type
-        best = max(signals, key=lambda s: _signal_strength(s.get('signal_type', '')))
+        best = max(group, key=lambda s: _signal_strength(s.get('signal_type', '')))
         best_type = best.get('signal_type')
-
-        # Build consolidated description and evidence
-        consolidated_desc = _build_consolidated_description(signals)
-        consolidated_evidence = _build_consolidated_evidence(signals)
+        if best_type not in recommendations:
+            recommendations[best_type] = recommend_campaign(signal_type=best_type)
+        rec = recommendations[best_type]
 
         # Pick the best BDR quality score and positioning from originals
-        best_score = max((s.get('bdr_quality_score') or 0) for s in signals)
-        best_positioning = best.get('bdr_positioning', '')
-
-        # Recommend campaign for the strongest signal type
-        rec = recommend_campaign(signal_type=best_type)
-
-        # Create the consolidated signal
+        best_score = max((s.get('bdr_quality_score') or 0) for s in group)
+        plans.append({
+            'account_id': account_id,
+            'company': group[0].get('company_name'),
+            'signal_type': best_type,
+            'description': _build_consolidated_description(group),
+            'evidence': _build_consolidated_evidence(group),
+            'campaign_id': rec.get('campaign_id'),
+            'campaign_reasoning': rec.get('reasoning'),
+            'bdr_quality_score': best_score if best_score > 0 else None,
+            'bdr_positioning': best.get('bdr_positioning') or None,
+            'original_ids': [s['id'] for s in group],
+        })
+    return plans
+
+
+def _write_merges(cursor, plans: list) -> list:
+    """Insert consolidated signals and archive their originals (caller commits).
+
+    Returns the new signal ids in plan order.
+    """
+    new_ids = []
+    bands = []
+    for plan in plans:
+        signature = near_dup_signature(plan['description'], plan['evidence'])
         signal_id = insert_returning_id(cursor, '''
             INSERT INTO intent_signals (
                 account_id, signal_description, signal_type, evidence_type,
                 evidence_value, signal_source, recommended_campaign_id,
                 recommended_campaign_reasoning, status, created_by,
-                bdr_quality_score, bdr_positioning
-            ) VALUES (?, ?, ?, 'consolidated', ?, 'consolidation', ?, ?, 'new', 'consolidation_service', ?, ?)
+                bdr_quality_score, bdr_positioning, dedup_fingerprint, minhash_signature
+            ) VALUES (?, ?, ?, 'consolidated', ?, 'consolidation', ?, ?, 'new', 'consolidation_service', ?, ?, ?, ?)
         ''', (
-            account_id, consolidated_desc, best_type,
-            consolidated_evidence, rec.get('campaign_id'), rec.get('reasoning'),
-            best_score if best_score > 0 else None, best_positioning or None,
+            plan['account_id'], plan['description'], plan['signal_type'],
+            plan['evidence'], plan['campaign_id'], plan['campaign_reasoning'],
+            plan['bdr_quality_score'], plan['bdr_positioning'],
+            signal_fingerprint(plan['signal_type'], plan['evidence']), signature,
         ))
+        new_ids.append(signal_id)
+        bands.append((signal_id, plan['account_id'], signature))
+
+    index_near_dup_bands(cursor, bands)
+
+    # Archive all original signals
+    cursor.executemany(
+        "UPDATE intent_signals SET status = 'archived' WHERE id = ?",
+        [(sid,) for plan in plans for sid in plan['original_ids']],
+    )
+    return new_ids
+
+
+def consolidate_accounts(account_ids=None, dry_run: bool = False, chunk_size: int = 200) -> dict:
+    """Batch consolidation: merge active signals for many accounts at once.
+
+    Loads every candidate signal in one query, computes all merges in memory,
+    then writes them on a single connection, committing every ``chunk_size``
+    accounts.
+
+    Args:
+        account_ids: restrict to these accounts; None means every account
+            with 2+ active signals.
+        dry_run: compute the merges and return them without writing.
+        chunk_size: accounts per commit.
+
+    Returns:
+        Dict with 'consolidated', 'signals_merged' and 'accounts', one entry
+        per merge. Dry-run entries describe the diff: the signals that would
+        be archived and the consolidated signal that would replace them.
+    """
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        plans = _plan_merges(_load_candidate_signals(cursor, account_ids))
+        # Largest merges first, as consolidate_all has always reported them
+        plans.sort(key=lambda p: (-len(p['original_ids']), p['account_id']))
+
+        results = {
+            'consolidated': len(plans),
+            'signals_merged': sum(len(p['original_ids']) for p in plans),
+            'accounts': [],
+        }
 
-        # Archive all original signals
-        original_ids = [s['id'] for s in signals]
-        placeholders = ','.join(['?'] * len(original_ids))
-        cursor.execute(f'''
-            UPDATE intent_signals SET status = 'archived'
-            WHERE id IN ({placeholders})
-        ''', original_ids)
+        if dry_run:
+            for plan in plans:
+                results['accounts'].append({
+                    'account_id': plan['account_id'],
+                    'company': plan['company'],
+                    'signal_count': len(plan['original_ids']),
+                    'action': 'would consolidate',
+                    'archive_signal_ids': plan['original_ids'],
+                    'new_signal': {
+                        'signal_type': plan['signal_type'],
+                        'signal_description': plan['description'],
+                        'recommended_campaign_id': plan['campaign_id'],
+                        'bdr_quality_score': plan['bdr_quality_score'],
+                    },
+                })
+            return results
+
+        for start in range(0, len(plans), chunk_size):
+            chunk = plans[start:start + chunk_size]
+            new_ids = _write_merges(cursor, chunk)
+            conn.commit()
+            for plan, new_id in zip(chunk, new_ids):
+                results['accounts'].append({
+                    'account_id': plan['account_id'],
+                    'company': plan['company'],
+                    'signals_merged': len(plan['original_ids']),
+                    'new_signal_id': new_id,
+                })
+
+    if plans and not dry_run:
+        logger.info("[CONSOLIDATE] Merged %d signals across %d accounts",
+                    results['signals_merged'], results['consolidated'])
+    return results
 
-        conn.commit()
 
+def consolidate_account(account_id: int) -> Optional[int]:
+    """Merge all active signals for an account into one consolidated signal.
+
+    - Creates a new consolidated signal with combined description/evidence
+    - Archives all original signals (preserved, not deleted)
+    - Picks the strongest signal type as the primary
+    - Re-recommends the best campaign
+
+    Returns:
+        The consolidated signal_id, or None if no consolidation needed.
+    """
+    result = consolidate_accounts([account_id])
+    if not result['accounts']:
+        return None  # Nothing to consolidate
+    merged = result['accounts'][0]
     logger.info(
-        "[CONSOLIDATE] Account %d: merged %d signals into signal %d (primary type: %s)",
-        account_id, len(signals), signal_id, best_type,
+        "[CONSOLIDATE] Account %d: merged %d signals into signal %d",
+        account_id, merged['signals_merged'], merged['new_signal_id'],
     )
-    return signal_id
+    return merged['new_signal_id']
 
 
 def consolidate_all(dry_run: bool = False) -> dict:
@@ -186,53 +311,4 @@ def consolidate_all(dry_run: bool = False) -> dict:
     Returns:
         Summary dict with counts and details.
     """
-    with db_connection() as conn:
-        cursor = conn.cursor()
-
-        # Find accounts with multiple active signals
-        cursor.execute('''
-            SELECT s.account_id, a.company_name, COUNT(*) as signal_count
-            FROM intent_signals s
-            JOIN monitored_accounts a ON s.account_id = a.id
-            WHERE s.status NOT IN ('archived', 'noise')
-            GROUP BY s.account_id
-            HAVING signal_count > 1
-            ORDER BY signal_count DESC
-        ''')
-        accounts = rows_to_dicts(cursor.fetchall())
-
-    if not accounts:
-        return {'consolidated': 0, 'signals_merged': 0, 'accounts': []}
-
-    results = {
-        'consolidated': 0,
-        'signals_merged': 0,
-        'accounts': [],
-    }
-
-    for acct in accounts:
-        account_id = acct['account_id']
-        company = acct['company_name']
-        count = acct['signal_count']
-
-        if dry_run:
-            results['accounts'].append({
-                'company': company,
-                'signal_count': count,
-                'action': 'would consolidate',
-            })
-            results['consolidated'] += 1
-            results['signals_merged'] += count
-            continue
-
-        new_signal_id = consolidate_account(account_id)
-        if new_signal_id:
-            results['accounts'].append({
-                'company': company,
-                'signals_merged': count,
-                'new_signal_id': new_signal_id,
-            })
-            results['consolidated'] += 1
-            results['signals_merged'] += count
-
-    return results
+    return consolidate_accounts(dry_run=dry_run)
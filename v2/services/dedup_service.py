@@ -4,14 +4,186 @@ Dedup Service — detect and resolve duplicate intent signals.
 Finds clusters of signals that share the same account + signal_type + evidence,
 flags near-duplicates with similar descriptions, and provides bulk archive
 for cleaning up the queue.
+
+Exact duplicates are keyed on (account_id, dedup_fingerprint), a persisted
+hash of signal_type + evidence_value written by create_signal. Every finder
+is a single window-function pass over intent_signals.
+
+Near duplicates (the same announcement worded differently) use a MinHash
+signature of description + evidence, bucketed per account into LSH bands in
+signal_lsh_bands. create_signal writes both, so finding candidates is an
+indexed self-join on band_hash rather than an all-pairs comparison.
 """
+import hashlib
 import logging
+import operator
+import re
+import struct
 from typing import Optional, List
 
-from v2.db import db_connection, rows_to_dicts, row_to_dict
+from v2.db import db_connection, rows_to_dicts, row_to_dict, safe_json_dumps
 
 logger = logging.getLogger(__name__)
 
+_FINGERPRINT_BACKFILL_BATCH = 5000
+
+# MinHash / LSH parameters. 32 bands of 2 rows make a pair with Jaccard 0.45
+# a candidate with >99% probability; candidates are then verified against
+# the full signature, so loose banding only costs a few extra comparisons.
+NEAR_DUP_THRESHOLD = 0.45
+_MINHASH_SIZE = 64
+_LSH_ROWS = 2
+_SHINGLE_SIZE = 3
+_HASH_MASK = 0xFFFFFFFF
+_SIGNATURE_FORMAT = f'>{_MINHASH_SIZE}I'
+_DENSIFY_OFFSET = 0x9E3779B1
+_NEAR_DUP_BACKFILL_BATCH = 2000
+
+
+def signal_fingerprint(signal_type: Optional[str], evidence_value: Optional[str]) -> str:
+    """Stable hash of the fields that make two signals on one account exact duplicates.
+
+    NULL and empty string stay distinct, matching GROUP BY semantics.
+    """
+    parts = ['\x00' if v is None else str(v) for v in (signal_type, evidence_value)]
+    return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _backfill_fingerprints(cursor) -> int:
+    """Fill dedup_fingerprint for rows written without one (caller commits)."""
+    filled = 0
+    last_id = 0
+    while True:
+        cursor.execute('''
+            SELECT id, signal_type, evidence_value FROM intent_signals
+            WHERE dedup_fingerprint IS NULL AND id > ?
+            ORDER BY id
+            LIMIT ?
+        ''', (last_id, _FINGERPRINT_BACKFILL_BATCH))
+        rows = rows_to_dicts(cursor.fetchall())
+        if not rows:
+            break
+        cursor.executemany(
+            'UPDATE intent_signals SET dedup_fingerprint = ? WHERE id = ?',
+            [(signal_fingerprint(r['signal_type'], r['evidence_value']), r['id']) for r in rows],
+        )
+        filled += len(rows)
+        last_id = rows[-1]['id']
+    if filled:
+        logger.info("[DEDUP] Backfilled dedup_fingerprint for %d signals", filled)
+    return filled
+
+
+def _shingles(text: str) -> set:
+    text = re.sub(r'[^a-z0-9]+', ' ', text.lower()).strip()
+    if len(text) <= _SHINGLE_SIZE:
+        return {text} if text else set()
+    return {text[i:i + _SHINGLE_SIZE] for i in range(len(text) - _SHINGLE_SIZE + 1)}
+
+
+def near_dup_signature(signal_description: Optional[str], evidence_value: Optional[str]) -> str:
+    """MinHash signature of a signal's description + evidence, as a hex string.
+
+    Uses one-permutation hashing: each character shingle is hashed once and
+    lands in one of _MINHASH_SIZE bins, keeping the bin minimum; empty bins
+    borrow from the next filled bin. That makes the cost linear in the text
+    length so create_signal can afford it inline. Returns '' for empty text.
+    """
+    shingles = _shingles(f"{signal_description or ''} {evidence_value or ''}")
+    if not shingles:
+        return ''
+    bins = [None] * _MINHASH_SIZE
+    for shingle in shingles:
+        h = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        slot, value = h % _MINHASH_SIZE, (h >> 8) & _HASH_MASK
+        if bins[slot] is None or value < bins[slot]:
+            bins[slot] = value
+    for i in range(_MINHASH_SIZE):
+        if bins[i] is None:
+            distance = 1
+            while bins[(i + distance) % _MINHASH_SIZE] is None:
+                distance += 1
+            bins[i] = (bins[(i + distance) % _MINHASH_SIZE] + distance * _DENSIFY_OFFSET) & _HASH_MASK
+    return ''.join(f'{v:08x}' for v in bins)
+
+
+def signature_similarity(sig_a: Optional[str], sig_b: Optional[str]) -> float:
+    """Estimated Jaccard similarity of two near_dup_signature values."""
+    if not sig_a or not sig_b:
+        return 0.0
+    values_a = struct.unpack(_SIGNATURE_FORMAT, bytes.fromhex(sig_a))
+    values_b = struct.unpack(_SIGNATURE_FORMAT, bytes.fromhex(sig_b))
+    return sum(map(operator.eq, values_a, values_b)) / _MINHASH_SIZE
+
+
+def _band_hashes(account_id: int, signature: str) -> list:
+    """LSH bucket keys for a signature, scoped to its account."""
+    width = 8 * _LSH_ROWS
+    return [
+        int.from_bytes(hashlib.blake2b(
+            f'{account_id}:{band}:{signature[band * width:(band + 1) * width]}'.encode('ascii'),
+            digest_size=8).digest(), 'big', signed=True)
+        for band in range(_MINHASH_SIZE // _LSH_ROWS)
+    ]
+
+
+def index_near_dup_bands(cursor, entries) -> None:
+    """Write LSH band rows for (signal_id, account_id, signature) entries (caller commits)."""
+    cursor.executemany(
+        'INSERT INTO signal_lsh_bands (band_hash, signal_id) VALUES (?, ?)',
+        [(band, signal_id)
+         for signal_id, account_id, signature in entries if signature
+         for band in set(_band_hashes(account_id, signature))],
+    )
+
+
+def _backfill_near_dup_index(cursor) -> int:
+    """Sign and bucket signals whose minhash_signature is NULL (caller commits)."""
+    filled = 0
+    last_id = 0
+    while True:
+        cursor.execute('''
+            SELECT id, account_id, signal_description, evidence_value FROM intent_signals
+            WHERE minhash_signature IS NULL AND id > ?
+            ORDER BY id
+            LIMIT ?
+        ''', (last_id, _NEAR_DUP_BACKFILL_BATCH))
+        rows = rows_to_dicts(cursor.fetchall())
+        if not rows:
+            break
+        entries = [(r['id'], r['account_id'], near_dup_signature(r['signal_description'], r['evidence_value']))
+                   for r in rows]
+        # Re-indexed signals may still hold bands from a previous account
+        cursor.executemany('DELETE FROM signal_lsh_bands WHERE signal_id = ?', [(e[0],) for e in entries])
+        cursor.executemany('UPDATE intent_signals SET minhash_signature = ? WHERE id = ?',
+                           [(e[2], e[0]) for e in entries])
+        index_near_dup_bands(cursor, entries)
+        filled += len(rows)
+        last_id = rows[-1]['id']
+    if filled:
+        logger.info("[DEDUP] Indexed %d signals for near-duplicate detection", filled)
+    return filled
+
+
+# Active signals sharing (account_id, dedup_fingerprint) with at least one
+# other, oldest first within each cluster; rn = 1 is the signal to keep.
+_EXACT_DUPLICATE_ROWS = '''
+    SELECT * FROM (
+        SELECT s.id, s.account_id, s.signal_type, s.evidence_value,
+               s.signal_description, s.signal_source, s.status, s.created_at,
+               s.dedup_fingerprint, a.company_name,
+               ROW_NUMBER() OVER (
+                   PARTITION BY s.account_id, s.dedup_fingerprint
+                   ORDER BY s.created_at ASC, s.id ASC
+               ) AS rn,
+               COUNT(*) OVER (PARTITION BY s.account_id, s.dedup_fingerprint) AS cluster_size
+        FROM intent_signals s
+        JOIN monitored_accounts a ON s.account_id = a.id
+        WHERE s.status != 'archived'
+    ) ranked
+    WHERE cluster_size > 1
+'''
+
 
 def find_exact_duplicates() -> list:
     """Find signal clusters with identical account_id + signal_type + evidence_value.
@@ -22,50 +194,45 @@ def find_exact_duplicates() -> list:
     """
     with db_connection() as conn:
         cursor = conn.cursor()
+        if _backfill_fingerprints(cursor):
+            conn.commit()
 
-        # Find fingerprints with more than one signal
-        cursor.execute('''
-            SELECT account_id, signal_type, evidence_value, COUNT(*) as cnt
-            FROM intent_signals
-            WHERE status != 'archived'
-            GROUP BY account_id, signal_type, evidence_value
-            HAVING cnt > 1
-            ORDER BY cnt DESC
+        cursor.execute(_EXACT_DUPLICATE_ROWS + '''
+            ORDER BY cluster_size DESC, account_id, dedup_fingerprint, rn
         ''')
-        clusters = rows_to_dicts(cursor.fetchall())
-
-        results = []
-        for cluster in clusters:
-            cursor.execute('''
-                SELECT s.id, s.signal_description, s.signal_source, s.status,
-                       s.created_at, a.company_name
-                FROM intent_signals s
-                JOIN monitored_accounts a ON s.account_id = a.id
-                WHERE s.account_id = ? AND s.signal_type = ?
-                  AND s.status != 'archived'
-                  AND (s.evidence_value = ? OR (s.evidence_value IS NULL AND ? IS NULL))
-                ORDER BY s.created_at ASC
-            ''', (
-                cluster['account_id'], cluster['signal_type'],
-                cluster['evidence_value'], cluster['evidence_value'],
-            ))
-            signals = rows_to_dicts(cursor.fetchall())
-
-            if len(signals) < 2:
-                continue
-
-            results.append({
-                'company_name': signals[0].get('company_name'),
-                'account_id': cluster['account_id'],
-                'signal_type': cluster['signal_type'],
-                'evidence_value': cluster['evidence_value'],
-                'count': len(signals),
-                'keep_signal_id': signals[0]['id'],
-                'duplicate_signal_ids': [s['id'] for s in signals[1:]],
-                'signals': signals,
-            })
-
-        return results
+        rows = rows_to_dicts(cursor.fetchall())
+
+    results = []
+    for signals in _split_clusters(rows, ('account_id', 'dedup_fingerprint')):
+        results.append({
+            'company_name': signals[0].get('company_name'),
+            'account_id': signals[0]['account_id'],
+            'signal_type': signals[0]['signal_type'],
+            'evidence_value': signals[0]['evidence_value'],
+            'count': len(signals),
+            'keep_signal_id': signals[0]['id'],
+            'duplicate_signal_ids': [s['id'] for s in signals[1:]],
+            'signals': [_public_signal(s) for s in signals],
+        })
+    return results
+
+
+def _split_clusters(rows, key_fields) -> list:
+    """Split rows already ordered by key_fields into lists of consecutive equal keys."""
+    clusters = []
+    current_key = object()
+    for row in rows:
+        key = tuple(row[f] for f in key_fields)
+        if key != current_key:
+            clusters.append([])
+            current_key = key
+        clusters[-1].append(row)
+    return clusters
+
+
+def _public_signal(row) -> dict:
+    return {k: row[k] for k in ('id', 'signal_description', 'signal_source',
+                                 'status', 'created_at', 'company_name')}
 
 
 def find_same_account_type_dupes(account_id: Optional[int] = None) -> list:
@@ -83,50 +250,53 @@ def find_same_account_type_dupes(account_id: Optional[int] = None) -> list:
             where += " AND s.account_id = ?"
             params.append(account_id)
 
+        # Only the 50 largest groups are loaded: rank groups, not signals
         cursor.execute(f'''
-            SELECT s.account_id, a.company_name, s.signal_type, COUNT(*) as cnt
-            FROM intent_signals s
-            JOIN monitored_accounts a ON s.account_id = a.id
-            WHERE {where}
-            GROUP BY s.account_id, s.signal_type
-            HAVING cnt > 1
-            ORDER BY cnt DESC
-            LIMIT 50
+            SELECT * FROM (
+                SELECT grouped.*,
+                       DENSE_RANK() OVER (ORDER BY group_size DESC, account_id, signal_type) AS group_rank
+                FROM (
+                    SELECT s.id, s.account_id, a.company_name, s.signal_type,
+                           s.signal_description, s.evidence_value, s.signal_source,
+                           s.status, s.created_at,
+                           COUNT(*) OVER (PARTITION BY s.account_id, s.signal_type) AS group_size
+                    FROM intent_signals s
+                    JOIN monitored_accounts a ON s.account_id = a.id
+                    WHERE {where}
+                ) grouped
+                WHERE group_size > 1
+            ) ranked
+            WHERE group_rank <= 50
+            ORDER BY group_rank, created_at ASC, id ASC
         ''', tuple(params))
-
-        groups = rows_to_dicts(cursor.fetchall())
-
-        results = []
-        for g in groups:
-            cursor.execute('''
-                SELECT id, signal_description, evidence_value, signal_source,
-                       status, created_at
-                FROM intent_signals
-                WHERE account_id = ? AND signal_type = ? AND status != 'archived'
-                ORDER BY created_at ASC
-            ''', (g['account_id'], g['signal_type']))
-            signals = rows_to_dicts(cursor.fetchall())
-
-            # Check if evidence values differ — if so, they're distinct signals
-            evidence_set = set(s.get('evidence_value') for s in signals)
-            all_same_evidence = len(evidence_set) <= 1
-
-            results.append({
-                'company_name': g['company_name'],
-                'account_id': g['account_id'],
-                'signal_type': g['signal_type'],
-                'count': len(signals),
-                'all_same_evidence': all_same_evidence,
-                'signals': signals,
-            })
-
-        return results
+        rows = rows_to_dicts(cursor.fetchall())
+
+    results = []
+    for group in _split_clusters(rows, ('account_id', 'signal_type')):
+        signals = [
+            {k: s[k] for k in ('id', 'signal_description', 'evidence_value',
+                               'signal_source', 'status', 'created_at')}
+            for s in group
+        ]
+        # Check if evidence values differ — if so, they're distinct signals
+        evidence_set = set(s.get('evidence_value') for s in signals)
+        results.append({
+            'company_name': group[0]['company_name'],
+            'account_id': group[0]['account_id'],
+            'signal_type': group[0]['signal_type'],
+            'count': len(signals),
+            'all_same_evidence': len(evidence_set) <= 1,
+            'signals': signals,
+        })
+    return results
 
 
 def get_dedup_summary() -> dict:
     """High-level dedup stats for the dashboard."""
     with db_connection() as conn:
         cursor = conn.cursor()
+        if _backfill_fingerprints(cursor):
+            conn.commit()
 
         cursor.execute('''
             SELECT COUNT(*) as cnt FROM intent_signals WHERE status != 'archived'
@@ -139,9 +309,9 @@ def get_dedup_summary() -> dict:
                 SELECT COUNT(*) as cnt
                 FROM intent_signals
                 WHERE status != 'archived'
-                GROUP BY account_id, signal_type, evidence_value
-                HAVING cnt > 1
-            )
+                GROUP BY account_id, dedup_fingerprint
+                HAVING COUNT(*) > 1
+            ) clusters
         ''')
         exact_dupes = _val(cursor.fetchone())
 
@@ -153,7 +323,7 @@ def get_dedup_summary() -> dict:
                 WHERE status != 'archived'
                 GROUP BY account_id, signal_type
                 HAVING COUNT(*) > 1
-            )
+            ) groups_
         ''')
         type_clusters = _val(cursor.fetchone())
 
@@ -228,19 +398,47 @@ def archive_duplicates(signal_ids: List[int], keep_signal_id: int) -> dict:
 def auto_archive_exact_duplicates() -> dict:
     """Automatically archive all exact duplicates, keeping the oldest in each cluster.
 
+    One ranking query, one set-based UPDATE and one batched activity insert,
+    all in a single transaction.
+
     Returns summary of how many signals were archived.
     """
-    clusters = find_exact_duplicates()
-    total_archived = 0
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        _backfill_fingerprints(cursor)
 
-    for cluster in clusters:
-        result = archive_duplicates(
-            signal_ids=cluster['duplicate_signal_ids'],
-            keep_signal_id=cluster['keep_signal_id'],
-        )
-        if result.get('status') == 'success':
-            total_archived += result.get('archived', 0)
+        cursor.execute('''
+            SELECT id, account_id, dedup_fingerprint, rn FROM (
+        ''' + _EXACT_DUPLICATE_ROWS + '''
+            ) dupes
+            ORDER BY account_id, dedup_fingerprint, rn
+        ''')
+        clusters = _split_clusters(rows_to_dicts(cursor.fetchall()), ('account_id', 'dedup_fingerprint'))
+        if not clusters:
+            conn.commit()
+            return {'clusters_processed': 0, 'signals_archived': 0}
 
+        cursor.execute('''
+            UPDATE intent_signals
+            SET status = 'archived', updated_at = CURRENT_TIMESTAMP
+            WHERE id IN (SELECT id FROM (''' + _EXACT_DUPLICATE_ROWS + ''') dupes WHERE rn > 1)
+        ''')
+        total_archived = cursor.rowcount if hasattr(cursor, 'rowcount') else 0
+
+        cursor.executemany('''
+            INSERT INTO activity_log (event_type, entity_type, entity_id, details, created_by)
+            VALUES ('duplicates_archived', 'signal', ?, ?, 'dedup_service')
+        ''', [
+            (c[0]['id'], safe_json_dumps({
+                'archived_ids': [s['id'] for s in c[1:]],
+                'archived_count': len(c) - 1,
+            }))
+            for c in clusters
+        ])
+        conn.commit()
+
+    logger.info("[DEDUP] Auto-archived %d exact duplicates across %d clusters",
+                total_archived, len(clusters))
     return {
         'clusters_processed': len(clusters),
         'signals_archived': total_archived,
@@ -257,43 +455,33 @@ def consolidate_same_type_duplicates() -> dict:
     with db_connection() as conn:
         cursor = conn.cursor()
 
-        # Find account+type groups with 2+ signals
         cursor.execute('''
-            SELECT account_id, signal_type, COUNT(*) as cnt
-            FROM intent_signals
-            WHERE status != 'archived'
-            GROUP BY account_id, signal_type
-            HAVING cnt > 1
-            ORDER BY cnt DESC
+            SELECT COUNT(*) as cnt FROM (
+                SELECT account_id, signal_type
+                FROM intent_signals
+                WHERE status != 'archived'
+                GROUP BY account_id, signal_type
+                HAVING COUNT(*) > 1
+            ) groups_
         ''')
-        groups = rows_to_dicts(cursor.fetchall())
-
-        total_archived = 0
-        clusters_processed = 0
-
-        for g in groups:
-            cursor.execute('''
-                SELECT id FROM intent_signals
-                WHERE account_id = ? AND signal_type = ? AND status != 'archived'
-                ORDER BY created_at ASC
-            ''', (g['account_id'], g['signal_type']))
-            ids = [r['id'] if isinstance(r, dict) else r[0] for r in cursor.fetchall()]
-
-            if len(ids) < 2:
-                continue
-
-            keep_id = ids[0]
-            archive_ids = ids[1:]
+        clusters_processed = _val(cursor.fetchone())
 
-            placeholders = ', '.join(['?'] * len(archive_ids))
-            cursor.execute(f'''
-                UPDATE intent_signals
-                SET status = 'archived', updated_at = CURRENT_TIMESTAMP
-                WHERE id IN ({placeholders}) AND status != 'archived'
-            ''', tuple(archive_ids))
-            archived = cursor.rowcount if hasattr(cursor, 'rowcount') else len(archive_ids)
-            total_archived += archived
-            clusters_processed += 1
+        cursor.execute('''
+            UPDATE intent_signals
+            SET status = 'archived', updated_at = CURRENT_TIMESTAMP
+            WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, ROW_NUMBER() OVER (
+                        PARTITION BY account_id, signal_type
+                        ORDER BY created_at ASC, id ASC
+                    ) AS rn
+                    FROM intent_signals
+                    WHERE status != 'archived'
+                ) ranked
+                WHERE rn > 1
+            )
+        ''')
+        total_archived = cursor.rowcount if hasattr(cursor, 'rowcount') else 0
 
         conn.commit()
 
@@ -305,6 +493,135 @@ def consolidate_same_type_duplicates() -> dict:
     }
 
 
+_NEAR_DUP_SIGNAL_COLUMNS = '''
+    s.id, s.account_id, s.signal_type, s.evidence_value, s.signal_description,
+    s.signal_source, s.status, s.created_at, s.minhash_signature, a.company_name
+'''
+
+
+def find_near_duplicates(account_id: Optional[int] = None,
+                         threshold: float = NEAR_DUP_THRESHOLD) -> list:
+    """Find clusters of active signals on the same account with similar text.
+
+    Candidate pairs come from shared LSH buckets; a pair is linked when its
+    estimated Jaccard similarity is at least ``threshold`` and clusters are
+    the connected components. Each cluster keeps its oldest signal, and every
+    signal carries its similarity to that one. Sorted by cluster size.
+    """
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        if _backfill_near_dup_index(cursor):
+            conn.commit()
+
+        # Collapse bucket collisions to distinct pairs first, then verify
+        # each pair once against intent_signals
+        account_filter = ''
+        params = []
+        if account_id:
+            account_filter = 'WHERE b1.signal_id IN (SELECT id FROM intent_signals WHERE account_id = ?)'
+            params.append(account_id)
+        cursor.execute(f'''
+            SELECT p.id_a, p.id_b, s1.minhash_signature AS sig_a, s2.minhash_signature AS sig_b
+            FROM (
+                SELECT DISTINCT b1.signal_id AS id_a, b2.signal_id AS id_b
+                FROM signal_lsh_bands b1
+                JOIN signal_lsh_bands b2 ON b2.band_hash = b1.band_hash AND b2.signal_id > b1.signal_id
+                {account_filter}
+            ) p
+            JOIN intent_signals s1 ON s1.id = p.id_a
+            JOIN intent_signals s2 ON s2.id = p.id_b
+            WHERE s1.status != 'archived' AND s2.status != 'archived'
+              AND s1.account_id = s2.account_id
+        ''', tuple(params))
+
+        parent = {}
+
+        def _root(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for pair in rows_to_dicts(cursor.fetchall()):
+            if signature_similarity(pair['sig_a'], pair['sig_b']) < threshold:
+                continue
+            a, b = parent.setdefault(pair['id_a'], pair['id_a']), parent.setdefault(pair['id_b'], pair['id_b'])
+            ra, rb = _root(a), _root(b)
+            if ra != rb:
+                parent[max(ra, rb)] = min(ra, rb)
+
+        members = {}
+        ids = list(parent)
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            cursor.execute(f'''
+                SELECT {_NEAR_DUP_SIGNAL_COLUMNS}
+                FROM intent_signals s
+                JOIN monitored_accounts a ON s.account_id = a.id
+                WHERE s.id IN ({', '.join(['?'] * len(chunk))})
+            ''', tuple(chunk))
+            for row in rows_to_dicts(cursor.fetchall()):
+                members.setdefault(_root(row['id']), []).append(row)
+
+    results = []
+    for signals in members.values():
+        signals.sort(key=lambda s: (str(s['created_at']), s['id']))
+        keep = signals[0]
+        results.append({
+            'company_name': keep['company_name'],
+            'account_id': keep['account_id'],
+            'count': len(signals),
+            'keep_signal_id': keep['id'],
+            'duplicate_signal_ids': [s['id'] for s in signals[1:]],
+            'signals': [
+                {**_public_signal(s), 'signal_type': s['signal_type'],
+                 'similarity': signature_similarity(keep['minhash_signature'], s['minhash_signature'])}
+                for s in signals
+            ],
+        })
+    results.sort(key=lambda c: (-c['count'], c['keep_signal_id']))
+    return results
+
+
+def find_similar_signals(signal_id: int, threshold: float = NEAR_DUP_THRESHOLD) -> Optional[list]:
+    """Active signals on the same account whose text is similar to ``signal_id``.
+
+    Returns None if the signal does not exist, otherwise matches sorted by
+    similarity (highest first).
+    """
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT id, account_id, minhash_signature FROM intent_signals WHERE id = ?
+        ''', (signal_id,))
+        target = row_to_dict(cursor.fetchone())
+        if not target:
+            return None
+        if target['minhash_signature'] is None:
+            _backfill_near_dup_index(cursor)
+            conn.commit()
+            cursor.execute('SELECT minhash_signature FROM intent_signals WHERE id = ?', (signal_id,))
+            target['minhash_signature'] = row_to_dict(cursor.fetchone())['minhash_signature']
+
+        cursor.execute(f'''
+            SELECT DISTINCT {_NEAR_DUP_SIGNAL_COLUMNS}
+            FROM signal_lsh_bands b1
+            JOIN signal_lsh_bands b2 ON b2.band_hash = b1.band_hash AND b2.signal_id != b1.signal_id
+            JOIN intent_signals s ON s.id = b2.signal_id
+            JOIN monitored_accounts a ON s.account_id = a.id
+            WHERE b1.signal_id = ? AND s.account_id = ? AND s.status != 'archived'
+        ''', (signal_id, target['account_id']))
+        candidates = rows_to_dicts(cursor.fetchall())
+
+    matches = []
+    for c in candidates:
+        similarity = signature_similarity(target['minhash_signature'], c['minhash_signature'])
+        if similarity >= threshold:
+            matches.append({**_public_signal(c), 'signal_type': c['signal_type'], 'similarity': similarity})
+    matches.sort(key=lambda m: (-m['similarity'], m['id']))
+    return matches
+
+
 def _val(row):
     if row is None:
         return 0
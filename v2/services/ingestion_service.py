@@ -23,7 +23,7 @@ import re
 import uuid
 from typing import Optional
 
-from v2.db import db_connection, row_to_dict, rows_to_dicts, safe_json_dumps
+from v2.db import accounts_changed, db_connection, row_to_dict, rows_to_dicts, safe_json_dumps
 from v2.services import activity_service
 from v2.services import campaign_service
 from v2.services import signal_service
@@ -860,6 +860,7 @@ def _clear_all_signals():
         cursor.execute("DELETE FROM monitored_accounts")
         cursor.execute("PRAGMA foreign_keys = ON")
         conn.commit()
+        accounts_changed()
 
         logger.info("[INGEST] Cleared all signals and accounts (%d signals deleted)", count)
         return count
@@ -907,29 +908,23 @@ def _consolidate_batch_signals(created_signals):
         return 0
 
     try:
-        from v2.services.consolidation_service import consolidate_account
+        from v2.services.consolidation_service import consolidate_accounts
         from v2.db import db_connection, rows_to_dicts
 
-        # Find unique account_ids from this batch that have 2+ active signals
+        # Unique account_ids touched by this batch, looked up in chunks rather than per signal
+        signal_ids = [sig.get('signal_id') for sig in created_signals if sig.get('signal_id')]
         seen_accounts = set()
-        for sig in created_signals:
-            # Get account_id from the signal record
-            with db_connection() as conn:
-                cursor = conn.cursor()
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(signal_ids), 500):
+                chunk = signal_ids[start:start + 500]
                 cursor.execute(
-                    "SELECT account_id FROM intent_signals WHERE id = ?",
-                    (sig.get('signal_id'),),
+                    f"SELECT DISTINCT account_id FROM intent_signals WHERE id IN ({', '.join(['?'] * len(chunk))})",
+                    tuple(chunk),
                 )
-                row = cursor.fetchone()
-                if row:
-                    aid = row['account_id'] if isinstance(row, dict) else row[0]
-                    seen_accounts.add(aid)
-
-        consolidated = 0
-        for account_id in seen_accounts:
-            result = consolidate_account(account_id)
-            if result:
-                consolidated += 1
+                seen_accounts.update(r['account_id'] for r in rows_to_dicts(cursor.fetchall()))
+
+        consolidated = consolidate_accounts(seen_accounts)['consolidated'] if seen_accounts else 0
 
         if consolidated:
             logger.info("[INGEST] Consolidated signals for %d accounts", consolidated)
@@ -4,10 +4,16 @@ Signal Service — CRUD and query operations for intent signals.
 Intent signals are the root object of the v2 domain. Every workflow starts
 from a signal in the queue.
 """
+import base64
+import json
 import logging
 from typing import Optional, List
 
-from v2.db import db_connection, insert_returning_id, row_to_dict, rows_to_dicts, safe_json_dumps
+from v2.db import (
+    db_connection, insert_returning_id, json_path_sql, row_to_dict, rows_to_dicts, safe_json_dumps,
+    search_join_sql, search_match_query,
+)
+from v2.services.dedup_service import index_near_dup_bands, near_dup_signature, signal_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +39,9 @@ def create_signal(
     outreach_angle: Optional[str] = None,
 ) -> int:
     """Create a new intent signal. Returns the signal id."""
+    if isinstance(evidence_value, (dict, list)):
+        evidence_value = safe_json_dumps(evidence_value)
+    signature = near_dup_signature(signal_description, evidence_value)
     with db_connection() as conn:
         cursor = conn.cursor()
         signal_id = insert_returning_id(cursor, '''
@@ -40,31 +49,38 @@ def create_signal(
                 account_id, signal_description, evidence_type, evidence_value,
                 signal_type, signal_source, recommended_campaign_id,
                 recommended_campaign_reasoning, created_by, ingestion_batch_id,
-                raw_payload, scan_signal_id, outreach_angle
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                raw_payload, scan_signal_id, outreach_angle, dedup_fingerprint,
+                minhash_signature
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ''', (
-            account_id, signal_description, evidence_type,
-            safe_json_dumps(evidence_value) if isinstance(evidence_value, (dict, list)) else evidence_value,
+            account_id, signal_description, evidence_type, evidence_value,
             signal_type, signal_source, recommended_campaign_id,
             recommended_campaign_reasoning, created_by, ingestion_batch_id,
             safe_json_dumps(raw_payload) if isinstance(raw_payload, (dict, list)) else raw_payload,
-            scan_signal_id, outreach_angle,
+            scan_signal_id, outreach_angle, signal_fingerprint(signal_type, evidence_value),
+            signature,
         ))
+        index_near_dup_bands(cursor, [(signal_id, account_id, signature)])
         conn.commit()
         logger.info("[SIGNAL] Created signal %d for account %d (type=%s, source=%s)",
                      signal_id, account_id, signal_type, signal_source)
         return signal_id
 
 
+_SIGNAL_ACCOUNT_COLUMNS = '''
+    s.*, a.company_name, a.website, a.industry,
+    a.company_size, a.annual_revenue, a.account_status,
+    a.account_owner, a.github_org, a.linkedin_url, a.hq_location,
+    a.current_tier, a.evidence_summary, a.employee_count, a.funding_stage
+'''
+
+
 def get_signal(signal_id: int) -> Optional[dict]:
     """Get a single signal by id, enriched with account info."""
     with db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute('''
-            SELECT s.*, a.company_name, a.website, a.industry,
-                   a.company_size, a.annual_revenue, a.account_status,
-                   a.account_owner, a.github_org, a.linkedin_url, a.hq_location,
-                   a.current_tier, a.evidence_summary, a.employee_count, a.funding_stage
+        cursor.execute(f'''
+            SELECT {_SIGNAL_ACCOUNT_COLUMNS}
             FROM intent_signals s
             JOIN monitored_accounts a ON s.account_id = a.id
             WHERE s.id = ?
@@ -72,20 +88,67 @@ def get_signal(signal_id: int) -> Optional[dict]:
         return row_to_dict(cursor.fetchone())
 
 
+def encode_signal_cursor(signal: dict) -> str:
+    """Encode the queue sort key of a signal row as an opaque page cursor."""
+    created_at = signal.get('created_at')
+    if hasattr(created_at, 'isoformat'):
+        created_at = created_at.isoformat(sep=' ')
+    key = [signal.get('current_tier') or 0, created_at, signal['id']]
+    raw = json.dumps(key, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_signal_cursor(token: str) -> tuple:
+    """Decode a cursor from encode_signal_cursor. Raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        tier, created_at, signal_id = json.loads(raw)
+    except Exception:
+        raise ValueError('Invalid cursor')
+    if not isinstance(tier, int) or not isinstance(signal_id, int) or not isinstance(created_at, str):
+        raise ValueError('Invalid cursor')
+    return tier, created_at, signal_id
+
+
 def list_signals(
     status: Optional[str] = None,
     owner: Optional[str] = None,
     signal_type: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    q: Optional[str] = None,
 ) -> dict:
-    """List intent signals with optional filters. Returns {signals, total}."""
+    """List intent signals with optional filters. Returns {signals, total, next_cursor}.
+
+    Pass the previous page's ``next_cursor`` as ``cursor`` for keyset
+    pagination; ``offset`` is ignored in that case. ``next_cursor`` is None
+    on the last page. With ``include_total=False`` the COUNT query is
+    skipped and ``total`` is None.
+
+    ``q`` restricts the queue to full-text matches on company name,
+    description, evidence and positioning, best match first. Search results
+    page by ``offset`` only (``next_cursor`` is None; ``cursor`` is rejected).
+    """
+    match = search_match_query(q)
+    if match and cursor:
+        raise ValueError('cursor pagination is not supported with a search query')
+    keyset = decode_signal_cursor(cursor) if cursor else None
+
     with db_connection() as conn:
-        cursor = conn.cursor()
+        db_cursor = conn.cursor()
 
         where_clauses = ['1=1']
         params = []
 
+        join_sql = ''
+        order_sql = "COALESCE(a.current_tier, 0) ASC, s.created_at DESC, s.id DESC"
+        if match:
+            join_sql = search_join_sql('signals', 'fts', 's.id')
+            params.append(match)
+            order_sql = "fts.search_rank ASC, s.id DESC"
+
         if status:
             where_clauses.append("a.account_status = ?")
             params.append(status)
@@ -105,32 +168,49 @@ def list_signals(
         where_sql = " AND ".join(where_clauses)
 
         # Count
-        cursor.execute(f'''
-            SELECT COUNT(*) as cnt
-            FROM intent_signals s
-            JOIN monitored_accounts a ON s.account_id = a.id
-            WHERE {where_sql}
-        ''', tuple(params))
-        row = cursor.fetchone()
-        total = row['cnt'] if isinstance(row, dict) else row[0]
+        total = None
+        if include_total:
+            db_cursor.execute(f'''
+                SELECT COUNT(*) as cnt
+                FROM intent_signals s
+                JOIN monitored_accounts a ON s.account_id = a.id
+                {join_sql}
+                WHERE {where_sql}
+            ''', tuple(params))
+            row = db_cursor.fetchone()
+            total = row['cnt'] if isinstance(row, dict) else row[0]
+
+        # Keyset: rows strictly after (tier ASC, created_at DESC, id DESC)
+        page_sql = "LIMIT ? OFFSET ?"
+        page_params = (limit, offset)
+        if keyset:
+            tier, created_at, signal_id = keyset
+            where_sql += ''' AND (COALESCE(a.current_tier, 0) > ?
+                OR (COALESCE(a.current_tier, 0) = ? AND (s.created_at < ?
+                    OR (s.created_at = ? AND s.id < ?))))'''
+            params.extend([tier, tier, created_at, created_at, signal_id])
+            page_sql = "LIMIT ?"
+            page_params = (limit,)
 
         # Fetch — account_status is exposed as workflow_status for the public API
-        cursor.execute(f'''
+        db_cursor.execute(f'''
             SELECT s.*, a.company_name, a.website, a.industry,
                    a.company_size, a.annual_revenue, a.account_status,
                    a.account_status AS workflow_status,
-                   a.account_owner
+                   a.account_owner, COALESCE(a.current_tier, 0) AS current_tier
             FROM intent_signals s
             JOIN monitored_accounts a ON s.account_id = a.id
+            {join_sql}
             WHERE {where_sql}
-            ORDER BY a.current_tier ASC, s.created_at DESC
-            LIMIT ? OFFSET ?
-        ''', tuple(params) + (limit, offset))
+            ORDER BY {order_sql}
+            {page_sql}
+        ''', tuple(params) + page_params)
+        signals = rows_to_dicts(db_cursor.fetchall())
 
-        return {
-            'signals': rows_to_dicts(cursor.fetchall()),
-            'total': total,
-        }
+        next_cursor = None
+        if not match and len(signals) == limit:
+            next_cursor = encode_signal_cursor(signals[-1])
+        return {'signals': signals, 'total': total, 'next_cursor': next_cursor}
 
 
 def update_signal_status(signal_id: int, status: str) -> bool:
@@ -168,34 +248,74 @@ def archive_signal(signal_id: int) -> bool:
     return update_signal_status(signal_id, 'archived')
 
 
+# Workspace scorecard key -> reports.scan_data['scoring_v2'] field
+_SCORECARD_FIELDS = (
+    ('maturity_level', 'org_maturity_level'),
+    ('maturity_label', 'org_maturity_label'),
+    ('intent_score', 'org_intent_score'),
+    ('readiness_index', 'readiness_index'),
+    ('confidence_percent', 'confidence_percent'),
+    ('outreach_angle', 'outreach_angle_label'),
+    ('risk_level', 'risk_level'),
+)
+
+
 def get_signal_workspace(signal_id: int) -> Optional[dict]:
     """Get the full workspace context for a signal.
 
     Returns signal + account + recommended campaign + personas + existing prospects.
     Used by both the web UI and MCP tools.
+
+    Everything is loaded on one connection with no query depending on the
+    result of another; the scorecard comes from the latest report's
+    denormalized columns instead of the scan_data blob.
     """
-    signal = get_signal(signal_id)
-    if not signal:
-        return None
+    # Reports saved (or backfilled) since the scorecard columns were added
+    # carry the fields denormalized; older rows fall back to JSON extraction.
+    scorecard_sql = ',\n'.join(
+        f"r.{field} AS sc_{key}, CASE WHEN r.scorecard_extracted = 0 "
+        f"THEN {json_path_sql('r.scan_data', 'scoring_v2', field)} END AS scj_{key}"
+        for key, field in _SCORECARD_FIELDS
+    )
 
     with db_connection() as conn:
         cursor = conn.cursor()
 
+        # Signal + account + latest-report scorecard
+        cursor.execute(f'''
+            SELECT {_SIGNAL_ACCOUNT_COLUMNS},
+                   {scorecard_sql}
+            FROM intent_signals s
+            JOIN monitored_accounts a ON s.account_id = a.id
+            LEFT JOIN reports r ON r.id = a.latest_report_id
+            WHERE s.id = ?
+        ''', (signal_id,))
+        signal = row_to_dict(cursor.fetchone())
+        if not signal:
+            return None
+
+        scores = {}
+        for key, _ in _SCORECARD_FIELDS:
+            column_value = signal.pop(f'sc_{key}', None)
+            json_value = signal.pop(f'scj_{key}', None)
+            scores[key] = column_value if column_value is not None else json_value
+        scorecard = scores if any(v is not None for v in scores.values()) else None
+
         # Campaign recommendation
-        campaign = None
-        personas = []
-        if signal.get('recommended_campaign_id'):
-            cursor.execute('''
-                SELECT * FROM campaigns WHERE id = ?
-            ''', (signal['recommended_campaign_id'],))
-            campaign = row_to_dict(cursor.fetchone())
-
-            if campaign:
-                cursor.execute('''
-                    SELECT * FROM campaign_personas WHERE campaign_id = ?
-                    ORDER BY priority ASC
-                ''', (campaign['id'],))
-                personas = rows_to_dicts(cursor.fetchall())
+        cursor.execute('''
+            SELECT c.* FROM campaigns c
+            JOIN intent_signals s ON s.recommended_campaign_id = c.id
+            WHERE s.id = ?
+        ''', (signal_id,))
+        campaign = row_to_dict(cursor.fetchone())
+
+        cursor.execute('''
+            SELECT cp.* FROM campaign_personas cp
+            JOIN intent_signals s ON s.recommended_campaign_id = cp.campaign_id
+            WHERE s.id = ?
+            ORDER BY cp.priority ASC
+        ''', (signal_id,))
+        personas = rows_to_dicts(cursor.fetchall())
 
         # Existing prospects for this signal
         cursor.execute('''
@@ -205,38 +325,16 @@ def get_signal_workspace(signal_id: int) -> Optional[dict]:
         prospects = rows_to_dicts(cursor.fetchall())
 
         # Drafts for these prospects
-        prospect_ids = [p['id'] for p in prospects]
-        drafts = []
-        if prospect_ids:
-            placeholders = ', '.join(['?'] * len(prospect_ids))
-            cursor.execute(f'''
-                SELECT * FROM drafts WHERE prospect_id IN ({placeholders})
-                ORDER BY prospect_id, sequence_step, updated_at DESC, created_at DESC, id DESC
-            ''', tuple(prospect_ids))
-            from v2.services.draft_service import collapse_draft_versions
-            drafts = collapse_draft_versions(
-                rows_to_dicts(cursor.fetchall()),
-                key_fields=('prospect_id', 'sequence_step'),
-            )
-
-        drafts_by_prospect = {}
-        for draft in drafts:
-            drafts_by_prospect.setdefault(draft.get('prospect_id'), []).append(draft)
-
-        approved_prospect_ids = []
-        for prospect in prospects:
-            prospect_drafts = drafts_by_prospect.get(prospect.get('id'), [])
-            all_drafts_approved = bool(prospect_drafts) and all(
-                _is_enrollment_approved_status(d.get('status'))
-                for d in prospect_drafts
-            )
-            prospect['all_drafts_approved'] = all_drafts_approved
-            if all_drafts_approved and not prospect.get('do_not_contact'):
-                approved_prospect_ids.append(prospect['id'])
-
-        actionable_prospects = [p for p in prospects if not p.get('do_not_contact')]
-        enrollment_ready = bool(actionable_prospects) and all(
-            p.get('all_drafts_approved') for p in actionable_prospects
+        cursor.execute('''
+            SELECT d.* FROM drafts d
+            JOIN prospects p ON d.prospect_id = p.id
+            WHERE p.signal_id = ?
+            ORDER BY d.prospect_id, d.sequence_step, d.updated_at DESC, d.created_at DESC, d.id DESC
+        ''', (signal_id,))
+        from v2.services.draft_service import collapse_draft_versions
+        drafts = collapse_draft_versions(
+            rows_to_dicts(cursor.fetchall()),
+            key_fields=('prospect_id', 'sequence_step'),
         )
 
         # Writing preferences
@@ -252,33 +350,25 @@ def get_signal_workspace(signal_id: int) -> Optional[dict]:
         """)
         sequences = rows_to_dicts(cursor.fetchall())
 
-        # Scorecard from latest scan report
-        scorecard = None
-        cursor.execute('''
-            SELECT r.scan_data FROM reports r
-            JOIN monitored_accounts ma ON ma.latest_report_id = r.id
-            WHERE ma.id = ?
-        ''', (signal['account_id'],))
-        report_row = cursor.fetchone()
-        if report_row:
-            import json
-            scan_data = report_row['scan_data'] if isinstance(report_row, dict) else report_row[0]
-            if isinstance(scan_data, str):
-                try:
-                    scan_data = json.loads(scan_data)
-                except (json.JSONDecodeError, TypeError):
-                    scan_data = {}
-            scoring = scan_data.get('scoring_v2', {}) if isinstance(scan_data, dict) else {}
-            if scoring:
-                scorecard = {
-                    'maturity_level': scoring.get('org_maturity_level'),
-                    'maturity_label': scoring.get('org_maturity_label'),
-                    'intent_score': scoring.get('org_intent_score'),
-                    'readiness_index': scoring.get('readiness_index'),
-                    'confidence_percent': scoring.get('confidence_percent'),
-                    'outreach_angle': scoring.get('outreach_angle_label'),
-                    'risk_level': scoring.get('risk_level'),
-                }
+    drafts_by_prospect = {}
+    for draft in drafts:
+        drafts_by_prospect.setdefault(draft.get('prospect_id'), []).append(draft)
+
+    approved_prospect_ids = []
+    for prospect in prospects:
+        prospect_drafts = drafts_by_prospect.get(prospect.get('id'), [])
+        all_drafts_approved = bool(prospect_drafts) and all(
+            _is_enrollment_approved_status(d.get('status'))
+            for d in prospect_drafts
+        )
+        prospect['all_drafts_approved'] = all_drafts_approved
+        if all_drafts_approved and not prospect.get('do_not_contact'):
+            approved_prospect_ids.append(prospect['id'])
+
+    actionable_prospects = [p for p in prospects if not p.get('do_not_contact')]
+    enrollment_ready = bool(actionable_prospects) and all(
+        p.get('all_drafts_approved') for p in actionable_prospects
+    )
 
     return {
         'signal': signal,
@@ -357,32 +447,79 @@ def get_signal_counts_by_status() -> dict:
     behavior) so tab counts reflect what users actually see in the list.
     Noise signals ARE included even though they have s.status='archived'
     (due to cascade), so the noise tab count stays accurate.
+
+    Reads the trigger-maintained signal_status_counts table, so this is
+    O(number of statuses) regardless of queue size.
     """
     with db_connection() as conn:
         cursor = conn.cursor()
-        # Count non-archived signals grouped by account_status
         cursor.execute('''
-            SELECT a.account_status AS workflow_status, COUNT(*) as cnt
-            FROM intent_signals s
-            JOIN monitored_accounts a ON s.account_id = a.id
-            WHERE s.status != 'archived'
-            GROUP BY a.account_status
+            SELECT workflow_status, visible_count, total_count
+            FROM signal_status_counts
         ''')
-        counts = {r['workflow_status']: r['cnt'] for r in rows_to_dicts(cursor.fetchall())}
+        return _counts_for_tabs(rows_to_dicts(cursor.fetchall()))
+
+
+def _counts_for_tabs(rows) -> dict:
+    """Shape signal_status_counts rows into the {workflow_status: count} tab dict."""
+    counts = {}
+    for r in rows:
+        status = r['workflow_status'] or None
+        if status == 'noise':
+            if r['total_count'] > 0:
+                counts['noise'] = r['total_count']
+        elif r['visible_count'] > 0:
+            counts[status] = r['visible_count']
+    return counts
+
 
-        # Noise signals have s.status='archived' (cascade), so count them separately
+def check_signal_status_counts(repair: bool = False) -> dict:
+    """Compare signal_status_counts with a live recount of intent_signals.
+
+    Args:
+        repair: rebuild the table from the live counts if they disagree.
+
+    Returns:
+        {consistent, mismatches: [{workflow_status, stored, actual}], repaired}
+    """
+    from v2.schema import rebuild_signal_status_counts
+
+    with db_connection() as conn:
+        cursor = conn.cursor()
         cursor.execute('''
-            SELECT COUNT(*) as cnt
+            SELECT COALESCE(a.account_status, '') AS workflow_status,
+                   SUM(CASE WHEN s.status != 'archived' THEN 1 ELSE 0 END) AS visible_count,
+                   COUNT(*) AS total_count
             FROM intent_signals s
             JOIN monitored_accounts a ON s.account_id = a.id
-            WHERE a.account_status = 'noise'
+            GROUP BY COALESCE(a.account_status, '')
         ''')
-        row = cursor.fetchone()
-        noise_count = row['cnt'] if isinstance(row, dict) else row[0]
-        if noise_count > 0:
-            counts['noise'] = noise_count
-
-        return counts
+        actual = {r['workflow_status']: (int(r['visible_count']), int(r['total_count']))
+                  for r in rows_to_dicts(cursor.fetchall())}
+
+        cursor.execute("SELECT workflow_status, visible_count, total_count FROM signal_status_counts")
+        stored = {r['workflow_status']: (r['visible_count'], r['total_count'])
+                  for r in rows_to_dicts(cursor.fetchall())}
+
+        mismatches = []
+        for status in sorted(set(actual) | set(stored)):
+            want = actual.get(status, (0, 0))
+            have = stored.get(status, (0, 0))
+            if want != have:
+                mismatches.append({
+                    'workflow_status': status or None,
+                    'stored': {'visible': have[0], 'total': have[1]},
+                    'actual': {'visible': want[0], 'total': want[1]},
+                })
+
+        repaired = False
+        if mismatches and repair:
+            rebuild_signal_status_counts(cursor)
+            conn.commit()
+            repaired = True
+            logger.warning("[SIGNAL] Rebuilt signal_status_counts (%d statuses drifted)", len(mismatches))
+
+    return {'consistent': not mismatches, 'mismatches': mismatches, 'repaired': repaired}
 
 
 def get_owners() -> List[str]: